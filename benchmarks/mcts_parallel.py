@@ -0,0 +1,66 @@
+"""
+So sánh số playout/giây của MCTSBot: một luồng, song song gốc (tiến trình)
+và song song cây (thread + virtual loss).
+
+    python -m benchmarks.mcts_parallel --size 9 --time-ms 2000 --workers 4
+
+Lưu ý: chế độ "tree" dùng thread nên bị GIL giới hạn; nó chủ yếu có ích
+khi playout nhả GIL (NumPy / extension C), còn "root" tận dụng được nhiều lõi.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import List
+
+from core.board import Player
+from core.game import GameMode, GoGame
+from bots.mcts_bot import MCTSBot
+
+MODES = (None, "root", "tree")
+
+
+def run(size: int, time_ms: int, workers: int, seed: int) -> List[dict]:
+    game = GoGame(size, GameMode.HUMAN_VS_HUMAN)
+    legal = game.get_legal_moves(Player.BLACK)
+    rows = []
+    for mode in MODES:
+        bot = MCTSBot(
+            Player.BLACK, size, max_time_ms=time_ms, seed=seed,
+            parallel=mode, workers=workers,
+        )
+        if mode == "root":
+            # khởi động pool tiến trình trước, không tính vào thời gian đo
+            MCTSBot(Player.BLACK, size, playouts=workers, parallel=mode,
+                    workers=workers).select_move(game.board.copy(), legal)
+        bot.select_move(game.board.copy(), legal)
+        rows.append({
+            "mode": mode or "serial",
+            "playouts": bot.last_playouts,
+            "playouts_per_sec": bot.playouts_per_sec,
+        })
+    serial = rows[0]["playouts_per_sec"] or 1.0
+    for row in rows:
+        row["speedup"] = row["playouts_per_sec"] / serial
+    return rows
+
+
+def main(argv: List[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--time-ms", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{args.size}x{args.size}, {args.time_ms} ms/move, {args.workers} workers")
+    for row in run(args.size, args.time_ms, args.workers, args.seed):
+        print(
+            f"{row['mode']:>7}: {row['playouts']:>7} playouts  "
+            f"{row['playouts_per_sec']:>9.0f}/s  x{row['speedup']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Micro-benchmark của PlayoutBoard: số playout ngẫu nhiên mỗi giây theo kích thước bàn.
+
+    python -m benchmarks.playout_speed --sizes 9 13 19 --seconds 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List
+
+from core.playout import PlayoutBoard
+
+
+def run(size: int, seconds: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    empty = PlayoutBoard(size)
+    playouts = 0
+    moves = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        board = empty.copy()
+        moves += board.playout(1, rng)
+        board.winner(6.5)
+        playouts += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+    elapsed = now - start
+    return {
+        "size": size,
+        "playouts": playouts,
+        "playouts_per_sec": playouts / elapsed,
+        "moves_per_playout": moves / playouts,
+    }
+
+
+def main(argv: List[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 13, 17, 19])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        row = run(size, args.seconds, args.seed)
+        print(
+            f"{size:>2}x{size:<2}: {row['playouts_per_sec']:>8.0f} playouts/s  "
+            f"({row['playouts']} playouts, {row['moves_per_playout']:.0f} moves each)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Bộ benchmark core + bot trên các thế cờ cố định (sinh theo seed).
+
+    python -m benchmarks.suite                       # chạy, so với baseline.json
+    python -m benchmarks.suite --out result.json     # ghi kết quả JSON
+    python -m benchmarks.suite --save-baseline       # ghi đè baseline
+
+Mỗi phép đo lấy thời gian nhỏ nhất (µs / lần gọi) qua `--repeat` lần đo.
+Trước mỗi kích thước bàn chạy một vòng calibration (Python thuần); khi so
+với baseline, thời gian được chia cho calibration để bớt phụ thuộc vào tốc
+độ / tải của máy. Chậm hơn baseline quá `--tolerance` bị đánh dấu REGRESSION
+và lệnh trả về mã lỗi 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.board import Player
+from core.game import GameMode, GoGame
+from bots.minimax_bot import HeuristicMinimaxBot
+
+SIZES = (9, 13, 17, 19)
+DEPTHS = (1, 2, 3)
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Thế cờ đo = ván ngẫu nhiên dừng khi bàn có khoảng FILL_RATIO quân
+FILL_RATIO = 0.3
+# Số nước đặt thử trong một lần đo place_stone
+PLACE_SAMPLES = 64
+# Thời gian tối thiểu (giây) của một lần đo
+MIN_TIME = 0.05
+
+
+def make_position(size: int, seed: int, backend: str) -> GoGame:
+    """Ván cờ tới khoảng FILL_RATIO bàn bằng các nước hợp lệ ngẫu nhiên (theo seed)."""
+    rng = random.Random(seed * 1000 + size)
+    game = GoGame(size, GameMode.HUMAN_VS_HUMAN, board_backend=backend)
+    target = int(size * size * FILL_RATIO)
+    while len(game.history) - 1 < target and not game.is_over:
+        legal = game.get_legal_moves(game.current_player)
+        if not legal:
+            game.pass_turn()
+            continue
+        game.play_human_move(*rng.choice(legal))
+    return game
+
+
+def _best_of(repeat: int, call: Callable[[], object], min_time: float = MIN_TIME) -> float:
+    """
+    µs / lần gọi `call()`, nhỏ nhất qua `repeat` lần đo. Mỗi lần đo gọi lặp
+    đủ nhiều để kéo dài ít nhất `min_time` giây (giảm nhiễu với phép đo nhỏ).
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+def _calibration_work():
+    # vòng lặp Python thuần cố định: thước đo tốc độ máy tại thời điểm đo
+    total = 0
+    for i in range(2000):
+        total += i * i % 7
+    return total
+
+
+def calibrate(repeat: int) -> float:
+    return _best_of(repeat, _calibration_work)
+
+
+def bench_size(
+    size: int, seed: int, backend: str, repeat: int, depths: Tuple[int, ...]
+) -> Dict[str, float]:
+    game = make_position(size, seed, backend)
+    board = game.board
+    player = game.current_player
+    rng = random.Random(seed)
+    legal = game.get_legal_moves(player)
+    moves = [rng.choice(legal) for _ in range(PLACE_SAMPLES)] if legal else []
+    results: Dict[str, float] = {}
+
+    # place_stone cần một bàn mới cho mỗi nước: copy trước rồi chỉ đo phần đặt quân
+    if moves:
+        best = float("inf")
+        for _ in range(max(repeat, 5)):
+            boards = [board.copy() for _ in moves]
+            start = time.perf_counter()
+            for b, (x, y) in zip(boards, moves):
+                b.place_stone(player, x, y)
+            best = min(best, time.perf_counter() - start)
+        results["place_stone"] = best / len(moves) * 1e6
+
+    results["copy"] = _best_of(repeat, board.copy)
+
+    # xoá cache của GoGame để đo phần tính thật, không phải tra cache
+    def get_legal_moves():
+        game._legal_cache.clear()
+        game.get_legal_moves(player)
+    results["get_legal_moves"] = _best_of(repeat, get_legal_moves)
+
+    def compute_is_over():
+        game._legal_cache.clear()
+        game._compute_is_over()
+    results["compute_is_over"] = _best_of(repeat, compute_is_over)
+
+    results["score"] = _best_of(repeat, game.score)
+
+    for depth in depths:
+        def select_move():
+            # bot mới mỗi lần: bảng chuyển vị rỗng như lúc bắt đầu một nước
+            bot = HeuristicMinimaxBot(player, size, depth)
+            bot.select_move(board.copy(), game.get_legal_moves(player))
+        results[f"select_move_d{depth}"] = _best_of(repeat, select_move)
+
+    return results
+
+
+def run_suite(
+    sizes: Tuple[int, ...] = SIZES,
+    depths: Tuple[int, ...] = DEPTHS,
+    seed: int = 0,
+    backend: str = "grid",
+    repeat: int = 5,
+) -> Dict[str, object]:
+    results: Dict[str, float] = {}
+    calibration: Dict[str, float] = {}
+    for size in sizes:
+        # đo lại tốc độ máy trước mỗi kích thước (máy có tải khác có thể đổi theo thời gian)
+        calibration[str(size)] = calibrate(repeat)
+        for name, value in bench_size(size, seed, backend, repeat, depths).items():
+            results[f"{size}/{name}"] = value
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": seed,
+            "backend": backend,
+            "unit": "us_per_call",
+        },
+        "calibration": calibration,
+        "results": results,
+    }
+
+
+def normalized(report: Dict[str, object]) -> Dict[str, float]:
+    """Thời gian chia cho vòng calibration của cùng kích thước (so được giữa các máy)."""
+    calibration = report["calibration"]
+    return {
+        name: value / calibration[name.split("/", 1)[0]]
+        for name, value in report["results"].items()
+    }
+
+
+def compare(
+    current: Dict[str, float], baseline: Dict[str, float], tolerance: float
+) -> List[Tuple[str, Optional[float], str]]:
+    """(tên, tỉ lệ hiện tại / baseline, trạng thái) cho từng phép đo (giá trị đã chuẩn hoá)."""
+    rows = []
+    for name, value in current.items():
+        base = baseline.get(name)
+        ratio = value / base if base else None
+        if ratio is None:
+            status = "new"
+        elif ratio > 1 + tolerance:
+            status = "REGRESSION"
+        elif ratio < 1 - tolerance:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, ratio, status))
+    return rows
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--depths", type=int, nargs="+", default=list(DEPTHS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", default="grid")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", help="ghi kết quả JSON ra file")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="mức chậm hơn baseline cho phép (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = run_suite(tuple(args.sizes), tuple(args.depths), args.seed, args.backend, args.repeat)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+
+    baseline: Dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            stored = json.load(f)
+        if stored["meta"]["backend"] == args.backend and stored["meta"]["seed"] == args.seed:
+            baseline = normalized(stored)
+        else:
+            print("baseline uses another backend/seed: not compared")
+
+    regressions = 0
+    results = report["results"]
+    for name, ratio, status in compare(normalized(report), baseline, args.tolerance):
+        ratio_text = f"x{ratio:.2f}" if ratio is not None else "-"
+        print(f"{name:<22} {results[name]:12.1f} us  {ratio_text:>6}  {status}")
+        regressions += status == "REGRESSION"
+    if regressions:
+        print(f"{regressions} regression(s) over {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import List, Optional, Set, Tuple
+
+from core.board import Board, MoveRecord, Player
+
+
+class IncrementalEvaluator:
+    """
+    Điểm heuristic của `HeuristicMinimaxBot._evaluate`, cập nhật theo từng nước.
+
+    Giữ các bộ đếm theo màu (index 1 = đen, 2 = trắng):
+    - `stones`: số quân
+    - `territory`: số ô trống chỉ kề quân của đúng một màu
+    - `atari`: số nhóm chỉ còn 1 khí
+
+    Một nước tại p bắt các quân C chỉ có thể đổi các bộ đếm trong vùng
+    S = {p} ∪ láng giềng(p) ∪ C ∪ láng giềng(C): tính phần đóng góp của S
+    trước và sau nước đi rồi cộng chênh lệch. `undo` chỉ lấy lại bộ đếm cũ
+    từ stack, không duyệt lại gì.
+
+    Mọi nước đi trên bàn phải đi qua `play` / `undo` của evaluator.
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.stones = [0, 0, 0]
+        self.territory = [0, 0, 0]
+        self.atari = [0, 0, 0]
+        self._stack: List[Tuple[int, int, int, int, int, int]] = []
+
+        size = board.size
+        cells = [(x, y) for y in range(size) for x in range(size)]
+        for x, y in cells:
+            v = board.get(x, y)
+            if v:
+                self.stones[v] += 1
+        self._add_area(cells, 1)
+
+    # === Điểm (giống hệt công thức của `_evaluate`) ===
+
+    def score(self, max_player: Player) -> float:
+        me = max_player.value
+        opp = 3 - me
+        stone_diff = self.stones[me] - self.stones[opp]
+        territory_diff = self.territory[me] - self.territory[opp]
+        capture_bonus = 8 * self.atari[opp]
+        group_penalty = -8 * self.atari[me]
+        return (
+            1.5 * stone_diff
+            + 0.6 * territory_diff
+            + capture_bonus
+            + group_penalty
+        )
+
+    # === Make / unmake ===
+
+    def play(self, player: Player, x: int, y: int) -> Optional[MoveRecord]:
+        board = self.board
+        if not board.in_bounds(x, y) or board.get(x, y) != 0 or board.ko_point == (x, y):
+            return None
+
+        # Quân bị bắt = nhóm đối phương kề (x, y) mà khí duy nhất là (x, y)
+        opp = player.opposite.value
+        captured: Set[Tuple[int, int]] = set()
+        for nx, ny in board._neighbors(x, y):
+            if board.get(nx, ny) == opp and (nx, ny) not in captured:
+                group, liberties = board._group_and_liberties(nx, ny)
+                if len(liberties) == 1:
+                    captured |= group
+        area = self._affected_area(x, y, captured)
+
+        saved = (
+            self.stones[1], self.stones[2],
+            self.territory[1], self.territory[2],
+            self.atari[1], self.atari[2],
+        )
+        self._add_area(area, -1)
+        record = board.play(player, x, y)
+        if record is None:
+            self._restore(saved)
+            return None
+        self._add_area(area, 1)
+        self.stones[player.value] += 1
+        self.stones[opp] -= len(record.captured)
+        self._stack.append(saved)
+        return record
+
+    def undo(self, record: MoveRecord) -> None:
+        self.board.undo(record)
+        self._restore(self._stack.pop())
+
+    # === Nội bộ ===
+
+    def _restore(self, saved: Tuple[int, int, int, int, int, int]) -> None:
+        (
+            self.stones[1], self.stones[2],
+            self.territory[1], self.territory[2],
+            self.atari[1], self.atari[2],
+        ) = saved
+
+    def _affected_area(
+        self, x: int, y: int, captured: Set[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        neighbors = self.board._neighbors
+        area = {(x, y)}
+        area.update(neighbors(x, y))
+        for cx, cy in captured:
+            area.add((cx, cy))
+            area.update(neighbors(cx, cy))
+        return list(area)
+
+    def _add_area(self, area: List[Tuple[int, int]], sign: int) -> None:
+        """Cộng (sign = 1) / trừ (sign = -1) đóng góp lãnh thổ & atari của vùng `area`."""
+        board = self.board
+        get = board.get
+        neighbors = board._neighbors
+        territory = self.territory
+        atari = self.atari
+        seen: Set[Tuple[int, int]] = set()
+
+        for x, y in area:
+            v = get(x, y)
+            if v == 0:
+                # ô trống: lãnh thổ nếu chỉ kề quân của một màu
+                colors = 0
+                for nx, ny in neighbors(x, y):
+                    colors |= get(nx, ny)
+                if colors == 1 or colors == 2:
+                    territory[colors] += sign
+                continue
+            if (x, y) in seen:
+                continue
+            # nhóm chạm vùng: đếm đúng một lần
+            group, liberties = board._group_and_liberties(x, y)
+            seen |= group
+            if len(liberties) == 1:
+                atari[v] += sign
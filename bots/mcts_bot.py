@@ -0,0 +1,388 @@
+from __future__ import annotations
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Tuple
+from core.board import Board, Player
+from core.chain_board import ChainBoard
+from core.playout import PlayoutBoard
+from bots.process_pool import get_pool
+
+# Hằng số khám phá của UCT (sqrt(2) theo lý thuyết, nhỏ hơn một chút thì ổn định hơn)
+DEFAULT_UCT_C = 1.2
+# Ngân sách mặc định khi không truyền playouts / max_time_ms
+DEFAULT_PLAYOUTS = 2000
+# Thắng suất (của nước tốt nhất) dưới ngưỡng này thì xin thua
+RESIGN_WINRATE = 0.05
+# Chỉ xét xin thua khi gốc đã có đủ số playout
+RESIGN_MIN_VISITS = 500
+# Kiểu song song: None (một luồng), "root" (nhiều tiến trình), "tree" (nhiều thread)
+PARALLEL_MODES = (None, "root", "tree")
+# Số lượt thăm "giả thua" cộng vào đường đang được một thread khác mô phỏng
+DEFAULT_VIRTUAL_LOSS = 3
+
+
+def _root_parallel_worker(
+    board: Board,
+    legal_moves: List[Tuple[int, int]],
+    color: Player,
+    playouts: int | None,
+    max_time_ms: int | None,
+    uct_c: float,
+    komi: float,
+    seed: int,
+) -> Tuple[Dict[Tuple[int, int], Tuple[int, float]], int]:
+    """Chạy trong tiến trình con: một cây độc lập, trả về (visits, wins) các nước ở gốc."""
+    bot = MCTSBot(color, board.size, playouts, max_time_ms, uct_c, komi, seed)
+    deadline = None if max_time_ms is None else time.perf_counter() + max_time_ms / 1000.0
+    root = bot._prepare_root(board, legal_moves)
+    done = bot._search(root, board, bot.playouts, deadline)
+    return {m: (ch.visits, ch.wins) for m, ch in root.children.items()}, done
+
+
+class MCTSNode:
+    """Một node của cây: thế cờ sau khi `player` đánh `move`."""
+
+    __slots__ = (
+        "move", "parent", "player", "hash", "ko_point",
+        "children", "untried", "visits", "wins",
+    )
+
+    def __init__(
+        self,
+        move: Optional[Tuple[int, int]],
+        parent: Optional["MCTSNode"],
+        player: Player,
+        position_hash: int,
+        ko_point: Optional[Tuple[int, int]],
+    ):
+        self.move = move
+        self.parent = parent
+        self.player = player            # người vừa đánh để tới node này
+        self.hash = position_hash       # hash hình cờ (để dùng lại cây giữa các nước)
+        self.ko_point = ko_point
+        self.children: Dict[Tuple[int, int], MCTSNode] = {}
+        self.untried: Optional[List[Tuple[int, int]]] = None  # None = chưa mở rộng
+        self.visits = 0
+        self.wins = 0.0                 # số ván `player` thắng qua node này
+
+    def uct_child(self, c: float) -> "MCTSNode":
+        log_n = math.log(self.visits)
+        return max(
+            self.children.values(),
+            key=lambda ch: ch.wins / ch.visits + c * math.sqrt(log_n / ch.visits),
+        )
+
+
+class MCTSBot:
+    """
+    Bot UCT / Monte Carlo Tree Search với playout nhẹ (ngẫu nhiên, không tự lấp mắt).
+
+    - Cùng interface `select_move(board, legal_moves)` với HeuristicMinimaxBot.
+    - Ngân sách mỗi nước: `playouts` (số playout) và/hoặc `max_time_ms`.
+    - Giữ lại cây con sau khi đối thủ đáp (subtree reuse).
+    - `last_playouts`, `playouts_per_sec` cho biết tốc độ của lần tìm gần nhất.
+    - `parallel`:
+        + None: một cây, một luồng.
+        + "root": `workers` cây độc lập trên các tiến trình, cộng số lượt thăm
+          các nước ở gốc (không dùng lại cây giữa các nước).
+        + "tree": một cây chung cho `workers` thread, dùng virtual loss để các
+          thread không cùng đi một nhánh.
+    """
+
+    def __init__(
+        self,
+        color: Player,
+        board_size: int = 9,
+        playouts: int | None = None,
+        max_time_ms: int | None = None,
+        uct_c: float = DEFAULT_UCT_C,
+        komi: float = 6.5,
+        seed: int | None = None,
+        parallel: str | None = None,
+        workers: int | None = None,
+        virtual_loss: int = DEFAULT_VIRTUAL_LOSS,
+    ):
+        if playouts is not None and playouts <= 0:
+            raise ValueError("playouts must be positive.")
+        if parallel not in PARALLEL_MODES:
+            raise ValueError(f"Unknown parallel mode: {parallel!r}")
+        if virtual_loss < 1:
+            raise ValueError("virtual_loss must be at least 1.")
+        self.color = color
+        self.board_size = board_size
+        if playouts is None and max_time_ms is None:
+            playouts = DEFAULT_PLAYOUTS
+        self.playouts = playouts
+        self.max_time_ms = max_time_ms
+        self.uct_c = uct_c
+        self.komi = komi
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.parallel = parallel
+        self.workers = workers or os.cpu_count() or 1
+        self.virtual_loss = virtual_loss
+        # gốc của cây sau nước đi gần nhất của bot (để dùng lại ở lượt sau)
+        self._last_node: Optional[MCTSNode] = None
+        self.reused_visits = 0
+        self.last_playouts = 0
+        self.playouts_per_sec = 0.0
+        self._stop_requested = False
+
+    def request_stop(self):
+        self._stop_requested = True
+
+    def select_move(self, board: Board, legal_moves: List[Tuple[int, int]]):
+        self._stop_requested = False
+        if not legal_moves:
+            return None
+
+        # Playout cần đặt quân rất nhiều lần -> chạy trên ChainBoard (khí tăng dần)
+        board = ChainBoard.from_board(board)
+
+        # Chỉ còn nước tự lấp mắt -> pass (như chính sách playout)
+        allowed = set(legal_moves)
+        if not any(m in allowed for m in self._candidates(board, self.color)):
+            self._last_node = None
+            return None
+        start = time.perf_counter()
+        deadline = None if self.max_time_ms is None else start + self.max_time_ms / 1000.0
+
+        root = None
+        if self.parallel == "root":
+            self._last_node = None
+            stats, playouts = self._search_root_parallel(board, legal_moves)
+        else:
+            root = self._prepare_root(board, legal_moves)
+            if self.parallel == "tree":
+                playouts = self._search_tree_parallel(root, board, deadline)
+            else:
+                playouts = self._search(root, board, self.playouts, deadline)
+            stats = {m: (ch.visits, ch.wins) for m, ch in root.children.items()}
+
+        if self._stop_requested:
+            self._last_node = None
+            return None
+
+        elapsed = time.perf_counter() - start
+        self.last_playouts = playouts
+        self.playouts_per_sec = playouts / elapsed if elapsed > 0 else 0.0
+
+        if not stats:
+            self._last_node = None
+            return None
+
+        move = max(stats, key=lambda m: stats[m][0])
+        visits, wins = stats[move]
+        total = sum(v for v, _ in stats.values())
+        if total >= RESIGN_MIN_VISITS and wins / visits < RESIGN_WINRATE:
+            self._last_node = None
+            return "RESIGN"
+
+        if root is not None:
+            # bỏ các nhánh anh em để GC thu hồi, giữ cây con của nước được chọn
+            best = root.children[move]
+            best.parent = None
+            self._last_node = best
+        return move
+
+    # ======================
+    # CÂY (selection / expansion / backprop)
+    # ======================
+
+    def _prepare_root(self, board: Board, legal_moves: List[Tuple[int, int]]) -> MCTSNode:
+        root = None
+        last = self._last_node
+        if last is not None:
+            # cháu của gốc cũ = thế cờ sau nước bot + nước đáp của đối thủ
+            for child in last.children.values():
+                if child.hash == board.hash and child.ko_point == board.ko_point:
+                    root = child
+                    break
+        self._last_node = None
+
+        if root is None:
+            root = MCTSNode(None, None, self.color.opposite, board.hash, board.ko_point)
+        root.parent = None
+        self.reused_visits = root.visits
+
+        # Ở gốc chỉ xét nước GoGame cho là hợp lệ (đã tính superko)
+        allowed = set(legal_moves)
+        root.children = {m: ch for m, ch in root.children.items() if m in allowed}
+        if root.untried is None:
+            root.untried = self._candidates(board, self.color)
+        root.untried = [m for m in root.untried if m in allowed]
+        return root
+
+    def _search(
+        self,
+        root: MCTSNode,
+        board: Board,
+        playouts: int | None,
+        deadline: float | None,
+    ) -> int:
+        """Vòng MCTS một luồng; trả về số playout đã chạy."""
+        done = 0
+        rng = self.rng
+        while not self._stop_requested:
+            if playouts is not None and done >= playouts:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            search_board = board.copy()
+            node, player = self._descend(root, search_board, rng, 0)
+            self._backprop(node, self._rollout(search_board, player, rng), 0)
+            done += 1
+        return done
+
+    def _descend(
+        self, root: MCTSNode, board: Board, rng: random.Random, virtual_loss: int
+    ) -> Tuple[MCTSNode, Player]:
+        """
+        Selection + expansion trên `board` (bị sửa thành thế cờ của node trả về).
+        `virtual_loss` được cộng vào số lượt thăm của mọi node trên đường đi
+        (như thể đã thua) để thread khác tạm tránh nhánh này.
+        """
+        node = root
+        node.visits += virtual_loss
+        player = self.color
+        c = self.uct_c
+
+        # Selection: đi theo UCT khi node đã mở rộng hết
+        while node.untried is not None and not node.untried and node.children:
+            node = node.uct_child(c)
+            node.visits += virtual_loss
+            board.play(node.player, *node.move)
+            player = node.player.opposite
+
+        # Expansion: thêm một con chưa thử
+        if node.untried is None:
+            node.untried = self._candidates(board, player)
+        untried = node.untried
+        while untried:
+            i = rng.randrange(len(untried))
+            move = untried[i]
+            untried[i] = untried[-1]
+            untried.pop()
+            if board.play(player, *move) is None:
+                continue
+            child = MCTSNode(move, node, player, board.hash, board.ko_point)
+            child.visits = virtual_loss
+            node.children[move] = child
+            node = child
+            player = player.opposite
+            break
+
+        return node, player
+
+    @staticmethod
+    def _backprop(node: Optional[MCTSNode], winner: Player, virtual_loss: int):
+        while node is not None:
+            node.visits += 1 - virtual_loss
+            if node.player is winner:
+                node.wins += 1
+            node = node.parent
+
+    # ======================
+    # SONG SONG (root / tree)
+    # ======================
+
+    def _search_root_parallel(self, board: Board, legal_moves: List[Tuple[int, int]]):
+        """Mỗi tiến trình một cây riêng; cộng (visits, wins) của các nước ở gốc."""
+        workers = self.workers
+        share = None
+        if self.playouts is not None:
+            share = -(-self.playouts // workers)  # chia đều, làm tròn lên
+        base_seed = self.seed if self.seed is not None else self.rng.getrandbits(32)
+        pool = get_pool(workers)
+        futures = [
+            pool.submit(
+                _root_parallel_worker,
+                board, legal_moves, self.color, share, self.max_time_ms,
+                self.uct_c, self.komi, base_seed + i,
+            )
+            for i in range(workers)
+        ]
+
+        # Chờ theo từng đợt ngắn để vẫn phản hồi được request_stop()
+        pending = set(futures)
+        while pending:
+            if self._stop_requested:
+                for future in pending:
+                    future.cancel()
+                return {}, 0
+            _, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+
+        merged: Dict[Tuple[int, int], Tuple[int, float]] = {}
+        playouts = 0
+        for future in futures:
+            stats, done = future.result()
+            playouts += done
+            for move, (visits, wins) in stats.items():
+                old_visits, old_wins = merged.get(move, (0, 0.0))
+                merged[move] = (old_visits + visits, old_wins + wins)
+        return merged, playouts
+
+    def _search_tree_parallel(self, root: MCTSNode, board: Board, deadline: float | None) -> int:
+        """Một cây chung cho nhiều thread; selection/backprop giữ lock, playout thì không."""
+        lock = threading.Lock()
+        virtual_loss = self.virtual_loss
+        playouts = self.playouts
+        issued = 0
+        done = 0
+
+        def worker(seed: int):
+            nonlocal issued, done
+            rng = random.Random(seed)
+            while True:
+                with lock:
+                    if self._stop_requested:
+                        return
+                    if playouts is not None and issued >= playouts:
+                        return
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        return
+                    issued += 1
+                    search_board = board.copy()
+                    node, player = self._descend(root, search_board, rng, virtual_loss)
+                winner = self._rollout(search_board, player, rng)
+                with lock:
+                    self._backprop(node, winner, virtual_loss)
+                    done += 1
+
+        seeds = [self.rng.getrandbits(32) for _ in range(self.workers)]
+        threads = [threading.Thread(target=worker, args=(seed,), daemon=True) for seed in seeds]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return done
+
+    # ======================
+    # PLAYOUT NHẸ
+    # ======================
+
+    def _candidates(self, board: Board, player: Player) -> List[Tuple[int, int]]:
+        color = player.value
+        return [
+            (x, y) for (x, y) in board.legal_moves(player)
+            if not self._is_own_eye(board, x, y, color)
+        ]
+
+    @staticmethod
+    def _is_own_eye(board: Board, x: int, y: int, color: int) -> bool:
+        for nx, ny in board._neighbors(x, y):
+            if board.get(nx, ny) != color:
+                return False
+        return True
+
+    def _rollout(self, board: Board, player: Player, rng: random.Random) -> Player:
+        """Đánh ngẫu nhiên tới khi cả hai pass liên tiếp, trả về người thắng."""
+        # playout chạy trên PlayoutBoard (union-find + danh sách ô trống O(1))
+        playout = PlayoutBoard.from_board(board)
+        playout.playout(player.value, rng)
+        # tính điểm khu vực: quân + ô trống chỉ kề một màu (+ komi cho Trắng)
+        return playout.winner(self.komi)
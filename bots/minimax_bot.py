@@ -1,55 +1,286 @@
 from __future__ import annotations
 import math
 import random
-from typing import List, Tuple
+import time
+from typing import Dict, List, Tuple
 from core.board import Board, Player
+from core import np_kernels
+from bots.incremental_eval import IncrementalEvaluator
+from bots.search_stats import SearchStats
+from bots.transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+# Hai điểm số lệch nhau không quá SCORE_EPS được coi là bằng nhau (chọn ngẫu nhiên)
+SCORE_EPS = 1e-6
+
+# Chế độ giới hạn thời gian: số node giữa hai lần xem đồng hồ, và độ sâu tối đa
+TIME_CHECK_INTERVAL = 256
+MAX_ITERATIVE_DEPTH = 64
+
+# Số killer move giữ lại cho mỗi ply
+KILLERS_PER_PLY = 2
+
+# Độ rộng tập ứng viên (beam) mỗi node: 15 ở chế độ độ sâu cố định; khi có
+# max_time_ms thì co giãn theo thời gian & kích thước bàn trong [MIN, MAX]
+BASE_BEAM_WIDTH = 15
+MIN_BEAM_WIDTH = 6
+MAX_BEAM_WIDTH = 30
+# Ít hơn số nước sát quân mình này thì xét thêm các ô khác
+MIN_NEAR_CANDIDATES = 12
+
+# Bảng ưu tiên vị trí theo kích thước: (prior[y][x], các điểm xếp theo prior giảm dần)
+_PRIOR_TABLES: Dict[int, Tuple[List[List[float]], List[Tuple[int, int]]]] = {}
+
+
+def prior_table(size: int) -> Tuple[List[List[float]], List[Tuple[int, int]]]:
+    """
+    Ưu tiên trung tâm nhẹ, thang -4..4 cho mọi kích thước (9x9: đúng 4 - |4-x| - |4-y|).
+    """
+    table = _PRIOR_TABLES.get(size)
+    if table is None:
+        c = (size - 1) / 2
+        prior = [
+            [4 * (c - abs(c - x) - abs(c - y)) / c for x in range(size)]
+            for y in range(size)
+        ]
+        by_prior = sorted(
+            ((x, y) for y in range(size) for x in range(size)),
+            key=lambda p: -prior[p[1]][p[0]],
+        )
+        table = (prior, by_prior)
+        _PRIOR_TABLES[size] = table
+    return table
+
+
+class SearchAborted(Exception):
+    """Tìm kiếm bị dừng giữa chừng (request_stop từ thread khác)."""
+
+
+class SearchTimeout(SearchAborted):
+    """Hết thời gian cho nước đi (chế độ max_time_ms)."""
 
 
 class HeuristicMinimaxBot:
-    def __init__(self, color: Player, board_size: int = 9, depth: int | None = None):
+    def __init__(
+        self,
+        color: Player,
+        board_size: int = 9,
+        depth: int | None = None,
+        max_time_ms: int | None = None,
+        max_depth: int | None = None,
+        beam_width: int | None = None,
+        tt_mb: float | None = 16,
+        incremental_eval: bool = True,
+        use_numpy: bool = False,
+        batch_eval: bool = False,
+        stats_log: str | None = None,
+        seed: int | None = None,
+    ):
         self.color = color
         self.board_size = board_size
         self.depth = depth if depth is not None else 2
         self.resign_threshold = -30.0
+        # chọn ngẫu nhiên giữa các nước bằng điểm; `seed` -> lặp lại được
+        self.rng = random.Random(seed)
+        # max_time_ms: iterative deepening 1, 2, 3... tới khi hết giờ, trả về nước
+        # tốt nhất của độ sâu cuối cùng tìm XONG (bỏ qua `depth`, giới hạn bởi max_depth)
+        self.max_time_ms = max_time_ms
+        self.max_depth = max_depth if max_depth is not None else MAX_ITERATIVE_DEPTH
+        # beam_width: số nước ứng viên mỗi node (None = tự chọn, xem `_beam_width`)
+        self.beam_width = beam_width
+        self.last_depth = 0  # độ sâu hoàn tất của lần select_move gần nhất
+        # bảng chuyển vị (None = tắt), giữ lại giữa các nước đi
+        self.tt = TranspositionTable(tt_mb) if tt_mb else None
+        # incremental_eval=True: điểm lá cập nhật theo từng nước (IncrementalEvaluator)
+        # thay vì quét lại cả bàn trong `_evaluate`; kết quả giống hệt
+        self.incremental_eval = incremental_eval
+        self._evaluator: IncrementalEvaluator | None = None
+        # use_numpy=True: `_evaluate` chạy bằng kernel NumPy (nếu đã cài NumPy)
+        self.use_numpy = use_numpy and np_kernels.HAS_NUMPY
+        # batch_eval=True: ở ply cuối, chấm điểm mọi nước con trong MỘT lần gọi
+        # np_kernels.evaluate_batch thay vì từng lá một (cần NumPy)
+        self.batch_eval = batch_eval and np_kernels.HAS_NUMPY
+        # Sắp xếp nước động: killer moves theo ply & bảng history theo màu,
+        # làm mới mỗi lần select_move
+        self._killers: Dict[int, List[Tuple[int, int]]] = {}
+        self._history: Dict[int, Dict[Tuple[int, int], int]] = {1: {}, 2: {}}
+        self._root_depth = 0
+        # cờ dừng sớm, được BotWorker bật khi lượt tìm kiếm bị huỷ
+        self._stop_requested = False
+        self._deadline: float | None = None
+        self._node_count = 0
+        # Thống kê tìm kiếm: `last_stats` của lượt gần nhất; nếu có `stats_log`
+        # thì mỗi lượt ghi thêm một dòng JSON vào file đó
+        self.stats_log = stats_log
+        self.last_stats = SearchStats()
+        self._stats = SearchStats()
+
+    def request_stop(self):
+        self._stop_requested = True
 
     def select_move(self, board: Board, legal_moves: List[Tuple[int, int]]) -> Tuple[int, int] | None:
+        self._stop_requested = False
+        self._killers = {}
+        self._history = {1: {}, 2: {}}
         if not legal_moves:
             return None
+        self._stats = SearchStats()
+        start = time.perf_counter()
+        try:
+            move = self._search_root(board, legal_moves)
+        except SearchAborted:
+            return None
+        self._finish_stats(start, move)
+        return move
+
+    def _finish_stats(self, start: float, move):
+        stats = self._stats
+        stats.time = time.perf_counter() - start
+        stats.depth = self.last_depth
+        self.last_stats = stats
+        if self.stats_log:
+            stats.write_json_line(self.stats_log, {
+                "color": self.color.name,
+                "board_size": self.board_size,
+                "move": move,
+            })
+
+    def _search_root(self, board: Board, legal_moves: List[Tuple[int, int]]):
+        if self.max_time_ms is None:
+            best_score, best_moves = self._search_depth(board, legal_moves, self.depth)
+            self.last_depth = self.depth
+        else:
+            best_score, best_moves = self._search_iterative(board, legal_moves)
+
+        # return random.choice(best_moves) if best_moves else None
+        if not best_moves:
+            return None
+
+        # Nếu thế cờ quá tệ thì resign
+        if best_score < self.resign_threshold:
+            return "RESIGN"
+
+        return self.rng.choice(best_moves)
+
+    def _search_depth(self, board: Board, legal_moves: List[Tuple[int, int]], depth: int):
+        # Cả cây tìm kiếm đi trên MỘT bàn cờ: play() rồi undo(), không copy mỗi node
+        board = board.copy()
+        self._attach_evaluator(board)
+        self._root_depth = depth
+        self._stats.nodes += 1  # gốc
+        return self._search_root_serial(board, legal_moves, depth)
+
+    # ======================
+    # ITERATIVE DEEPENING (giới hạn thời gian)
+    # ======================
 
+    def _search_iterative(self, board: Board, legal_moves: List[Tuple[int, int]]):
+        start = time.perf_counter()
+        self.last_depth = 0
+
+        # Độ sâu 1 luôn chạy trọn (rẻ) để chắc chắn có nước đi
+        best_score, best_moves = self._search_depth(board, legal_moves, 1)
+        self.last_depth = 1
+
+        # Số nước trống giới hạn độ sâu có ý nghĩa
+        empties = sum(
+            1 for y in range(board.size) for x in range(board.size) if board.get(x, y) == 0
+        )
+        max_depth = min(self.max_depth, empties)
+
+        self._deadline = start + self.max_time_ms / 1000.0
+        try:
+            depth = 2
+            while depth <= max_depth and time.perf_counter() < self._deadline:
+                # nước tốt nhất của vòng trước được tìm trước -> alpha tốt hơn
+                ordered = best_moves + [m for m in legal_moves if m not in best_moves]
+                try:
+                    result = self._search_depth(board, ordered, depth)
+                except SearchTimeout:
+                    break
+                best_score, best_moves = result
+                self.last_depth = depth
+                depth += 1
+        finally:
+            self._deadline = None
+
+        return best_score, best_moves
+
+    # ======================
+    # MAKE / UNMAKE (qua IncrementalEvaluator nếu bật)
+    # ======================
+
+    def _attach_evaluator(self, board: Board):
+        self._evaluator = IncrementalEvaluator(board) if self.incremental_eval else None
+
+    def _play(self, board: Board, player: Player, x: int, y: int):
+        if self._evaluator is not None:
+            return self._evaluator.play(player, x, y)
+        return board.play(player, x, y)
+
+    def _undo(self, board: Board, record):
+        if self._evaluator is not None:
+            self._evaluator.undo(record)
+        else:
+            board.undo(record)
+
+    def _leaf_value(self, board: Board, max_player: Player) -> float:
+        if self._evaluator is not None:
+            return self._evaluator.score(max_player)
+        return self._evaluate(board, max_player)
+
+    def _check_time(self):
+        self._node_count += 1
+        if (
+            self._deadline is not None
+            and self._node_count % TIME_CHECK_INTERVAL == 0
+            and time.perf_counter() > self._deadline
+        ):
+            raise SearchTimeout()
+
+    # ======================
+    # ROOT SEARCH
+    # ======================
+    #
+    # Ở gốc, mỗi nước con được tìm với alpha = best_score - 2 * SCORE_EPS:
+    # nước nào có điểm thật > alpha thì nhận điểm chính xác; nước tệ hơn chỉ trả
+    # về cận trên <= alpha, không bao giờ lọt vào best_moves. Vì vậy tập
+    # best_moves giống hệt tìm kiếm với alpha = -inf, nhưng cắt tỉa nhiều hơn.
+
+    @staticmethod
+    def _update_best(best_score: float, best_moves: List[Tuple[int, int]], move, score: float):
+        if score > best_score + SCORE_EPS:
+            return score, [move]
+        if abs(score - best_score) <= SCORE_EPS:
+            best_moves.append(move)
+        return best_score, best_moves
+
+    @staticmethod
+    def _root_alpha(best_score: float) -> float:
+        return best_score - 2 * SCORE_EPS
+
+
+    def _search_root_serial(self, board: Board, legal_moves: List[Tuple[int, int]], depth: int):
         best_score = -math.inf
         best_moves: List[Tuple[int, int]] = []
 
         for (x, y) in legal_moves:
-            child = board.copy()
-            success, _ = child.place_stone(self.color, x, y)
-            if not success:
+            record = self._play(board, self.color, x, y)
+            if record is None:
                 continue
 
             score = self._minimax(
-                child,
-                self.depth - 1,
+                board,
+                depth - 1,
                 maximizing=False,
                 max_player=self.color,
-                alpha=-math.inf,
+                alpha=self._root_alpha(best_score),
                 beta=math.inf,
             )
+            self._undo(board, record)
 
-            if score > best_score + 1e-6:
-                best_score = score
-                best_moves = [(x, y)]
-            elif abs(score - best_score) <= 1e-6:
-                best_moves.append((x, y))
-
-        # return random.choice(best_moves) if best_moves else None
-        if not best_moves:
-            return None
-
-        # Nếu thế cờ quá tệ thì resign
-        if best_score < self.resign_threshold:
-            return "RESIGN"
-
-        return random.choice(best_moves)
+            best_score, best_moves = self._update_best(best_score, best_moves, (x, y), score)
 
+        return best_score, best_moves
 
     # ======================
     # MINIMAX + ALPHA-BETA
@@ -64,108 +295,303 @@ class HeuristicMinimaxBot:
         alpha: float,
         beta: float,
     ) -> float:
+        if self._stop_requested:
+            raise SearchAborted()
+        self._check_time()
+        stats = self._stats
+        stats.nodes += 1
 
         current_player = max_player if maximizing else max_player.opposite
+
+        # Bảng chuyển vị: chỉ dùng lại giá trị tính ở CÙNG độ sâu còn lại, nên
+        # kết quả giống hệt khi không có bảng (chỉ nhanh hơn)
+        tt = self.tt
+        tt_move = None
+        if tt is not None:
+            key = tt.key(board, current_player)
+            entry = tt.probe(key)
+            if entry is not None:
+                _, tt_depth, tt_value, tt_flag, tt_move = entry
+                if tt_depth == depth and (
+                    tt_flag == EXACT
+                    or (tt_flag == LOWER and tt_value >= beta)
+                    or (tt_flag == UPPER and tt_value <= alpha)
+                ):
+                    tt.cutoffs += 1
+                    stats.tt_cutoffs += 1
+                    return tt_value
+
+        started = time.perf_counter()
         legal_moves = self._generate_legal_moves(board, current_player)
+        generated = time.perf_counter()
+        stats.movegen_time += generated - started
 
         if depth == 0 or not legal_moves:
-            return self._evaluate(board, max_player)
+            value = self._leaf_value(board, max_player)
+            stats.eval_time += time.perf_counter() - generated
+            stats.leaves += 1
+            if tt is not None:
+                tt.store(key, depth, value, EXACT, None)
+            return value
+
+        # TT move -> killer -> history: nước hay gây cắt tỉa được thử trước
+        ply = self._root_depth - depth
+        started = time.perf_counter()
+        legal_moves = self._order_moves(legal_moves, current_player, ply, tt_move)
+        stats.movegen_time += time.perf_counter() - started
+
+        alpha_orig, beta_orig = alpha, beta
+        best_move = None
+
+        # Ply cuối: điểm các lá tính trước theo lô, vòng lặp dưới chỉ đọc lại
+        # (vẫn đi đúng thứ tự & cắt tỉa như khi gọi đệ quy -> cùng giá trị)
+        leaf_scores = None
+        if depth == 1 and self.batch_eval:
+            started = time.perf_counter()
+            leaf_scores = self._batch_leaf_scores(board, current_player, legal_moves, max_player)
+            stats.eval_time += time.perf_counter() - started
+            stats.leaves += len(leaf_scores)
 
         if maximizing:
             value = -math.inf
             for (x, y) in legal_moves:
-                child = board.copy()
-                success, _ = child.place_stone(current_player, x, y)
-                if not success:
-                    continue
+                if leaf_scores is not None:
+                    score = leaf_scores.get((x, y))
+                    if score is None:
+                        continue
+                else:
+                    record = self._play(board, current_player, x, y)
+                    if record is None:
+                        continue
 
-                value = max(
-                    value,
-                    self._minimax(
-                        child,
+                    score = self._minimax(
+                        board,
                         depth - 1,
                         False,
                         max_player,
                         alpha,
                         beta,
-                    ),
-                )
+                    )
+                    self._undo(board, record)
+                if score > value:
+                    value, best_move = score, (x, y)
                 alpha = max(alpha, value)
                 if beta <= alpha:
+                    self._record_cutoff(current_player, ply, depth, (x, y))
                     break
-            return value
 
         else:
             value = math.inf
             for (x, y) in legal_moves:
-                child = board.copy()
-                success, _ = child.place_stone(current_player, x, y)
-                if not success:
-                    continue
+                if leaf_scores is not None:
+                    score = leaf_scores.get((x, y))
+                    if score is None:
+                        continue
+                else:
+                    record = self._play(board, current_player, x, y)
+                    if record is None:
+                        continue
 
-                value = min(
-                    value,
-                    self._minimax(
-                        child,
+                    score = self._minimax(
+                        board,
                         depth - 1,
                         True,
                         max_player,
                         alpha,
                         beta,
-                    ),
-                )
+                    )
+                    self._undo(board, record)
+                if score < value:
+                    value, best_move = score, (x, y)
                 beta = min(beta, value)
                 if beta <= alpha:
+                    self._record_cutoff(current_player, ply, depth, (x, y))
                     break
-            return value
+
+        if tt is not None:
+            if value <= alpha_orig:
+                flag = UPPER
+            elif value >= beta_orig:
+                flag = LOWER
+            else:
+                flag = EXACT
+            tt.store(key, depth, value, flag, best_move)
+        return value
+
+    def _batch_leaf_scores(
+        self,
+        board: Board,
+        player: Player,
+        legal_moves: List[Tuple[int, int]],
+        max_player: Player,
+    ) -> Dict[Tuple[int, int], float]:
+        """Điểm (theo `max_player`) của mọi nước con hợp lệ, chấm một lần trên mảng (K, N, N)."""
+        children = []
+        for (x, y) in legal_moves:
+            # chỉ cần biết nước có hợp lệ & bắt quân nào; bàn được trả lại ngay
+            record = board.play(player, x, y)
+            if record is None:
+                continue
+            board.undo(record)
+            children.append((x, y, record.captured))
+        if not children:
+            return {}
+
+        stack = np_kernels.stack_children(np_kernels.board_array(board), player.value, children)
+        scores = np_kernels.evaluate_batch(stack, max_player.value)
+        return {(x, y): score for (x, y, _), score in zip(children, scores)}
 
     # ======================
     # MOVE GENERATION
     # ======================
 
+    def _beam_width(self, size: int) -> int:
+        if self.beam_width is not None:
+            return self.beam_width
+        if self.max_time_ms is None:
+            return BASE_BEAM_WIDTH
+        # nhiều thời gian -> rộng hơn; bàn lớn (mỗi node đắt hơn ~ size^2) -> hẹp hơn
+        width = BASE_BEAM_WIDTH * math.sqrt(self.max_time_ms / 1000.0) * 9 / size
+        return max(MIN_BEAM_WIDTH, min(MAX_BEAM_WIDTH, round(width)))
+
     def _generate_legal_moves(self, board: Board, player: Player) -> List[Tuple[int, int]]:
         size = board.size
+        grid = board.rows()  # đọc thẳng từng hàng, không copy (mọi kiểu bàn)
+        neighbor_rows = board._neighbor_rows
+        me = player.value
+        opp = player.opposite.value
+        prior, by_prior = prior_table(size)
+        width = self._beam_width(size)
         moves = []
 
         for y in range(size):
+            row = grid[y]
             for x in range(size):
-                if board.get(x, y) != 0:
+                if row[x] != 0:
                     continue
 
                 # ưu tiên ô gần quân mình
-                for nx, ny in board._neighbors(x, y):
-                    if board.get(nx, ny) == player.value:
+                for nx, ny in neighbor_rows[y][x]:
+                    if grid[ny][nx] == me:
                         moves.append((x, y))
                         break
 
-        if len(moves) < 12:
-            moves = [(x, y) for y in range(size) for x in range(size) if board.get(x, y) == 0]
+        if len(moves) < MIN_NEAR_CANDIDATES:
+            moves = self._fallback_candidates(grid, neighbor_rows, by_prior, prior, width)
+
+        # Số khí nhóm đối phương: flood một lần cho mỗi nhóm, mọi quân của nhóm
+        # dùng lại kết quả (thay vì flood lại cho từng ô ứng viên)
+        liberty_cache: Dict[Tuple[int, int], int] = {}
+
+        def enemy_liberties(x, y):
+            libs = liberty_cache.get((x, y))
+            if libs is None:
+                group, liberties = board._group_and_liberties(x, y)
+                libs = len(liberties)
+                for stone in group:
+                    liberty_cache[stone] = libs
+            return libs
 
         def move_priority(move):
             x, y = move
             score = 0
 
             # Ưu tiên ăn quân / gây atari
-            for nx, ny in board._neighbors(x, y):
-                if board.get(nx, ny) == player.opposite.value:
-                    libs = self._group_liberty(board, nx, ny)
+            for nx, ny in neighbor_rows[y][x]:
+                if grid[ny][nx] == opp:
+                    libs = enemy_liberties(nx, ny)
                     if libs == 1:
                         score += 100
                     elif libs == 2:
                         score += 20
 
-            # Ưu tiên trung tâm nhẹ
-            score += 4 - abs(4 - x) - abs(4 - y)
+            # Ưu tiên trung tâm nhẹ (bảng tính sẵn theo kích thước)
+            score += prior[y][x]
             return -score
 
         moves.sort(key=move_priority)
-        return moves[:15]
+        return moves[:width]
+
+    @staticmethod
+    def _fallback_candidates(grid, neighbor_rows, by_prior, prior, width) -> List[Tuple[int, int]]:
+        """
+        Ô trống sát một quân bất kỳ + các ô prior cao nhất (đủ `width` ô, lấy
+        trọn các ô cùng mức prior). Ô bị bỏ không kề quân nào nên điểm = prior,
+        thấp hơn hẳn >= width ô đã chọn -> top `width` giống hệt khi xét mọi ô trống,
+        nhưng không phải chấm điểm cả bàn (quan trọng với 19x19).
+        """
+        chosen = set()
+        last_prior = None
+        for x, y in by_prior:
+            if grid[y][x] != 0:
+                continue
+            p = prior[y][x]
+            if len(chosen) >= width and p < last_prior:
+                break
+            chosen.add((x, y))
+            last_prior = p
+
+        for y, row in enumerate(grid):
+            for x, v in enumerate(row):
+                if v != 0:
+                    continue
+                if (x, y) not in chosen:
+                    for nx, ny in neighbor_rows[y][x]:
+                        if grid[ny][nx] != 0:
+                            chosen.add((x, y))
+                            break
+
+        # thứ tự quét hàng/cột như trước để sort ổn định chọn giống hệt khi hoà điểm
+        return sorted(chosen, key=lambda p: (p[1], p[0]))
+
+    # ======================
+    # MOVE ORDERING (killer / history)
+    # ======================
+    #
+    # Chỉ đổi THỨ TỰ trong tập ứng viên của `_generate_legal_moves`, không đổi
+    # tập nước được xét -> giá trị minimax giữ nguyên, chỉ cắt tỉa được nhiều hơn.
+
+    def _order_moves(
+        self,
+        moves: List[Tuple[int, int]],
+        player: Player,
+        ply: int,
+        tt_move: Tuple[int, int] | None,
+    ) -> List[Tuple[int, int]]:
+        history = self._history[player.value]
+        if history:
+            # sort ổn định: cùng điểm history thì giữ thứ tự tĩnh
+            moves = sorted(moves, key=lambda m: -history.get(m, 0))
+
+        front: List[Tuple[int, int]] = []
+        if tt_move is not None and tt_move in moves:
+            front.append(tt_move)
+        for killer in self._killers.get(ply, ()):
+            if killer in moves and killer not in front:
+                front.append(killer)
+        if front:
+            moves = front + [m for m in moves if m not in front]
+        return moves
+
+    def _record_cutoff(self, player: Player, ply: int, depth: int, move: Tuple[int, int]):
+        self._stats.cutoffs += 1
+        # killer: giữ 2 nước gây cắt tỉa gần nhất ở mỗi ply
+        killers = self._killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[KILLERS_PER_PLY:]
+        # history: cắt tỉa càng gần gốc càng được cộng nhiều
+        history = self._history[player.value]
+        history[move] = history.get(move, 0) + depth * depth
 
     # ======================
     # HEURISTIC EVALUATION
     # ======================
 
     def _evaluate(self, board: Board, max_player: Player) -> float:
+        if self.use_numpy:
+            return np_kernels.evaluate(np_kernels.board_array(board), max_player.value)
+
         size = board.size
         opp = max_player.opposite
 
@@ -222,27 +648,7 @@ class HeuristicMinimaxBot:
     # GROUP / LIBERTY UTILS
     # ======================
 
-    def _group_liberty(self, board: Board, x: int, y: int) -> int:
-        libs, _ = self._group_liberty_and_group(board, x, y)
-        return libs
-
     def _group_liberty_and_group(self, board: Board, x: int, y: int):
-        color = board.get(x, y)
-        stack = [(x, y)]
-        visited = set()
-        liberties = set()
-
-        while stack:
-            cx, cy = stack.pop()
-            if (cx, cy) in visited:
-                continue
-            visited.add((cx, cy))
-
-            for nx, ny in board._neighbors(cx, cy):
-                v = board.get(nx, ny)
-                if v == 0:
-                    liberties.add((nx, ny))
-                elif v == color:
-                    stack.append((nx, ny))
-
-        return len(liberties), visited
+        # dùng flood fill của chính bàn cờ (FlatBoard/ChainBoard có bản nhanh hơn)
+        group, liberties = board._group_and_liberties(x, y)
+        return len(liberties), group
@@ -0,0 +1,18 @@
+from __future__ import annotations
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+# Pool tiến trình dùng chung cho các bot, tạo lần đầu khi cần (key = số worker)
+_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    pool = _POOLS.get(workers)
+    if pool is None:
+        # "spawn": an toàn khi gọi từ thread của BotWorker (không fork tiến trình pygame)
+        pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _POOLS[workers] = pool
+    return pool
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class SearchStats:
+    """
+    Thống kê của MỘT lần `select_move` (cộng dồn qua mọi độ sâu của iterative
+    deepening).
+
+    - `nodes`: số lần gọi `_minimax` (+1 cho gốc mỗi độ sâu)
+    - `leaves`: số thế cờ được chấm điểm
+    - `cutoffs`: số lần cắt alpha-beta; `tt_cutoffs`: số node trả về ngay từ TT
+    - `movegen_time` / `eval_time`: giây trong sinh + sắp xếp nước / chấm điểm lá
+      (với incremental_eval, phần cập nhật điểm nằm trong play/undo nên không
+      tính vào `eval_time`)
+    - `depth`: độ sâu hoàn tất, `time`: tổng thời gian của lượt
+    """
+
+    nodes: int = 0
+    leaves: int = 0
+    cutoffs: int = 0
+    tt_cutoffs: int = 0
+    movegen_time: float = 0.0
+    eval_time: float = 0.0
+    time: float = 0.0
+    depth: int = 0
+
+    @property
+    def nodes_per_sec(self) -> float:
+        return self.nodes / self.time if self.time > 0 else 0.0
+
+    @property
+    def ebf(self) -> float:
+        """Effective branching factor: b sao cho b^depth = số node."""
+        if self.depth <= 0 or self.nodes <= 1:
+            return 0.0
+        return self.nodes ** (1.0 / self.depth)
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["nodes_per_sec"] = self.nodes_per_sec
+        data["ebf"] = self.ebf
+        return data
+
+    def write_json_line(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Ghi thêm một dòng JSON (JSON lines) vào `path`."""
+        data = self.as_dict()
+        if extra:
+            data.update(extra)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(data) + "\n")
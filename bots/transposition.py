@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+from core.board import Board, Player
+
+# Loại cận của giá trị lưu trong bảng
+EXACT = 0
+LOWER = 1  # giá trị thật >= value (đã cắt beta)
+UPPER = 2  # giá trị thật <= value (không nước nào vượt alpha)
+
+# Ước lượng bộ nhớ cho một entry (tuple 5 phần tử + key int + float) trên CPython
+ENTRY_BYTES = 160
+
+# Entry: (key, depth, value, flag, best_move)
+Entry = Tuple[int, int, float, int, Optional[Tuple[int, int]]]
+
+# Khoá phụ cho người đi & điểm ko (độc lập với bảng Zobrist của bàn cờ để
+# "ô ko tại (x, y)" không trùng khoá với "quân đen tại (x, y)")
+_SIDE_KEYS: Dict[int, Tuple[int, int, int]] = {}
+_KO_KEYS: Dict[int, List[List[int]]] = {}
+
+
+def _extra_keys(size: int) -> Tuple[Tuple[int, int, int], List[List[int]]]:
+    side = _SIDE_KEYS.get(size)
+    if side is None:
+        rng = random.Random(0x77A5 << 8 | size)
+        side = (0, rng.getrandbits(64), rng.getrandbits(64))
+        _SIDE_KEYS[size] = side
+        _KO_KEYS[size] = [[rng.getrandbits(64) for _ in range(size)] for _ in range(size)]
+    return side, _KO_KEYS[size]
+
+
+class TranspositionTable:
+    """
+    Bảng chuyển vị có giới hạn bộ nhớ cho minimax.
+
+    - Khoá = hash hình cờ ^ khoá người đi ^ khoá điểm ko (64-bit).
+    - Mỗi bucket có 2 ô: ô "depth-preferred" chỉ bị ghi đè bởi entry có độ
+      sâu >= entry cũ, ô "always-replace" nhận mọi entry còn lại.
+    - `max_mb` giới hạn số bucket (làm tròn xuống luỹ thừa của 2).
+    - Đếm probes / hits / cutoffs / stores để xem hit rate.
+    """
+
+    def __init__(self, max_mb: float = 16):
+        if max_mb <= 0:
+            raise ValueError("max_mb must be positive.")
+        self.max_mb = max_mb
+        buckets = 1
+        while buckets * 4 * ENTRY_BYTES <= max_mb * 1024 * 1024:
+            buckets *= 2
+        self._mask = buckets - 1
+        self._entries: List[Optional[Entry]] = [None] * (2 * buckets)
+        self.reset_stats()
+
+    @property
+    def capacity(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries = [None] * len(self._entries)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "probes": self.probes,
+            "hits": self.hits,
+            "cutoffs": self.cutoffs,
+            "stores": self.stores,
+            "hit_rate": self.hit_rate,
+        }
+
+    # === Khoá ===
+
+    @staticmethod
+    def key(board: Board, player: Player) -> int:
+        side, ko_keys = _extra_keys(board.size)
+        key = board.hash ^ side[player.value]
+        if board.ko_point is not None:
+            kx, ky = board.ko_point
+            key ^= ko_keys[ky][kx]
+        return key
+
+    # === Đọc / ghi ===
+
+    def probe(self, key: int) -> Optional[Entry]:
+        self.probes += 1
+        i = (key & self._mask) << 1
+        entries = self._entries
+        entry = entries[i]
+        if entry is None or entry[0] != key:
+            entry = entries[i + 1]
+            if entry is None or entry[0] != key:
+                return None
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        value: float,
+        flag: int,
+        best_move: Optional[Tuple[int, int]],
+    ) -> None:
+        self.stores += 1
+        i = (key & self._mask) << 1
+        entries = self._entries
+        entry = (key, depth, value, flag, best_move)
+        old = entries[i]
+        if old is None or old[0] == key or depth >= old[1]:
+            entries[i] = entry
+            if entries[i + 1] is not None and entries[i + 1][0] == key:
+                entries[i + 1] = None  # bỏ bản cũ cùng khoá ở ô còn lại
+        else:
+            entries[i + 1] = entry
@@ -2,6 +2,12 @@ WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 800
 FPS = 60
 
+# Hiện thống kê tìm kiếm của bot (nodes/s) ở panel; bật/tắt trong ván bằng F3
+DEBUG_SEARCH_STATS = False
+
+# File SGF cho Ctrl+S (lưu) / Ctrl+O (mở lại) trong màn hình ván cờ
+SAVE_GAME_PATH = "savegame.sgf"
+
 # Colors (RGB)
 BG_COLOR = (10, 15, 25)
 WOOD_COLOR = (210, 180, 140)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import random
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Tuple, Set
+from typing import Container, Dict, List, Optional, Sequence, Tuple, Set
 
 
 class Player(Enum):
@@ -17,6 +19,60 @@ class Player(Enum):
         return "Đen" if self is Player.BLACK else "Trắng"
 
 
+@dataclass
+class MoveRecord:
+    """Thông tin để `Board.undo` khôi phục lại đúng hình cờ trước nước đi."""
+    x: int
+    y: int
+    color: int
+    captured: List[Tuple[int, int]]
+    prev_ko_point: Optional[Tuple[int, int]]
+    hash_delta: int  # hash_sau ^ hash_trước
+
+
+# Bảng láng giềng tính sẵn một lần cho mỗi kích thước: table[y][x] -> [(nx, ny), ...]
+_NEIGHBOR_TABLES: Dict[int, List[List[List[Tuple[int, int]]]]] = {}
+
+
+def neighbor_table(size: int) -> List[List[List[Tuple[int, int]]]]:
+    table = _NEIGHBOR_TABLES.get(size)
+    if table is None:
+        table = []
+        for y in range(size):
+            row = []
+            for x in range(size):
+                coords: List[Tuple[int, int]] = []
+                if x > 0:
+                    coords.append((x - 1, y))
+                if x < size - 1:
+                    coords.append((x + 1, y))
+                if y > 0:
+                    coords.append((x, y - 1))
+                if y < size - 1:
+                    coords.append((x, y + 1))
+                row.append(coords)
+            table.append(row)
+        _NEIGHBOR_TABLES[size] = table
+    return table
+
+
+# Bảng Zobrist 64-bit cho mỗi kích thước: table[y][x][value], value 0 (trống) -> 0.
+# Seed cố định theo size để mọi tiến trình (worker) sinh ra cùng một bảng.
+_ZOBRIST_TABLES: Dict[int, List[List[Tuple[int, int, int]]]] = {}
+
+
+def zobrist_table(size: int) -> List[List[Tuple[int, int, int]]]:
+    table = _ZOBRIST_TABLES.get(size)
+    if table is None:
+        rng = random.Random(0x5A0B << 8 | size)
+        table = [
+            [(0, rng.getrandbits(64), rng.getrandbits(64)) for _ in range(size)]
+            for _ in range(size)
+        ]
+        _ZOBRIST_TABLES[size] = table
+    return table
+
+
 class Board:
     def __init__(self, size: int):
         if size < 5:
@@ -24,10 +80,18 @@ class Board:
         self.size = size
         # 0 = empty, 1 = black, 2 = white
         self.grid: List[List[int]] = [[0] * size for _ in range(size)]
+        self._neighbor_rows = neighbor_table(size)
+        # Zobrist hash của hình cờ, cập nhật tăng dần mỗi khi đổi một ô
+        self._zobrist = zobrist_table(size)
+        self.hash: int = 0
+        # Điểm bị cấm đánh lại ngay (ko đơn) với người đi kế tiếp, do `play` cập nhật
+        self.ko_point: Optional[Tuple[int, int]] = None
 
     def copy(self) -> "Board":
         new_board = Board(self.size)
         new_board.grid = [row[:] for row in self.grid]
+        new_board.hash = self.hash
+        new_board.ko_point = self.ko_point
         return new_board
 
     def in_bounds(self, x: int, y: int) -> bool:
@@ -36,20 +100,21 @@ class Board:
     def get(self, x: int, y: int) -> int:
         return self.grid[y][x]
 
+    def rows(self) -> Sequence[Sequence[int]]:
+        """Các hàng của bàn, đọc dạng rows[y][x] mà không copy (chỉ để đọc)."""
+        return self.grid
+
     def set(self, x: int, y: int, value: int) -> None:
-        self.grid[y][x] = value
+        row = self.grid[y]
+        old = row[x]
+        if old != value:
+            zob = self._zobrist[y][x]
+            self.hash ^= zob[old] ^ zob[value]
+            row[x] = value
 
     def _neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
-        coords: List[Tuple[int, int]] = []
-        if x > 0:
-            coords.append((x - 1, y))
-        if x < self.size - 1:
-            coords.append((x + 1, y))
-        if y > 0:
-            coords.append((x, y - 1))
-        if y < self.size - 1:
-            coords.append((x, y + 1))
-        return coords
+        # list dùng chung từ bảng tính sẵn -> KHÔNG được sửa
+        return self._neighbor_rows[y][x]
 
     def _group_and_liberties(
         self, x: int, y: int
@@ -89,8 +154,60 @@ class Board:
             + vị trí đã có quân
             + nước đi tự sát (sau khi xử lý bắt quân vẫn không còn khí)
         - Luật "ko" KHÔNG xử lý ở đây mà xử lý ở tầng GoGame
-          (so sánh toàn bộ hình cờ trước/sau nước đi).
+          (so sánh hash hình cờ trước/sau nước đi).
         """
+        record = self.play(player, x, y, check_ko=False)
+        if record is None:
+            return False, []
+        return True, record.captured
+
+    # === Make / unmake (cho tìm kiếm trên một bàn cờ duy nhất) ===
+
+    def play(
+        self, player: Player, x: int, y: int, check_ko: bool = True
+    ) -> Optional[MoveRecord]:
+        """
+        Đánh nước (x, y) ngay trên bàn này.
+
+        Trả về MoveRecord để `undo` khôi phục, hoặc None nếu nước đi bất hợp lệ
+        (ngoài biên, trùng quân, tự sát, hoặc đánh vào `ko_point` khi `check_ko`).
+        """
+        if check_ko and self.ko_point == (x, y):
+            return None
+        old_hash = self.hash
+        success, captured = self._place(player, x, y)
+        if not success:
+            return None
+
+        record = MoveRecord(
+            x, y, player.value, captured, self.ko_point, old_hash ^ self.hash
+        )
+        # Ko đơn: bắt đúng 1 quân bằng 1 quân đứng riêng chỉ còn 1 khí
+        self.ko_point = None
+        if len(captured) == 1 and self._is_lone_stone_in_atari(x, y):
+            self.ko_point = captured[0]
+        return record
+
+    def undo(self, record: MoveRecord) -> None:
+        """Hoàn tác nước đi `record` (phải là nước được `play` gần nhất)."""
+        self.set(record.x, record.y, 0)
+        opp = 3 - record.color
+        for cx, cy in record.captured:
+            self.set(cx, cy, opp)
+        self.ko_point = record.prev_ko_point
+
+    def _is_lone_stone_in_atari(self, x: int, y: int) -> bool:
+        color = self.get(x, y)
+        empties = 0
+        for nx, ny in self._neighbors(x, y):
+            v = self.get(nx, ny)
+            if v == color:
+                return False
+            if v == 0:
+                empties += 1
+        return empties == 1
+
+    def _place(self, player: Player, x: int, y: int) -> Tuple[bool, List[Tuple[int, int]]]:
         if not self.in_bounds(x, y):
             return False, []
         if self.get(x, y) != 0:
@@ -124,3 +241,99 @@ class Board:
 
     def is_full(self) -> bool:
         return all(v != 0 for row in self.grid for v in row)
+
+    # === Nước hợp lệ (không copy / không sửa bàn cờ) ===
+
+    def _label_chains(self) -> Tuple[List[List[int]], List[int], List[int]]:
+        """
+        Gán nhãn mọi nhóm quân trong một lượt duyệt.
+
+        Trả về (labels, liberty_counts, chain_hashes):
+        - labels[y][x]: nhãn nhóm (0 = ô trống)
+        - liberty_counts[label]: số khí của nhóm
+        - chain_hashes[label]: XOR Zobrist của các quân trong nhóm
+        """
+        size = self.size
+        grid = self.grid
+        zobrist = self._zobrist
+        rows = self._neighbor_rows
+        labels = [[0] * size for _ in range(size)]
+        liberty_counts = [0]
+        chain_hashes = [0]
+
+        for y in range(size):
+            for x in range(size):
+                color = grid[y][x]
+                if color == 0 or labels[y][x]:
+                    continue
+                label = len(liberty_counts)
+                labels[y][x] = label
+                liberties: Set[Tuple[int, int]] = set()
+                chain_hash = 0
+                stack = [(x, y)]
+                while stack:
+                    cx, cy = stack.pop()
+                    chain_hash ^= zobrist[cy][cx][color]
+                    for nx, ny in rows[cy][cx]:
+                        v = grid[ny][nx]
+                        if v == 0:
+                            liberties.add((nx, ny))
+                        elif v == color and not labels[ny][nx]:
+                            labels[ny][nx] = label
+                            stack.append((nx, ny))
+                liberty_counts.append(len(liberties))
+                chain_hashes.append(chain_hash)
+
+        return labels, liberty_counts, chain_hashes
+
+    def legal_moves(
+        self, player: Player, forbidden_hashes: Container[int] = ()
+    ) -> List[Tuple[int, int]]:
+        """
+        Các nước hợp lệ của `player`, quyết định chỉ từ số khí của các nhóm kề:
+        - có ô trống kề, hoặc
+        - nối vào nhóm mình còn >= 2 khí, hoặc
+        - bắt được nhóm đối phương chỉ còn 1 khí.
+        Hash hình cờ sau nước đi được tính trực tiếp (không đặt thử quân) và
+        nước đi bị loại nếu hash nằm trong `forbidden_hashes` (ko / superko).
+        Thứ tự trả về giống `place_stone` thử từng ô: theo hàng (y) rồi cột (x).
+        """
+        labels, liberty_counts, chain_hashes = self._label_chains()
+        size = self.size
+        grid = self.grid
+        zobrist = self._zobrist
+        rows = self._neighbor_rows
+        color = player.value
+        moves: List[Tuple[int, int]] = []
+
+        for y in range(size):
+            row = grid[y]
+            for x in range(size):
+                if row[x] != 0:
+                    continue
+                legal = False
+                captured: List[int] = []
+                for nx, ny in rows[y][x]:
+                    v = grid[ny][nx]
+                    if v == 0:
+                        legal = True
+                        continue
+                    label = labels[ny][nx]
+                    if v == color:
+                        if liberty_counts[label] > 1:
+                            legal = True
+                    elif liberty_counts[label] == 1 and label not in captured:
+                        captured.append(label)
+                if captured:
+                    legal = True
+                if not legal:
+                    continue
+                if forbidden_hashes:
+                    new_hash = self.hash ^ zobrist[y][x][color]
+                    for label in captured:
+                        new_hash ^= chain_hashes[label]
+                    if new_hash in forbidden_hashes:
+                        continue
+                moves.append((x, y))
+
+        return moves
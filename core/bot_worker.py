@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+from core.board import Board
+
+
+class BotWorker:
+    """
+    Chạy `bot.select_move` trên một thread riêng để vòng lặp pygame không bị treo.
+
+    - `submit(...)` gửi một lượt tìm nước (bàn cờ là bản copy, không dùng chung).
+    - `poll()` gọi mỗi frame: trả về (token, move) khi bot tính xong, ngược lại None.
+    - `cancel()` bỏ lượt đang chờ/đang chạy; kết quả cũ (nếu có) bị bỏ qua.
+      Bot có `request_stop()` sẽ được yêu cầu dừng sớm.
+
+    `token` do phía gọi tự chọn (vd: phiên bản trạng thái ván cờ) để nhận biết
+    kết quả đã lỗi thời hay chưa.
+    """
+
+    def __init__(self):
+        # 1 worker: các lượt tìm kiếm chạy tuần tự, lượt bị huỷ dừng trước lượt mới
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot-search")
+        self._future: Optional[Future] = None
+        self._bot: Any = None
+        self._token: Any = None
+
+    @property
+    def busy(self) -> bool:
+        return self._future is not None
+
+    def submit(self, bot: Any, board: Board, legal_moves: List[Tuple[int, int]], token: Any):
+        self.cancel()
+        self._bot = bot
+        self._token = token
+        self._future = self._executor.submit(bot.select_move, board, legal_moves)
+
+    def poll(self) -> Optional[Tuple[Any, Any]]:
+        future = self._future
+        if future is None or not future.done():
+            return None
+        self._future = None
+        return self._token, future.result()
+
+    def cancel(self):
+        future = self._future
+        if future is None:
+            return
+        self._future = None
+        if not future.cancel():
+            # đang chạy -> nhờ bot dừng sớm (nếu hỗ trợ), kết quả sẽ bị bỏ
+            request_stop = getattr(self._bot, "request_stop", None)
+            if request_stop is not None:
+                request_stop()
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from typing import Container, Dict, List, Tuple, Set
+
+from core.board import Board, MoveRecord, Player
+
+
+class Chain:
+    """Một nhóm quân nối liền: màu, danh sách quân và tập khí."""
+
+    __slots__ = ("color", "stones", "liberties")
+
+    def __init__(self, color: int):
+        self.color = color
+        self.stones: List[Tuple[int, int]] = []
+        self.liberties: Set[Tuple[int, int]] = set()
+
+    def copy(self) -> "Chain":
+        new_chain = Chain(self.color)
+        new_chain.stones = self.stones[:]
+        new_chain.liberties = set(self.liberties)
+        return new_chain
+
+
+class ChainBoard(Board):
+    """
+    Bàn cờ theo dõi nhóm quân & khí tăng dần (incremental).
+
+    - Mỗi giao điểm có quân mang một chain id (`chain_ids[y][x]`, 0 = trống).
+    - `chains[id]` giữ danh sách quân và tập khí của nhóm.
+    - `place_stone` / `play` chỉ cập nhật các nhóm kề với nước đi (gộp nhóm,
+      trừ khí, bắt quân), không flood fill lại cả nhóm như `Board`.
+    - `undo` chỉ dựng lại các nhóm chạm vào nước đi và quân bị bắt.
+
+    Hợp đồng `place_stone(player, x, y) -> (success, captured)` giữ nguyên.
+    """
+
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.chain_ids: List[List[int]] = [[0] * size for _ in range(size)]
+        self.chains: Dict[int, Chain] = {}
+        self._next_chain_id: int = 1
+
+    def copy(self) -> "ChainBoard":
+        new_board = ChainBoard(self.size)
+        new_board.grid = [row[:] for row in self.grid]
+        new_board.chain_ids = [row[:] for row in self.chain_ids]
+        new_board.chains = {cid: chain.copy() for cid, chain in self.chains.items()}
+        new_board._next_chain_id = self._next_chain_id
+        new_board.hash = self.hash
+        new_board.ko_point = self.ko_point
+        return new_board
+
+    @classmethod
+    def from_board(cls, board: Board) -> "ChainBoard":
+        """ChainBoard cùng hình cờ (và hash / ko_point) với một bàn bất kỳ."""
+        if isinstance(board, ChainBoard):
+            return board.copy()
+        new_board = cls(board.size)
+        new_board.grid = [list(row) for row in board.grid]
+        new_board.hash = board.hash
+        new_board.ko_point = board.ko_point
+        new_board._rebuild_chains()
+        return new_board
+
+    def set(self, x: int, y: int, value: int) -> None:
+        """
+        Đặt giá trị trực tiếp (dùng khi dựng thế cờ, không bắt quân). Chỉ cập
+        nhật các nhóm chạm vào (x, y): nhóm cũ ở đó (có thể bị tách) và các
+        nhóm kề.
+        """
+        old = self.grid[y][x]
+        if old == value:
+            return
+        point = (x, y)
+        chain_ids = self.chain_ids
+        stones: List[Tuple[int, int]] = []
+        if old:
+            for sx, sy in self.chains.pop(chain_ids[y][x]).stones:
+                chain_ids[sy][sx] = 0
+                stones.append((sx, sy))
+        super().set(x, y, value)
+        for sx, sy in stones:
+            if (sx, sy) != point and not chain_ids[sy][sx]:
+                self._new_chain_from(sx, sy)
+
+        neighbors = self._neighbors(x, y)
+        if value:
+            friend_ids: List[int] = []
+            for nx, ny in neighbors:
+                cid = chain_ids[ny][nx]
+                if cid and self.chains[cid].color == value and cid not in friend_ids:
+                    friend_ids.append(cid)
+            chain_id = self._merge_into_new_stone(point, value, friend_ids, neighbors)
+            for nx, ny in neighbors:
+                cid = chain_ids[ny][nx]
+                if cid and cid != chain_id:
+                    self.chains[cid].liberties.discard(point)
+        else:
+            for nx, ny in neighbors:
+                cid = chain_ids[ny][nx]
+                if cid:
+                    self.chains[cid].liberties.add(point)
+
+    # === Truy vấn nhóm ===
+
+    def chain_at(self, x: int, y: int) -> Chain | None:
+        cid = self.chain_ids[y][x]
+        return self.chains.get(cid) if cid else None
+
+    def _group_and_liberties(
+        self, x: int, y: int
+    ) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        chain = self.chain_at(x, y)
+        if chain is None:
+            return set(), set()
+        return set(chain.stones), set(chain.liberties)
+
+    # === Đặt quân (cập nhật tăng dần) ===
+
+    def _place(self, player: Player, x: int, y: int) -> Tuple[bool, List[Tuple[int, int]]]:
+        if not self.in_bounds(x, y):
+            return False, []
+        if self.grid[y][x] != 0:
+            return False, []
+
+        color = player.value
+        point = (x, y)
+        neighbors = self._neighbors(x, y)
+
+        # Kiểm tra hợp lệ trước khi đặt, chỉ dựa vào số khí của các nhóm kề
+        has_empty = False
+        has_safe_friend = False
+        friend_ids: List[int] = []
+        capture_ids: List[int] = []
+        for nx, ny in neighbors:
+            cid = self.chain_ids[ny][nx]
+            if cid == 0:
+                has_empty = True
+                continue
+            chain = self.chains[cid]
+            if chain.color == color:
+                if cid not in friend_ids:
+                    friend_ids.append(cid)
+                    if len(chain.liberties) > 1:
+                        has_safe_friend = True
+            elif len(chain.liberties) == 1 and cid not in capture_ids:
+                # khí duy nhất chính là (x, y) -> bị bắt
+                capture_ids.append(cid)
+
+        if not (has_empty or has_safe_friend or capture_ids):
+            # Tự sát -> bất hợp lệ
+            return False, []
+
+        # Đặt quân & gộp với các nhóm cùng màu kề cạnh
+        self.grid[y][x] = color
+        self.hash ^= self._zobrist[y][x][color]
+        chain_id = self._merge_into_new_stone(point, color, friend_ids, neighbors)
+
+        # Nước đi lấy mất khí (x, y) của các nhóm đối phương kề cạnh
+        for nx, ny in neighbors:
+            cid = self.chain_ids[ny][nx]
+            if cid and cid != chain_id:
+                self.chains[cid].liberties.discard(point)
+
+        # Bắt các nhóm đối phương hết khí
+        captured_total: List[Tuple[int, int]] = []
+        for cid in capture_ids:
+            captured_total.extend(self._remove_chain(cid))
+
+        return True, captured_total
+
+    def undo(self, record: MoveRecord) -> None:
+        x, y = record.x, record.y
+        grid = self.grid
+        chain_ids = self.chain_ids
+        rows = self._neighbor_rows
+        zobrist = self._zobrist
+        opp = 3 - record.color
+
+        # Các nhóm cần dựng lại: nhóm chứa quân vừa đặt (có thể bị tách ra)
+        # và các nhóm kề quân bị bắt (mất lại khí)
+        stale = {chain_ids[y][x]}
+        for cx, cy in record.captured:
+            for nx, ny in rows[cy][cx]:
+                if chain_ids[ny][nx]:
+                    stale.add(chain_ids[ny][nx])
+
+        seeds: List[Tuple[int, int]] = []
+        for cid in stale:
+            for sx, sy in self.chains.pop(cid).stones:
+                chain_ids[sy][sx] = 0
+                seeds.append((sx, sy))
+
+        grid[y][x] = 0
+        self.hash ^= zobrist[y][x][record.color]
+        for cx, cy in record.captured:
+            grid[cy][cx] = opp
+            self.hash ^= zobrist[cy][cx][opp]
+            seeds.append((cx, cy))
+
+        for sx, sy in seeds:
+            if grid[sy][sx] and not chain_ids[sy][sx]:
+                self._new_chain_from(sx, sy)
+
+        # (x, y) trống lại -> thành khí của các nhóm kề
+        for nx, ny in rows[y][x]:
+            cid = chain_ids[ny][nx]
+            if cid:
+                self.chains[cid].liberties.add((x, y))
+
+        self.ko_point = record.prev_ko_point
+
+    def _is_lone_stone_in_atari(self, x: int, y: int) -> bool:
+        chain = self.chain_at(x, y)
+        return len(chain.stones) == 1 and len(chain.liberties) == 1
+
+    def _new_chain_from(self, x: int, y: int) -> int:
+        group, liberties = Board._group_and_liberties(self, x, y)
+        chain = Chain(self.grid[y][x])
+        chain.stones = list(group)
+        chain.liberties = liberties
+        chain_id = self._next_chain_id
+        self._next_chain_id += 1
+        self.chains[chain_id] = chain
+        for gx, gy in group:
+            self.chain_ids[gy][gx] = chain_id
+        return chain_id
+
+    def _merge_into_new_stone(
+        self,
+        point: Tuple[int, int],
+        color: int,
+        friend_ids: List[int],
+        neighbors: List[Tuple[int, int]],
+    ) -> int:
+        x, y = point
+        if friend_ids:
+            # Gộp các nhóm nhỏ vào nhóm lớn nhất để đổi ít chain id nhất
+            friend_ids.sort(key=lambda cid: len(self.chains[cid].stones), reverse=True)
+            chain_id = friend_ids[0]
+            chain = self.chains[chain_id]
+            for other_id in friend_ids[1:]:
+                other = self.chains.pop(other_id)
+                for sx, sy in other.stones:
+                    self.chain_ids[sy][sx] = chain_id
+                chain.stones.extend(other.stones)
+                chain.liberties |= other.liberties
+        else:
+            chain_id = self._next_chain_id
+            self._next_chain_id += 1
+            chain = Chain(color)
+            self.chains[chain_id] = chain
+
+        chain.stones.append(point)
+        self.chain_ids[y][x] = chain_id
+        chain.liberties.discard(point)
+        for nx, ny in neighbors:
+            if self.grid[ny][nx] == 0:
+                chain.liberties.add((nx, ny))
+        return chain_id
+
+    def _remove_chain(self, chain_id: int) -> List[Tuple[int, int]]:
+        """Nhấc cả nhóm khỏi bàn và trả khí cho các nhóm kề cạnh."""
+        chain = self.chains.pop(chain_id)
+        zobrist = self._zobrist
+        for sx, sy in chain.stones:
+            self.grid[sy][sx] = 0
+            self.chain_ids[sy][sx] = 0
+            self.hash ^= zobrist[sy][sx][chain.color]
+        for sx, sy in chain.stones:
+            for nx, ny in self._neighbors(sx, sy):
+                cid = self.chain_ids[ny][nx]
+                if cid:
+                    self.chains[cid].liberties.add((sx, sy))
+        return chain.stones
+
+    # === Nước hợp lệ (đọc trực tiếp số khí của các nhóm kề) ===
+
+    def legal_moves(
+        self, player: Player, forbidden_hashes: Container[int] = ()
+    ) -> List[Tuple[int, int]]:
+        size = self.size
+        grid = self.grid
+        chain_ids = self.chain_ids
+        chains = self.chains
+        zobrist = self._zobrist
+        rows = self._neighbor_rows
+        color = player.value
+        moves: List[Tuple[int, int]] = []
+
+        for y in range(size):
+            row = grid[y]
+            for x in range(size):
+                if row[x] != 0:
+                    continue
+                legal = False
+                captured: List[Chain] = []
+                for nx, ny in rows[y][x]:
+                    cid = chain_ids[ny][nx]
+                    if cid == 0:
+                        legal = True
+                        continue
+                    chain = chains[cid]
+                    if chain.color == color:
+                        if len(chain.liberties) > 1:
+                            legal = True
+                    elif len(chain.liberties) == 1 and chain not in captured:
+                        captured.append(chain)
+                if captured:
+                    legal = True
+                if not legal:
+                    continue
+                if forbidden_hashes:
+                    new_hash = self.hash ^ zobrist[y][x][color]
+                    for chain in captured:
+                        for sx, sy in chain.stones:
+                            new_hash ^= zobrist[sy][sx][chain.color]
+                    if new_hash in forbidden_hashes:
+                        continue
+                moves.append((x, y))
+
+        return moves
+
+    # === Dựng lại toàn bộ (đường chậm) ===
+
+    def _rebuild_chains(self) -> None:
+        self.chain_ids = [[0] * self.size for _ in range(self.size)]
+        self.chains = {}
+        self._next_chain_id = 1
+        for y in range(self.size):
+            for x in range(self.size):
+                if self.grid[y][x] == 0 or self.chain_ids[y][x]:
+                    continue
+                self._new_chain_from(x, y)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+from typing import Container, Dict, List, Optional, Tuple, Set
+
+from core.board import Board, MoveRecord, Player, neighbor_table, zobrist_table
+
+# Giá trị ô viền (sentinel) bao quanh bàn cờ
+BORDER = 3
+
+# Bảng offset láng giềng cho mỗi kích thước: (trái, phải, trên, dưới)
+_OFFSET_TABLES: Dict[int, Tuple[int, int, int, int]] = {}
+
+
+def neighbor_offsets(size: int) -> Tuple[int, int, int, int]:
+    offsets = _OFFSET_TABLES.get(size)
+    if offsets is None:
+        width = size + 2
+        offsets = (-1, 1, -width, width)
+        _OFFSET_TABLES[size] = offsets
+    return offsets
+
+
+# Bảng Zobrist theo index (cùng giá trị với `zobrist_table`, ô viền -> 0)
+_ZOBRIST_INDEX_TABLES: Dict[int, List[Tuple[int, int, int]]] = {}
+
+
+def zobrist_index_table(size: int) -> List[Tuple[int, int, int]]:
+    table = _ZOBRIST_INDEX_TABLES.get(size)
+    if table is None:
+        width = size + 2
+        table = [(0, 0, 0)] * (width * width)
+        for y, row in enumerate(zobrist_table(size)):
+            for x, zob in enumerate(row):
+                table[(y + 1) * width + x + 1] = zob
+        _ZOBRIST_INDEX_TABLES[size] = table
+    return table
+
+
+class FlatBoard(Board):
+    """
+    Bàn cờ dạng mảng 1 chiều có viền.
+
+    - `cells` là bytearray kích thước (size + 2)^2, hàng/cột ngoài cùng
+      mang giá trị BORDER nên không cần kiểm tra biên khi duyệt láng giềng.
+    - Ô (x, y) nằm ở index (y + 1) * (size + 2) + (x + 1).
+    - `copy()` chỉ là một lần copy buffer.
+
+    Giữ nguyên API của `Board` (get/set/copy/place_stone/...) để GoGame và
+    bot chạy được trên cả hai kiểu bàn.
+    """
+
+    def __init__(self, size: int):
+        if size < 5:
+            raise ValueError("Board size must be at least 5x5.")
+        self.size = size
+        self.width = size + 2
+        self._neighbor_rows = neighbor_table(size)
+        self._offsets = neighbor_offsets(size)
+        self._zobrist_index = zobrist_index_table(size)
+        self.hash: int = 0
+        self.ko_point: Optional[Tuple[int, int]] = None
+
+        cells = bytearray([BORDER]) * (self.width * self.width)
+        for y in range(size):
+            start = (y + 1) * self.width + 1
+            cells[start:start + size] = bytes(size)
+        self.cells = cells
+        self._rows: Optional[List[memoryview]] = None
+
+    def copy(self) -> "FlatBoard":
+        new_board = FlatBoard.__new__(FlatBoard)
+        new_board.size = self.size
+        new_board.width = self.width
+        new_board._neighbor_rows = self._neighbor_rows
+        new_board._offsets = self._offsets
+        new_board._zobrist_index = self._zobrist_index
+        new_board.cells = self.cells[:]
+        new_board._rows = None
+        new_board.hash = self.hash
+        new_board.ko_point = self.ko_point
+        return new_board
+
+    # === Chuyển đổi toạ độ ===
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.width + (x + 1)
+
+    def coord(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.width)
+        return x - 1, y - 1
+
+    @property
+    def grid(self) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Bản sao chỉ đọc dạng grid[y][x] (tương thích với `Board` khi đọc).
+        Là tuple nên `grid[y][x] = v` báo lỗi thay vì ghi vào bản sao rồi mất.
+        """
+        size = self.size
+        return tuple(
+            tuple(self.cells[(y + 1) * self.width + 1:(y + 1) * self.width + 1 + size])
+            for y in range(size)
+        )
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[(y + 1) * self.width + x + 1]
+
+    def rows(self) -> List[memoryview]:
+        """
+        Mỗi hàng là một memoryview vào `cells` (không copy như `grid`), luôn
+        phản ánh bàn hiện tại nên được dựng một lần rồi giữ lại.
+        """
+        rows = self._rows
+        if rows is None:
+            view = memoryview(self.cells)
+            size = self.size
+            width = self.width
+            rows = [view[(y + 1) * width + 1:(y + 1) * width + 1 + size] for y in range(size)]
+            self._rows = rows
+        return rows
+
+    def __getstate__(self):
+        # memoryview không pickle được (gửi bàn sang tiến trình con)
+        state = self.__dict__.copy()
+        state["_rows"] = None
+        return state
+
+    def set(self, x: int, y: int, value: int) -> None:
+        index = (y + 1) * self.width + x + 1
+        zob = self._zobrist_index[index]
+        self.hash ^= zob[self.cells[index]] ^ zob[value]
+        self.cells[index] = value
+
+    def is_full(self) -> bool:
+        return 0 not in self.cells
+
+    # === Nhóm & khí (theo index) ===
+
+    def _chain_at(self, index: int) -> Tuple[List[int], Set[int]]:
+        cells = self.cells
+        color = cells[index]
+        stones = [index]
+        seen = {index}
+        liberties: Set[int] = set()
+        for stone in stones:  # list được nối thêm trong lúc duyệt
+            for offset in self._offsets:
+                n = stone + offset
+                v = cells[n]
+                if v == 0:
+                    liberties.add(n)
+                elif v == color and n not in seen:
+                    seen.add(n)
+                    stones.append(n)
+        return stones, liberties
+
+    def _group_and_liberties(
+        self, x: int, y: int
+    ) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+        index = self.index(x, y)
+        if self.cells[index] == 0:
+            return set(), set()
+        stones, liberties = self._chain_at(index)
+        coord = self.coord
+        return {coord(i) for i in stones}, {coord(i) for i in liberties}
+
+    def _place(self, player: Player, x: int, y: int) -> Tuple[bool, List[Tuple[int, int]]]:
+        if not self.in_bounds(x, y):
+            return False, []
+        cells = self.cells
+        index = (y + 1) * self.width + x + 1
+        if cells[index] != 0:
+            return False, []
+
+        color = player.value
+        opp = player.opposite.value
+        zobrist = self._zobrist_index
+        cells[index] = color
+        self.hash ^= zobrist[index][color]
+
+        # Bắt các nhóm đối phương kề cạnh nếu hết khí
+        captured: List[int] = []
+        has_empty = False
+        for offset in self._offsets:
+            n = index + offset
+            v = cells[n]
+            if v == 0:
+                has_empty = True
+            elif v == opp:
+                stones, liberties = self._chain_at(n)
+                if not liberties:
+                    for s in stones:
+                        cells[s] = 0
+                        self.hash ^= zobrist[s][opp]
+                    captured.extend(stones)
+
+        # Không bắt được gì & không có ô trống kề -> kiểm tra tự sát
+        if not captured and not has_empty:
+            _, liberties = self._chain_at(index)
+            if not liberties:
+                cells[index] = 0
+                self.hash ^= zobrist[index][color]
+                return False, []
+
+        coord = self.coord
+        return True, [coord(i) for i in captured]
+
+    def undo(self, record: MoveRecord) -> None:
+        cells = self.cells
+        width = self.width
+        cells[(record.y + 1) * width + record.x + 1] = 0
+        opp = 3 - record.color
+        for cx, cy in record.captured:
+            cells[(cy + 1) * width + cx + 1] = opp
+        self.hash ^= record.hash_delta
+        self.ko_point = record.prev_ko_point
+
+    def _is_lone_stone_in_atari(self, x: int, y: int) -> bool:
+        cells = self.cells
+        index = (y + 1) * self.width + x + 1
+        color = cells[index]
+        empties = 0
+        for offset in self._offsets:
+            v = cells[index + offset]
+            if v == color:
+                return False
+            if v == 0:
+                empties += 1
+        return empties == 1
+
+    # === Nước hợp lệ (không copy / không sửa bàn cờ) ===
+
+    def _label_chains_flat(self) -> Tuple[List[int], List[int], List[int]]:
+        """Như `Board._label_chains` nhưng nhãn đánh theo index của `cells`."""
+        cells = self.cells
+        offsets = self._offsets
+        zobrist = self._zobrist_index
+        labels = [0] * len(cells)
+        liberty_counts = [0]
+        chain_hashes = [0]
+
+        for index, color in enumerate(cells):
+            if color == 0 or color == BORDER or labels[index]:
+                continue
+            label = len(liberty_counts)
+            labels[index] = label
+            stones = [index]
+            liberties: Set[int] = set()
+            chain_hash = 0
+            for stone in stones:
+                chain_hash ^= zobrist[stone][color]
+                for offset in offsets:
+                    n = stone + offset
+                    v = cells[n]
+                    if v == 0:
+                        liberties.add(n)
+                    elif v == color and not labels[n]:
+                        labels[n] = label
+                        stones.append(n)
+            liberty_counts.append(len(liberties))
+            chain_hashes.append(chain_hash)
+
+        return labels, liberty_counts, chain_hashes
+
+    def legal_moves(
+        self, player: Player, forbidden_hashes: Container[int] = ()
+    ) -> List[Tuple[int, int]]:
+        labels, liberty_counts, chain_hashes = self._label_chains_flat()
+        cells = self.cells
+        offsets = self._offsets
+        zobrist = self._zobrist_index
+        color = player.value
+        width = self.width
+        moves: List[Tuple[int, int]] = []
+
+        for index, v in enumerate(cells):
+            if v != 0:
+                continue
+            legal = False
+            captured: List[int] = []
+            for offset in offsets:
+                n = index + offset
+                nv = cells[n]
+                if nv == 0:
+                    legal = True
+                elif nv == BORDER:
+                    continue
+                elif nv == color:
+                    if liberty_counts[labels[n]] > 1:
+                        legal = True
+                else:
+                    label = labels[n]
+                    if liberty_counts[label] == 1 and label not in captured:
+                        captured.append(label)
+            if captured:
+                legal = True
+            if not legal:
+                continue
+            if forbidden_hashes:
+                new_hash = self.hash ^ zobrist[index][color]
+                for label in captured:
+                    new_hash ^= chain_hashes[label]
+                if new_hash in forbidden_hashes:
+                    continue
+            y, x = divmod(index, width)
+            moves.append((x - 1, y - 1))
+
+        return moves
@@ -1,42 +1,91 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from array import array
+from collections import OrderedDict
 from enum import Enum
-from typing import Optional, Tuple, List, Dict, Any, Set
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Set
 from core.board import Board, Player
+from core.chain_board import ChainBoard
+from core.flat_board import FlatBoard
+from core.bot_worker import BotWorker
+from core.history import GameHistory, GameSnapshot, PlyRecord
+from core import np_kernels
+
+
+# Các kiểu bàn cờ có thể chọn cho GoGame
+BOARD_BACKENDS: Dict[str, type] = {
+    "grid": Board,         # list 2 chiều, flood fill mỗi nước (mặc định)
+    "chains": ChainBoard,  # theo dõi nhóm & khí tăng dần
+    "flat": FlatBoard,     # mảng 1 chiều có viền, copy = 1 lần copy buffer
+}
+
+
+# Luật ko: "simple" = cấm lặp lại hình cờ ngay trước đó (ko đơn),
+# "positional" = cấm lặp lại bất kỳ hình cờ nào đã có trong ván (positional superko)
+KO_RULES = ("simple", "positional")
+
+# Số kết quả get_legal_moves tối đa được giữ trong cache (LRU); entry được nén
+# nên 256 entry ở 19x19 chỉ tốn ~150 KB
+LEGAL_CACHE_SIZE = 256
 
 
 class GameMode(Enum):
     HUMAN_VS_HUMAN = 1
     HUMAN_VS_BOT = 2
-
-
-@dataclass
-class GameSnapshot:
-    board: Board
-    current_player: Player
-    captures_black: int
-    captures_white: int
-    last_move: Optional[Tuple[int, int]]
-    pass_streak: int  # số lượt pass liên tiếp (0,1,2...)
+    BOT_VS_BOT = 3
 
 
 class GoGame:
-    def __init__(self, size: int, mode: GameMode, human_color: Player = Player.BLACK):
+    def __init__(
+        self,
+        size: int,
+        mode: GameMode,
+        human_color: Player = Player.BLACK,
+        board_backend: str = "grid",
+        ko_rule: str = "simple",
+        async_bot: bool = False,
+        use_numpy: bool = False,
+    ):
+        if board_backend not in BOARD_BACKENDS:
+            raise ValueError(f"Unknown board backend: {board_backend!r}")
+        if ko_rule not in KO_RULES:
+            raise ValueError(f"Unknown ko rule: {ko_rule!r}")
         self.size = size
         self.mode = mode
         self.human_color = human_color
+        self.board_backend = board_backend
+        self.ko_rule = ko_rule
         self.bot: Optional[Any] = None
-
-        # Lịch sử ván cờ (undo/redo & ko)
-        self.history: List[GameSnapshot] = []
+        # Bot theo màu quân (HUMAN_VS_BOT: một bot, BOT_VS_BOT: hai bot)
+        self.bots: Dict[Player, Any] = {}
+        # async_bot=True: bot tính nước trên thread riêng, UI gọi poll_bot_turn() mỗi frame
+        self.async_bot = async_bot
+        self._bot_worker: Optional[BotWorker] = None
+        # use_numpy=True: đếm lãnh thổ bằng kernel NumPy (bỏ qua nếu chưa cài NumPy)
+        self.use_numpy = use_numpy and np_kernels.HAS_NUMPY
+        # Tăng mỗi lần đổi trạng thái -> nhận biết kết quả bot đã lỗi thời
+        self._state_version: int = 0
+
+        # Lịch sử ván cờ (undo/redo & ko): cây nước đi, delta mỗi ply + keyframe định kỳ
+        self.history: GameHistory
         self.current_index: int = 0
+        # Đếm số lần mỗi hash hình cờ xuất hiện trong history[: current_index + 1]
+        self._line_hashes: Dict[int, int] = {}
+        # XOR các hash phân biệt trong `_line_hashes` (dấu vân tay của tập hình cờ bị cấm)
+        self._line_fingerprint: int = 0
+        # Cache LRU nước hợp lệ: (hash hình cờ, màu, khoá ko) -> chỉ số ô y * size + x
+        # (mảng 2 byte mỗi nước thay vì list tuple: ~0.7 KB thay vì ~25 KB ở 19x19)
+        self._legal_cache: "OrderedDict[Tuple[int, int, int], array]" = OrderedDict()
+        # chỉ số ô -> (x, y), dùng chung cho mọi kết quả giải nén từ cache
+        self._points: List[Tuple[int, int]] = [(x, y) for y in range(size) for x in range(size)]
 
         # Trạng thái hiện tại
-        self.board: Board = Board(size)
+        self.board: Board = self._new_board()
         self.current_player: Player = Player.BLACK
         self.captures: Dict[Player, int] = {Player.BLACK: 0, Player.WHITE: 0}
         self.last_move: Optional[Tuple[int, int]] = None
-        self.is_over: bool = False
+        # None = chưa tính (xem property `is_over`)
+        self._is_over: Optional[bool] = None
+        self.winner: Optional[Player] = None  # chỉ đặt khi có người resign
         self.pass_streak: int = 0  # 2 lượt pass liên tiếp => kết thúc
         self.komi: float = 6.5     # komi chuẩn cho Trắng (có thể chỉnh nếu muốn)
 
@@ -44,19 +93,21 @@ class GoGame:
 
     # === Khởi tạo & snapshot ===
 
-    def _create_initial_state(self):
-        board = Board(self.size)
-        snapshot = GameSnapshot(
-            board=board,
-            current_player=Player.BLACK,
-            captures_black=0,
-            captures_white=0,
-            last_move=None,
-            pass_streak=0,
-        )
-        self.history = [snapshot]
+    def _new_board(self) -> Board:
+        return BOARD_BACKENDS[self.board_backend](self.size)
+
+    def _create_initial_state(
+        self, board: Optional[Board] = None, current_player: Player = Player.BLACK
+    ):
+        """Ván mới từ bàn trống, hoặc từ `board` đặt sẵn (vd: quân chấp khi đọc SGF)."""
+        if board is None:
+            board = self._new_board()
+        self.history = GameHistory(board, current_player)
         self.current_index = 0
-        self._load_snapshot(snapshot)
+        self._line_hashes = {board.hash: 1}
+        self._line_fingerprint = board.hash
+        self._legal_cache = OrderedDict()
+        self._load_snapshot(self.history[0])
 
     def _load_snapshot(self, snap: GameSnapshot):
         self.board = snap.board
@@ -67,7 +118,24 @@ class GoGame:
         }
         self.last_move = snap.last_move
         self.pass_streak = snap.pass_streak
-        self.is_over = self._compute_is_over()
+        self.winner = None
+        # is_over chỉ tính khi có người hỏi tới (đọc SGF không tính cho mọi ply)
+        self._is_over = None
+        self._state_version += 1
+
+    @property
+    def is_over(self) -> bool:
+        if self._is_over is None:
+            # giữ trong bản ghi của ply: undo/redo không tính lại
+            record = self.history.record(self.current_index)
+            if record.is_over is None:
+                record.is_over = self._compute_is_over()
+            self._is_over = record.is_over
+        return self._is_over
+
+    @is_over.setter
+    def is_over(self, value: bool):
+        self._is_over = value
 
     def _compute_is_over(self) -> bool:
         # 1 Bàn đầy
@@ -84,10 +152,97 @@ class GoGame:
             return True
         return False
 
+    def _push_line_hash(self, position_hash: int):
+        count = self._line_hashes.get(position_hash, 0)
+        if count == 0:
+            self._line_fingerprint ^= position_hash
+        self._line_hashes[position_hash] = count + 1
+
+    def _pop_line_hash(self, position_hash: int):
+        count = self._line_hashes[position_hash] - 1
+        if count:
+            self._line_hashes[position_hash] = count
+        else:
+            del self._line_hashes[position_hash]
+            self._line_fingerprint ^= position_hash
+
+    def _ko_forbidden(self) -> Tuple[Any, int]:
+        """Trả về (tập hash bị cấm, khoá đại diện cho tập đó) theo `ko_rule`."""
+        if self.ko_rule == "positional":
+            return self._line_hashes, self._line_fingerprint
+        if self.current_index >= 1:
+            prev_hash = self.history.hash_at(self.current_index - 1)
+            return (prev_hash,), prev_hash
+        return (), 0
+
+    def _violates_ko(self, position_hash: int) -> bool:
+        """Hình cờ (hash) sau nước đi có vi phạm luật ko đang chọn không - O(1)."""
+        if self.ko_rule == "positional":
+            return position_hash in self._line_hashes
+        if self.current_index >= 1:
+            return position_hash == self.history.hash_at(self.current_index - 1)
+        return False
+
     def reset(self):
+        self.cancel_bot_turn()
         self._create_initial_state()
 
-    def set_bot(self, bot: Any):
+    def set_side_to_move(self, player: Player):
+        """
+        Đổi bên đi ở trạng thái hiện tại (vd: SGF cho một màu đi hai nước liền).
+        Chỉ đổi trạng thái đang đứng: node trong history (dùng chung cho mọi
+        biến rẽ ra từ đó) vẫn giữ bên đi cũ khi undo / đi tới lại.
+        """
+        if player is self.current_player:
+            return
+        self.cancel_bot_turn()
+        self.current_player = player
+        self._state_version += 1
+
+    # === Nạp ván có sẵn (vd: đọc SGF) ===
+
+    def set_up_position(
+        self,
+        black_stones: Iterable[Tuple[int, int]] = (),
+        white_stones: Iterable[Tuple[int, int]] = (),
+        current_player: Player = Player.BLACK,
+    ):
+        """
+        Bắt đầu lại ván từ thế cờ đặt sẵn (quân chấp, AB / AW của SGF) với
+        `current_player` đi trước. Lịch sử cũ bị xoá. Quân đặt vào ô đã có
+        quân, hoặc làm một nhóm hết khí -> ValueError (ván giữ nguyên).
+        """
+        board = self._new_board()
+        for player, stones in ((Player.BLACK, black_stones), (Player.WHITE, white_stones)):
+            for x, y in stones:
+                success, captured = board.place_stone(player, x, y)
+                if not success or captured:
+                    raise ValueError(f"Bad setup stone for {player.name} at {(x, y)}")
+        board.ko_point = None
+        self.cancel_bot_turn()
+        self._create_initial_state(board, current_player)
+
+    def play_move(self, player: Player, move: Optional[Tuple[int, int]]) -> bool:
+        """
+        Đánh nước của `player` (None = pass) bất kể chế độ chơi, không gọi bot.
+        Nếu đang là lượt màu kia thì đổi bên đi trước (SGF cho một màu đi hai
+        nước liền). Trả về False nếu nước không hợp lệ; khi đó bên đi giữ nguyên.
+        """
+        previous = self.current_player
+        self.set_side_to_move(player)
+        if move is None:
+            played = self.pass_turn()
+        else:
+            played = self._apply_move(player, *move)
+        if not played:
+            self.set_side_to_move(previous)
+        return played
+
+    def set_bot(self, bot: Any, color: Optional[Player] = None):
+        """Gán bot cho một màu quân (mặc định: `bot.color`, hoặc màu đối diện người chơi)."""
+        if color is None:
+            color = getattr(bot, "color", self.human_color.opposite)
+        self.bots[color] = bot
         self.bot = bot
 
     # === Truy vấn cơ bản ===
@@ -95,6 +250,8 @@ class GoGame:
     def is_human_turn(self) -> bool:
         if self.mode == GameMode.HUMAN_VS_HUMAN:
             return True
+        if self.mode == GameMode.BOT_VS_BOT:
+            return False
         return self.current_player == self.human_color
 
     def get_captures(self, player: Player) -> int:
@@ -103,38 +260,34 @@ class GoGame:
     # === Hợp lệ nước đi (bao gồm Ko) ===
 
     def get_legal_moves(self, player: Player) -> List[Tuple[int, int]]:
-        """Tính các nước đi hợp lệ cho `player` tại trạng thái hiện tại (bao gồm Ko)."""
-        moves: List[Tuple[int, int]] = []
-        size = self.board.size
-
-        # trạng thái "2 nước trước" để check Ko đơn (simple ko):
-        # cấm tạo lại hình cờ giống hệt vị trí chỉ một nước trước đó.
-        prev_board_grid = None
-        if self.current_index >= 1:
-            prev_board_grid = self.history[self.current_index - 1].board.grid
-
-        for y in range(size):
-            for x in range(size):
-                if self.board.get(x, y) != 0:
-                    continue
-
-                temp = self.board.copy()
-                success, _ = temp.place_stone(player, x, y)
-                if not success:
-                    continue
-
-                # Ko: cấm để bàn cờ sau khi đặt quân trùng với bàn ở "một nước trước đó"
-                if prev_board_grid is not None and temp.grid == prev_board_grid:
-                    continue
-
-                moves.append((x, y))
+        """
+        Tính các nước đi hợp lệ cho `player` tại trạng thái hiện tại (bao gồm Ko).
 
-        return moves
+        Không copy bàn cờ cho từng ô: `Board.legal_moves` quyết định từ số khí
+        của các nhóm kề. Kết quả được cache LRU theo (hash hình cờ, màu, khoá
+        ko), nên undo/redo quay lại các ply gần đây không phải tính lại.
+        """
+        forbidden, ko_key = self._ko_forbidden()
+        key = (self.board.hash, player.value, ko_key)
+        cache = self._legal_cache
+        packed = cache.get(key)
+        if packed is None:
+            moves = self.board.legal_moves(player, forbidden)
+            size = self.size
+            cache[key] = array("H", [y * size + x for x, y in moves])
+            if len(cache) > LEGAL_CACHE_SIZE:
+                cache.popitem(last=False)
+            return moves
+        cache.move_to_end(key)
+        points = self._points
+        return [points[i] for i in packed]
 
     # === Áp dụng nước đi (đặt quân) ===
 
     def _apply_move(self, player: Player, x: int, y: int) -> bool:
-        if self.is_over or player is not self.current_player:
+        # Không cần tính đủ is_over: khi bàn đầy / cả hai hết nước hợp lệ thì
+        # place_stone bên dưới cũng thất bại; chỉ còn resign & hai lượt pass
+        if self._is_over or self.pass_streak >= 2 or player is not self.current_player:
             return False
 
         # Tạo bản sao bàn cờ và thử đặt quân (check biên, trùng, tự sát, bắt quân)
@@ -143,12 +296,9 @@ class GoGame:
         if not success:
             return False
 
-        # Ko: cấm lặp lại hình cờ cách 1 nước
-        if self.current_index >= 1:
-            prev_board = self.history[self.current_index - 1].board
-            if temp_board.grid == prev_board.grid:
-                # vi phạm ko, không chấp nhận nước đi
-                return False
+        # Ko: cấm lặp lại hình cờ (ko đơn hoặc superko tuỳ `ko_rule`)
+        if self._violates_ko(temp_board.hash):
+            return False
 
         # Cập nhật số quân bắt được
         new_captures = dict(self.captures)
@@ -164,11 +314,8 @@ class GoGame:
             pass_streak=0,  # đặt quân -> reset chuỗi pass
         )
 
-        # Cắt bỏ nhánh redo nếu có, rồi append snapshot mới
-        self.history = self.history[: self.current_index + 1]
-        self.history.append(snapshot)
-        self.current_index += 1
-        self._load_snapshot(snapshot)
+        # Ghi ply mới (chỉ delta); nhánh redo cũ thành một biến trong cây
+        self._append_history(snapshot, player, captured)
 
         return True
 
@@ -189,12 +336,25 @@ class GoGame:
 
     # === Nước đi của bot ===
 
+    def play_bot_turn(self) -> bool:
+        """
+        BOT_VS_BOT (đồng bộ): bot của người đang tới lượt đi một nước.
+        Trả về False nếu ván đã kết thúc hoặc màu này chưa có bot.
+        """
+        if self.is_over or self.current_player not in self.bots:
+            return False
+        self._play_bot_turn()
+        return True
+
     def _play_bot_turn(self):
-        if self.mode != GameMode.HUMAN_VS_BOT or self.bot is None or self.is_over:
+        if self.mode == GameMode.HUMAN_VS_HUMAN or self.is_over:
             return
         if self.is_human_turn():
             # vẫn là lượt người (ví dụ sau undo)
             return
+        bot = self.bots.get(self.current_player)
+        if bot is None:
+            return
 
         legal = self.get_legal_moves(self.current_player)
         if not legal:
@@ -202,8 +362,19 @@ class GoGame:
             self.pass_turn()
             return
 
-        move = self.bot.select_move(self.board.copy(), legal)
+        if self.async_bot:
+            # Tính trên thread riêng, kết quả được áp dụng trong poll_bot_turn()
+            if self._bot_worker is None:
+                self._bot_worker = BotWorker()
+            self._bot_worker.submit(
+                bot, self.board.copy(), legal, token=self._state_version
+            )
+            return
+
+        move = bot.select_move(self.board.copy(), legal)
+        self._apply_bot_move(move)
 
+    def _apply_bot_move(self, move):
         if move == "RESIGN":
             self.resign(loser=self.current_player)
             return
@@ -216,6 +387,39 @@ class GoGame:
         x, y = move
         self._apply_move(self.current_player, x, y)
 
+    # === Bot bất đồng bộ ===
+
+    @property
+    def is_bot_thinking(self) -> bool:
+        return self._bot_worker is not None and self._bot_worker.busy
+
+    def poll_bot_turn(self) -> bool:
+        """
+        Gọi mỗi frame khi async_bot=True.
+        Trả về True nếu bot vừa đi (đặt quân / pass / resign).
+        Kết quả tính cho trạng thái cũ (sau undo, redo, resign...) bị bỏ qua.
+        """
+        if self._bot_worker is None:
+            return False
+        done = self._bot_worker.poll()
+        if done is None:
+            return False
+        token, move = done
+        if token != self._state_version or self.is_over:
+            return False
+        self._apply_bot_move(move)
+        return True
+
+    def cancel_bot_turn(self):
+        if self._bot_worker is not None:
+            self._bot_worker.cancel()
+
+    def shutdown_bot(self):
+        """Huỷ lượt bot đang tính và giải phóng thread (khi rời màn hình game)."""
+        if self._bot_worker is not None:
+            self._bot_worker.shutdown()
+            self._bot_worker = None
+
     # === Pass & resign ===
 
     def pass_turn(self) -> bool:
@@ -228,6 +432,7 @@ class GoGame:
         next_player = self.current_player.opposite
 
         board_copy = self.board.copy()
+        board_copy.ko_point = None  # sau khi pass không còn điểm ko
         snapshot = GameSnapshot(
             board=board_copy,
             current_player=next_player,
@@ -237,13 +442,27 @@ class GoGame:
             pass_streak=new_pass_streak,
         )
 
-        self.history = self.history[: self.current_index + 1]
-        self.history.append(snapshot)
-        self.current_index += 1
-        self._load_snapshot(snapshot)
+        self._append_history(snapshot, self.current_player, ())
 
         return True
 
+    def _append_history(self, snapshot: GameSnapshot, player: Player, captured):
+        # Nhánh redo cũ (nếu có) được giữ lại trong cây như một biến
+        self.history.play(
+            self.current_index,
+            snapshot.board,
+            player,
+            snapshot.last_move,
+            captured,
+            snapshot.current_player,
+            snapshot.captures_black,
+            snapshot.captures_white,
+            snapshot.pass_streak,
+        )
+        self.current_index += 1
+        self._push_line_hash(snapshot.board.hash)
+        self._load_snapshot(snapshot)
+
     def resign(self, loser: Optional[Player] = None):
         """
         Đầu hàng (resign). Ở đây ta chỉ đánh dấu ván cờ đã kết thúc.
@@ -251,11 +470,12 @@ class GoGame:
         """
         if loser is None:
             loser = self.current_player
+        self.cancel_bot_turn()
         # Không cần snapshot mới, chỉ đánh dấu kết thúc.
         self.is_over = True
-        # Có thể sau này bổ sung thêm thuộc tính self.winner nếu cần.
+        self.winner = loser.opposite
 
-    # === Undo / Redo ===
+    # === Undo / Redo & biến (variation) ===
 
     def can_undo(self) -> bool:
         return self.current_index > 0
@@ -266,6 +486,8 @@ class GoGame:
     def undo(self):
         if not self.can_undo():
             return
+        self.cancel_bot_turn()
+        self._pop_line_hash(self.history.hash_at(self.current_index))
         self.current_index -= 1
         snap = self.history[self.current_index]
         self._load_snapshot(snap)
@@ -273,9 +495,79 @@ class GoGame:
     def redo(self):
         if not self.can_redo():
             return
+        self.cancel_bot_turn()
         self.current_index += 1
-        snap = self.history[self.current_index]
-        self._load_snapshot(snap)
+        self._push_line_hash(self.history.hash_at(self.current_index))
+        self._load_snapshot(self.history[self.current_index])
+
+    @property
+    def current_node(self) -> PlyRecord:
+        """Node của trạng thái hiện tại trong cây nước đi."""
+        return self.history.record(self.current_index)
+
+    def variations(self) -> List[PlyRecord]:
+        """Các nước đi tiếp đã có từ trạng thái hiện tại (con trong cây)."""
+        return list(self.current_node.children)
+
+    def go_to_node(self, node: PlyRecord):
+        """Nhảy tới `node` bất kỳ trong cây; nhánh đang xem đi qua node đó."""
+        current = self.current_node
+        if node is current:
+            return
+        self.cancel_bot_turn()
+        self.current_index = self.history.select(node)
+
+        # Hash trên đường đi: bỏ phần từ node cũ lên tổ tiên chung, thêm phần đi xuống node mới
+        down: List[int] = []
+        while current.depth > node.depth:
+            self._pop_line_hash(current.hash)
+            current = current.parent
+        target = node
+        while target.depth > current.depth:
+            down.append(target.hash)
+            target = target.parent
+        while current is not target:
+            self._pop_line_hash(current.hash)
+            current = current.parent
+            down.append(target.hash)
+            target = target.parent
+        for position_hash in reversed(down):
+            self._push_line_hash(position_hash)
+
+        self._load_snapshot(self.history[self.current_index])
+
+    def go_to_parent(self):
+        self.undo()
+
+    def go_to_child(self, index: Optional[int] = None):
+        """Đi tới con thứ `index` của node hiện tại (None: như redo)."""
+        if index is None:
+            self.redo()
+            return
+        children = self.current_node.children
+        if not 0 <= index < len(children):
+            raise ValueError(f"No variation {index} (have {len(children)})")
+        self.go_to_node(children[index])
+
+    def go_to_sibling(self, step: int = 1) -> bool:
+        """
+        Chuyển sang biến anh em (cùng node cha) cách `step` vị trí, vòng lại
+        ở hai đầu. Trả về False nếu node hiện tại không có biến anh em.
+        """
+        node = self.current_node
+        if node.parent is None or len(node.parent.children) < 2:
+            return False
+        siblings = node.parent.children
+        self.go_to_node(siblings[(siblings.index(node) + step) % len(siblings)])
+        return True
+
+    def variation_position(self) -> Tuple[int, int]:
+        """(thứ tự 1-based của node hiện tại trong các biến anh em, số biến)."""
+        node = self.current_node
+        if node.parent is None:
+            return 1, 1
+        siblings = node.parent.children
+        return siblings.index(node) + 1, len(siblings)
 
     # === Tính điểm ===
 
@@ -285,6 +577,10 @@ class GoGame:
         - Là vùng trống kề cạnh với cả Đen & Trắng => không ai sở hữu.
         - Không xử lý seki / nhóm chết phức tạp.
         """
+        if self.use_numpy:
+            black, white = np_kernels.territory(np_kernels.board_array(self.board))
+            return {Player.BLACK: black, Player.WHITE: white}
+
         size = self.board.size
         visited: Set[Tuple[int, int]] = set()
         territory: Dict[Player, int] = {Player.BLACK: 0, Player.WHITE: 0}
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from core.board import Board, MoveRecord, Player
+
+# Cứ KEYFRAME_INTERVAL ply lại giữ một bản copy đầy đủ của bàn cờ
+KEYFRAME_INTERVAL = 32
+# Số bàn cờ dựng lại được giữ trong bộ nhớ (LRU, không tính keyframe)
+BOARD_CACHE_SIZE = 16
+
+_NO_CAPTURES: Tuple[Tuple[int, int], ...] = ()
+
+
+@dataclass
+class GameSnapshot:
+    board: Board
+    current_player: Player
+    captures_black: int
+    captures_white: int
+    last_move: Optional[Tuple[int, int]]
+    pass_streak: int  # số lượt pass liên tiếp (0,1,2...)
+
+
+class PlyRecord:
+    """
+    Một ply (node của cây nước đi), chỉ gồm phần thay đổi so với node cha:
+    nước đi (x, y = -1 nếu pass / trạng thái đầu), quân bị bắt, điểm ko
+    trước & sau, hash hình cờ và các bộ đếm của ván.
+
+    `children` là các biến (variation) đi tiếp từ node này, `active` là con
+    nằm trên nhánh đang xem gần nhất (redo đi theo con này).
+    """
+
+    __slots__ = (
+        "x", "y", "color", "captured", "prev_ko_point", "ko_point", "hash",
+        "current_player", "captures_black", "captures_white", "pass_streak",
+        "is_over", "parent", "children", "active", "depth", "keyframe",
+    )
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        color: int,
+        captured: Tuple[Tuple[int, int], ...],
+        prev_ko_point: Optional[Tuple[int, int]],
+        ko_point: Optional[Tuple[int, int]],
+        position_hash: int,
+        current_player: Player,
+        captures_black: int,
+        captures_white: int,
+        pass_streak: int,
+        parent: Optional["PlyRecord"] = None,
+    ):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.captured = captured
+        self.prev_ko_point = prev_ko_point
+        self.ko_point = ko_point
+        self.hash = position_hash
+        self.current_player = current_player
+        self.captures_black = captures_black
+        self.captures_white = captures_white
+        self.pass_streak = pass_streak
+        # GoGame._compute_is_over, tính lười rồi giữ lại (undo/redo không tính lại)
+        self.is_over: Optional[bool] = None
+        self.parent = parent
+        self.children: List[PlyRecord] = []
+        self.active: Optional[PlyRecord] = None
+        self.depth = 0 if parent is None else parent.depth + 1
+        # bàn cờ đầy đủ, chỉ có ở node có depth chia hết cho KEYFRAME_INTERVAL
+        self.keyframe: Optional[Board] = None
+
+    @property
+    def is_pass(self) -> bool:
+        return self.x < 0
+
+    @property
+    def last_move(self) -> Optional[Tuple[int, int]]:
+        return None if self.x < 0 else (self.x, self.y)
+
+    def same_move(self, x: int, y: int, color: int) -> bool:
+        return self.x == x and self.y == y and self.color == color
+
+
+class GameHistory:
+    """
+    Lịch sử ván cờ dạng cây nước đi: delta mỗi ply + keyframe.
+
+    - Mỗi node chỉ lưu một `PlyRecord` (vài số nguyên + các quân bị bắt);
+      các biến dùng chung các node tổ tiên.
+    - Đi nước mới sau khi undo không xoá nhánh redo cũ mà thêm một con mới
+      (biến); đi lại đúng nước đã có thì dùng lại node đó.
+    - Node có depth chia hết cho KEYFRAME_INTERVAL giữ một bàn cờ đầy đủ;
+      bàn ở node bất kỳ được dựng từ keyframe tổ tiên gần nhất rồi đánh lại
+      tối đa KEYFRAME_INTERVAL - 1 nước.
+    - Bàn đã dựng được memo theo node trong một LRU (tối đa `max_boards`
+      bàn, ngoài keyframe): quay lại node vừa xem không phải dựng lại, và
+      node kề (cha / con) một node đã có bàn chỉ cần copy rồi `play` /
+      `undo` một nước.
+
+    Chỉ số (`history[k]`, `len(history)`) tính trên nhánh đang xem: từ gốc
+    tới node hiện tại rồi tiếp tục theo `active` (phần redo).
+    `history[k]` trả về GameSnapshot; bàn cờ trong đó chỉ để đọc (có thể là
+    bàn đang nằm trong LRU).
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        current_player: Player = Player.BLACK,
+        max_boards: int = BOARD_CACHE_SIZE,
+    ):
+        if max_boards < 1:
+            raise ValueError("max_boards must be >= 1")
+        self.root = PlyRecord(
+            -1, -1, 0, _NO_CAPTURES, None, board.ko_point, board.hash,
+            current_player, 0, 0, 0,
+        )
+        self.root.keyframe = board.copy()
+        # nhánh đang xem: root -> ... -> lá theo `active`
+        self._line: List[PlyRecord] = [self.root]
+        self.max_boards = max_boards
+        # node -> bàn cờ đã dựng (LRU)
+        self._boards: "OrderedDict[PlyRecord, Board]" = OrderedDict()
+        self._remember(self.root, self.root.keyframe)
+
+    def __len__(self) -> int:
+        return len(self._line)
+
+    def __getitem__(self, index: int) -> GameSnapshot:
+        return self.snapshot(index)
+
+    def record(self, index: int) -> PlyRecord:
+        return self._line[index]
+
+    def hash_at(self, index: int) -> int:
+        return self._line[index].hash
+
+    # === Ghi ===
+
+    def play(
+        self,
+        index: int,
+        board: Board,
+        player: Player,
+        move: Optional[Tuple[int, int]],
+        captured,
+        current_player: Player,
+        captures_black: int,
+        captures_white: int,
+        pass_streak: int,
+    ) -> PlyRecord:
+        """
+        Thêm nước của `player` sau ply `index` của nhánh đang xem; `board` là
+        bàn SAU nước đi (move None = pass). Phần redo cũ sau `index` vẫn nằm
+        trong cây như một biến; nếu nước trùng với một con đã có thì đi vào
+        con đó (và nhánh redo của nó).
+        """
+        parent = self._line[index]
+        x, y = move if move is not None else (-1, -1)
+        # bỏ phần đuôi của nhánh đang xem (chỉ danh sách chỉ số, node vẫn trong cây)
+        if index + 1 < len(self._line):
+            del self._line[index + 1:]
+
+        for child in parent.children:
+            if child.same_move(x, y, player.value):
+                node = child
+                break
+        else:
+            node = PlyRecord(
+                x, y, player.value, tuple(captured) or _NO_CAPTURES,
+                parent.ko_point, board.ko_point, board.hash,
+                current_player, captures_black, captures_white, pass_streak,
+                parent,
+            )
+            if node.depth % KEYFRAME_INTERVAL == 0:
+                node.keyframe = board.copy()
+            parent.children.append(node)
+
+        parent.active = node
+        self._line.append(node)
+        self._extend_line()
+        self._remember(node, board)
+        return node
+
+    def select(self, node: PlyRecord) -> int:
+        """
+        Chọn nhánh đi qua `node` làm nhánh đang xem (root -> node -> tiếp theo
+        `active` của node). Trả về chỉ số của `node` trên nhánh mới.
+        """
+        path = []
+        step = node
+        while step.parent is not None:
+            step.parent.active = step
+            path.append(step)
+            step = step.parent
+        if step is not self.root:
+            raise ValueError("node is not in this history")
+        self._line = [self.root]
+        self._line.extend(reversed(path))
+        self._extend_line()
+        return node.depth
+
+    def _extend_line(self) -> None:
+        """Nối tiếp nhánh đang xem theo `active` của node cuối."""
+        node = self._line[-1].active
+        while node is not None:
+            self._line.append(node)
+            node = node.active
+
+    # === Đọc ===
+
+    def board_at(self, index: int) -> Board:
+        """Bàn cờ ở ply `index`. Không được sửa bàn trả về (có thể dùng chung)."""
+        if not 0 <= index < len(self._line):
+            raise IndexError(index)
+        return self.board_of(self._line[index])
+
+    def board_of(self, node: PlyRecord) -> Board:
+        """Bàn cờ tại `node` bất kỳ trong cây (chỉ để đọc, như `board_at`)."""
+        boards = self._boards
+        board = boards.get(node)
+        if board is not None:
+            boards.move_to_end(node)
+            return board
+
+        # node con đã có bàn -> lùi một nước
+        for child in node.children:
+            source = boards.get(child)
+            if source is not None:
+                board = source.copy()
+                self._rewind(board, child)
+                self._remember(node, board)
+                return board
+
+        # tổ tiên gần nhất có bàn (trong LRU hoặc keyframe) -> đánh lại xuống
+        path = []
+        start = node
+        while True:
+            source = boards.get(start)
+            if source is None:
+                source = start.keyframe
+            if source is not None:
+                break
+            path.append(start)
+            start = start.parent
+        board = source.copy()
+        for step in reversed(path):
+            self._replay(board, step)
+        self._remember(node, board)
+        return board
+
+    def _remember(self, node: PlyRecord, board: Board) -> None:
+        boards = self._boards
+        boards[node] = board
+        boards.move_to_end(node)
+        if len(boards) > self.max_boards:
+            boards.popitem(last=False)
+
+    def snapshot(self, index: int) -> GameSnapshot:
+        board = self.board_at(index)
+        record = self._line[index]
+        return GameSnapshot(
+            board=board,
+            current_player=record.current_player,
+            captures_black=record.captures_black,
+            captures_white=record.captures_white,
+            last_move=record.last_move,
+            pass_streak=record.pass_streak,
+        )
+
+    # === Nội bộ: đi tới / lùi một ply trên bàn ===
+
+    @staticmethod
+    def _replay(board: Board, record: PlyRecord) -> None:
+        if record.is_pass:
+            board.ko_point = None
+        else:
+            board.play(Player(record.color), record.x, record.y, check_ko=False)
+
+    @staticmethod
+    def _rewind(board: Board, record: PlyRecord) -> None:
+        """Bàn ở `record` -> bàn ở node cha."""
+        if record.is_pass:
+            board.ko_point = record.prev_ko_point
+            return
+        board.undo(MoveRecord(
+            record.x, record.y, record.color, list(record.captured),
+            record.prev_ko_point, record.hash ^ record.parent.hash,
+        ))
@@ -0,0 +1,180 @@
+"""
+Kernel NumPy (tuỳ chọn) cho đánh giá thế cờ và đếm lãnh thổ.
+
+Bàn cờ là mảng int8 (0 trống, 1 đen, 2 trắng); mọi hàm chạy trên hai trục
+cuối nên nhận được cả một bàn (N, N) lẫn một chồng bàn (K, N, N).
+Nếu không cài NumPy thì `HAS_NUMPY = False` và nơi gọi dùng bản Python.
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy không bắt buộc
+    np = None
+
+from core.board import Board
+
+HAS_NUMPY = np is not None
+
+
+def board_array(board: Board) -> "np.ndarray":
+    """Bàn cờ -> mảng int8 (N, N), index [y, x]."""
+    cells = getattr(board, "cells", None)
+    if cells is not None:
+        # FlatBoard: cắt bỏ viền khỏi buffer, không duyệt từng ô
+        width = board.width
+        flat = np.frombuffer(bytes(cells), dtype=np.int8).reshape(width, width)
+        return flat[1:-1, 1:-1].copy()
+    return np.array(board.grid, dtype=np.int8)
+
+
+# === Dịch mảng theo 4 hướng (ô ngoài biên nhận `fill`) ===
+
+def _shifted(arr: "np.ndarray", fill) -> Tuple["np.ndarray", ...]:
+    """Giá trị của láng giềng trái / phải / trên / dưới cho từng ô."""
+    h, w = arr.shape[-2:]
+    # tự tạo viền (np.pad chậm hơn nhiều với mảng nhỏ như bàn cờ)
+    p = np.full(arr.shape[:-2] + (h + 2, w + 2), fill, dtype=arr.dtype)
+    p[..., 1:-1, 1:-1] = arr
+    return (
+        p[..., 1:-1, :-2],  # (x - 1, y)
+        p[..., 1:-1, 2:],   # (x + 1, y)
+        p[..., :-2, 1:-1],  # (x, y - 1)
+        p[..., 2:, 1:-1],   # (x, y + 1)
+    )
+
+
+def label_regions(values: "np.ndarray", mask: "np.ndarray") -> "np.ndarray":
+    """
+    Gán nhãn các vùng liên thông (4 hướng) gồm các ô `mask` cùng giá trị `values`.
+
+    Nhãn = 1 + index phẳng nhỏ nhất của vùng (0 = ngoài mask), nên nhãn của
+    các bàn trong một chồng không trùng nhau. Lan nhãn nhỏ nhất sang láng
+    giềng rồi "nhảy con trỏ" (label -> label của ô đại diện) tới khi ổn định.
+    """
+    big = np.iinfo(np.int64).max
+    total = values.size
+    labels = np.where(mask, np.arange(1, total + 1, dtype=np.int64).reshape(values.shape), big)
+    same = [
+        (nv == values) & nm
+        for nv, nm in zip(_shifted(values, -1), _shifted(mask, False))
+    ]
+    while True:
+        new = labels
+        for nl, ok in zip(_shifted(labels, big), same):
+            new = np.where(ok & (nl < new), nl, new)
+        new = np.where(mask, new, big)
+        # nhảy con trỏ: nhãn của ô đại diện luôn <= nhãn hiện tại
+        flat = new.reshape(-1)
+        inside = flat != big
+        flat[inside] = flat[flat[inside] - 1]
+        if np.array_equal(new, labels):
+            break
+        labels = new
+    return np.where(mask, labels, 0)
+
+
+# === Đánh giá (cùng công thức với HeuristicMinimaxBot._evaluate) ===
+
+def evaluate_terms(arr: "np.ndarray", me: int) -> Tuple["np.ndarray", ...]:
+    """
+    (stone_diff, territory_diff, capture_bonus, group_penalty) cho `me`,
+    mỗi phần tử có shape = arr.shape[:-2].
+    """
+    opp = 3 - me
+    axes = (-2, -1)
+    stone_diff = (arr == me).sum(axis=axes) - (arr == opp).sum(axis=axes)
+
+    # ô trống kề quân của đúng một màu (OR bit: 1 đen, 2 trắng, 3 cả hai)
+    neighbor_bits = np.zeros(arr.shape, dtype=np.int8)
+    for nv in _shifted(arr, 0):
+        neighbor_bits |= nv
+    empty = arr == 0
+    territory_diff = (
+        (empty & (neighbor_bits == me)).sum(axis=axes)
+        - (empty & (neighbor_bits == opp)).sum(axis=axes)
+    )
+
+    # số khí của từng nhóm = số ô trống KHÁC NHAU kề nhóm
+    stones = arr != 0
+    labels = label_regions(arr, stones)
+    total = arr.size
+    cell_index = np.arange(total, dtype=np.int64).reshape(arr.shape)
+    pairs = []
+    for nl in _shifted(labels, 0):
+        hit = empty & (nl > 0)
+        pairs.append(nl[hit] * total + cell_index[hit])
+    pairs = np.unique(np.concatenate(pairs))
+    liberty_counts = np.bincount(pairs // total, minlength=total + 1)
+
+    # nhóm đang bị atari: đại diện (ô có index = nhãn - 1) có đúng 1 khí
+    flat_labels = labels.reshape(-1)
+    is_root = stones.reshape(-1) & (flat_labels == np.arange(1, total + 1))
+    atari_root = (is_root & (liberty_counts[flat_labels] == 1)).reshape(arr.shape)
+    capture_bonus = 8 * (atari_root & (arr == opp)).sum(axis=axes)
+    group_penalty = -8 * (atari_root & (arr == me)).sum(axis=axes)
+
+    return stone_diff, territory_diff, capture_bonus, group_penalty
+
+
+def evaluate(arr: "np.ndarray", me: int) -> float:
+    stone_diff, territory_diff, capture_bonus, group_penalty = evaluate_terms(arr, me)
+    # cộng bằng số Python theo đúng thứ tự -> trùng bit với bản thuần Python
+    return (
+        1.5 * int(stone_diff)
+        + 0.6 * int(territory_diff)
+        + int(capture_bonus)
+        + int(group_penalty)
+    )
+
+
+def evaluate_batch(boards: "np.ndarray", me: int) -> List[float]:
+    """Điểm của cả chồng bàn (K, N, N) trong một lần gọi, từng giá trị giống `evaluate`."""
+    terms = evaluate_terms(boards, me)
+    return [
+        1.5 * sd + 0.6 * td + cb + gp
+        for sd, td, cb, gp in zip(*(t.tolist() for t in terms))
+    ]
+
+
+def stack_children(
+    base: "np.ndarray",
+    color: int,
+    children: Sequence[Tuple[int, int, Sequence[Tuple[int, int]]]],
+) -> "np.ndarray":
+    """
+    Chồng (K, N, N) các bàn con của `base`: mỗi phần tử (x, y, captured)
+    là một nước của `color` tại (x, y) bắt các quân `captured`.
+    """
+    stack = np.repeat(base[np.newaxis], len(children), axis=0)
+    for k, (x, y, captured) in enumerate(children):
+        stack[k, y, x] = color
+        for cx, cy in captured:
+            stack[k, cy, cx] = 0
+    return stack
+
+
+# === Lãnh thổ (cùng luật với GoGame._territory) ===
+
+def territory(arr: "np.ndarray") -> Tuple[int, int]:
+    """(lãnh thổ đen, lãnh thổ trắng): vùng trống chỉ giáp quân của một màu."""
+    empty = arr == 0
+    labels = label_regions(arr, empty)
+    neighbor_bits = np.zeros(arr.shape, dtype=np.int8)
+    for nv in _shifted(arr, 0):
+        neighbor_bits |= nv
+
+    # vùng giáp đen / trắng nếu có ít nhất một ô của vùng kề quân màu đó
+    region = labels[empty]
+    bits = neighbor_bits[empty]
+    size = arr.size + 1
+    touches_black = np.bincount(region, weights=bits & 1, minlength=size) > 0
+    touches_white = np.bincount(region, weights=bits & 2, minlength=size) > 0
+    owner = np.where(touches_black, 1, 0) + np.where(touches_white, 2, 0)
+    owner = owner[labels]
+    black = int((empty & (owner == 1)).sum())
+    white = int((empty & (owner == 2)).sum())
+    return black, white
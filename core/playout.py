@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import random
+from typing import List, Optional
+
+from core.board import Board, Player
+from core.flat_board import BORDER
+
+# Giá trị trả về của `random_move` khi không còn nước nào (pass)
+PASS = -1
+
+
+class PlayoutBoard:
+    """
+    Bàn cờ tối giản chỉ dùng cho playout ngẫu nhiên (rollout MCTS, self-play).
+
+    - `cells`: mảng 1 chiều có viền như FlatBoard, ô (x, y) ở index
+      (y + 1) * (size + 2) + (x + 1).
+    - Chuỗi quân = union-find (`parent`) + danh sách vòng (`next_stone`) để
+      duyệt quân khi bị bắt. Gốc của chuỗi giữ "khí giả" (mỗi cặp quân/ô trống
+      kề nhau tính một lần) cùng tổng và tổng bình phương index các khí đó:
+      chuỗi bị atari <=> mọi khí giả là cùng một ô <=> libs * sq == sum^2.
+    - `empties` + `empty_pos`: danh sách ô trống, thêm / xoá O(1) bằng cách
+      đổi chỗ với phần tử cuối.
+    - Không có hash, không superko, không undo: chỉ đánh tới cuối ván.
+
+    Không đi vào "mắt" của chính mình (ô trống mà cả 4 láng giềng là quân
+    mình hoặc viền), cùng luật với `MCTSBot._is_own_eye`.
+    """
+
+    __slots__ = (
+        "size", "width", "offsets", "cells", "parent", "next_stone",
+        "libs", "lib_sum", "lib_sq", "empties", "empty_pos", "ko",
+    )
+
+    def __init__(self, size: int):
+        if size < 5:
+            raise ValueError("Board size must be at least 5x5.")
+        width = size + 2
+        total = width * width
+        self.size = size
+        self.width = width
+        self.offsets = (-1, 1, -width, width)
+        self.cells = [BORDER] * total
+        self.parent = list(range(total))
+        self.next_stone = list(range(total))
+        self.libs = [0] * total
+        self.lib_sum = [0] * total
+        self.lib_sq = [0] * total
+        self.empty_pos = [-1] * total
+        self.empties: List[int] = []
+        self.ko = 0
+        for y in range(size):
+            for x in range(size):
+                p = (y + 1) * width + x + 1
+                self.cells[p] = 0
+                self.empty_pos[p] = len(self.empties)
+                self.empties.append(p)
+
+    @classmethod
+    def from_board(cls, board: Board) -> "PlayoutBoard":
+        """Dựng từ một Board bất kỳ (grid / flat / chains), kể cả điểm ko."""
+        pb = cls(board.size)
+        width = pb.width
+        for y in range(board.size):
+            for x in range(board.size):
+                v = board.get(x, y)
+                if v:
+                    pb._put(v, (y + 1) * width + x + 1)
+        if board.ko_point is not None:
+            kx, ky = board.ko_point
+            pb.ko = (ky + 1) * width + kx + 1
+        return pb
+
+    def copy(self) -> "PlayoutBoard":
+        new = PlayoutBoard.__new__(PlayoutBoard)
+        new.size = self.size
+        new.width = self.width
+        new.offsets = self.offsets
+        new.cells = self.cells[:]
+        new.parent = self.parent[:]
+        new.next_stone = self.next_stone[:]
+        new.libs = self.libs[:]
+        new.lib_sum = self.lib_sum[:]
+        new.lib_sq = self.lib_sq[:]
+        new.empties = self.empties[:]
+        new.empty_pos = self.empty_pos[:]
+        new.ko = self.ko
+        return new
+
+    # === Union-find ===
+
+    def _find(self, p: int) -> int:
+        parent = self.parent
+        while parent[p] != p:
+            parent[p] = parent[parent[p]]  # path halving
+            p = parent[p]
+        return p
+
+    def _in_atari(self, root: int) -> bool:
+        libs = self.libs[root]
+        return libs > 0 and libs * self.lib_sq[root] == self.lib_sum[root] ** 2
+
+    # === Nước đi ===
+
+    def is_eye(self, p: int, color: int) -> bool:
+        cells = self.cells
+        for d in self.offsets:
+            v = cells[p + d]
+            if v != color and v != BORDER:
+                return False
+        return True
+
+    def is_legal(self, p: int, color: int) -> bool:
+        """Ô trống `p` không phải ko và không tự sát."""
+        if p == self.ko:
+            return False
+        cells = self.cells
+        for d in self.offsets:
+            n = p + d
+            v = cells[n]
+            if v == 0:
+                return True
+            if v == BORDER:
+                continue
+            in_atari = self._in_atari(self._find(n))
+            # nối vào chuỗi mình còn khí khác, hoặc bắt chuỗi địch đang atari
+            if (v == color) != in_atari:
+                return True
+        return False
+
+    def play(self, p: int, color: int) -> None:
+        """Đặt quân tại `p` (đã kiểm tra hợp lệ), bắt quân và cập nhật ko."""
+        captured = self._put(color, p)
+        self.ko = 0
+        if captured is not None:
+            root = self._find(p)
+            if self.next_stone[p] == p and self.libs[root] == 1:
+                self.ko = captured
+
+    def random_move(self, color: int, rng: random.Random) -> int:
+        """Chọn ngẫu nhiên một nước hợp lệ không lấp mắt; PASS nếu không có."""
+        empties = self.empties
+        empty_pos = self.empty_pos
+        cells = self.cells
+        parent = self.parent
+        libs = self.libs
+        lib_sum = self.lib_sum
+        lib_sq = self.lib_sq
+        offsets = self.offsets
+        ko = self.ko
+        rand = rng.random
+        n = len(empties)
+        while n:
+            i = int(rand() * n)
+            p = empties[i]
+            if p != ko:
+                # is_eye + is_legal viết gộp tại chỗ (vòng lặp nóng nhất của playout)
+                eye = True
+                for d in offsets:
+                    v = cells[p + d]
+                    if v != color and v != BORDER:
+                        eye = False
+                        break
+                if not eye:
+                    for d in offsets:
+                        q = p + d
+                        v = cells[q]
+                        if v == 0:
+                            return p
+                        if v == BORDER:
+                            continue
+                        while parent[q] != q:
+                            q = parent[q]
+                        count = libs[q]
+                        # nối chuỗi mình còn khí khác, hoặc bắt chuỗi địch đang atari
+                        if (v == color) != (count * lib_sq[q] == lib_sum[q] * lib_sum[q]):
+                            return p
+            # đẩy ô đã thử ra sau vùng [0, n): vẫn là ô trống, chỉ đổi thứ tự
+            n -= 1
+            q = empties[n]
+            empties[i] = q
+            empties[n] = p
+            empty_pos[q] = i
+            empty_pos[p] = n
+        return PASS
+
+    def playout(self, color: int, rng: random.Random, max_moves: Optional[int] = None) -> int:
+        """Đánh ngẫu nhiên (bắt đầu bằng `color`) tới khi hai bên pass liên tiếp; trả về số nước."""
+        if max_moves is None:
+            max_moves = 3 * self.size * self.size
+        passes = 0
+        moves = 0
+        while passes < 2 and moves < max_moves:
+            p = self.random_move(color, rng)
+            if p == PASS:
+                passes += 1
+            else:
+                self.play(p, color)
+                passes = 0
+            color = 3 - color
+            moves += 1
+        return moves
+
+    def area_score(self) -> List[int]:
+        """[_, đen, trắng]: quân + ô trống chỉ kề một màu (không tính komi)."""
+        cells = self.cells
+        offsets = self.offsets
+        score = [0, 0, 0]
+        for y in range(self.size):
+            start = (y + 1) * self.width + 1
+            for p in range(start, start + self.size):
+                v = cells[p]
+                if v == 0:
+                    colors = 0
+                    for d in offsets:
+                        n = cells[p + d]
+                        if n != BORDER:
+                            colors |= n
+                    if colors == 1 or colors == 2:
+                        score[colors] += 1
+                else:
+                    score[v] += 1
+        return score
+
+    def winner(self, komi: float) -> Player:
+        score = self.area_score()
+        return Player.BLACK if score[1] > score[2] + komi else Player.WHITE
+
+    # === Nội bộ ===
+
+    def _remove_empty(self, p: int) -> None:
+        empties = self.empties
+        empty_pos = self.empty_pos
+        i = empty_pos[p]
+        last = empties.pop()
+        if last != p:
+            empties[i] = last
+            empty_pos[last] = i
+        empty_pos[p] = -1
+
+    def _add_lib(self, root: int, p: int) -> None:
+        self.libs[root] += 1
+        self.lib_sum[root] += p
+        self.lib_sq[root] += p * p
+
+    def _put(self, color: int, p: int) -> Optional[int]:
+        """
+        Đặt quân, gộp chuỗi, bắt chuỗi địch hết khí.
+        Trả về ô của quân bị bắt nếu bắt đúng 1 quân (ứng viên ko), ngược lại None.
+        """
+        cells = self.cells
+        parent = self.parent
+        next_stone = self.next_stone
+        libs = self.libs
+        lib_sum = self.lib_sum
+        lib_sq = self.lib_sq
+        find = self._find
+        enemy = 3 - color
+        p_sq = p * p
+
+        self._remove_empty(p)
+        cells[p] = color
+        parent[p] = p
+        next_stone[p] = p
+        libs[p] = lib_sum[p] = lib_sq[p] = 0
+
+        # khí giả của quân mới; các chuỗi kề mất khí p
+        for d in self.offsets:
+            n = p + d
+            v = cells[n]
+            if v == 0:
+                libs[p] += 1
+                lib_sum[p] += n
+                lib_sq[p] += n * n
+            elif v != BORDER:
+                r = find(n)
+                libs[r] -= 1
+                lib_sum[r] -= p
+                lib_sq[r] -= p_sq
+
+        # gộp vào chuỗi mình đang kề, bắt chuỗi địch hết khí
+        root = p
+        captured_count = 0
+        captured_point = None
+        for d in self.offsets:
+            n = p + d
+            v = cells[n]
+            if v == color:
+                r = find(n)
+                if r == root:
+                    continue
+                parent[root] = r
+                libs[r] += libs[root]
+                lib_sum[r] += lib_sum[root]
+                lib_sq[r] += lib_sq[root]
+                next_stone[r], next_stone[root] = next_stone[root], next_stone[r]
+                root = r
+            elif v == enemy:
+                r = find(n)
+                if libs[r] == 0:
+                    captured_count += self._capture(r, color)
+                    captured_point = n
+        return captured_point if captured_count == 1 else None
+
+    def _capture(self, root: int, color: int) -> int:
+        """Nhấc chuỗi `root`; các chuỗi `color` kề nó được cộng khí. Trả về số quân."""
+        cells = self.cells
+        parent = self.parent
+        next_stone = self.next_stone
+        empties = self.empties
+        empty_pos = self.empty_pos
+        offsets = self.offsets
+        find = self._find
+
+        stones = []
+        s = root
+        while True:
+            stones.append(s)
+            s = next_stone[s]
+            if s == root:
+                break
+        for s in stones:
+            cells[s] = 0
+        for s in stones:
+            parent[s] = s
+            next_stone[s] = s
+            empty_pos[s] = len(empties)
+            empties.append(s)
+            for d in offsets:
+                n = s + d
+                if cells[n] == color:
+                    self._add_lib(find(n), s)
+        return len(stones)
@@ -0,0 +1,427 @@
+"""
+Đọc / ghi ván cờ dạng SGF (FF[4], GM[1]).
+
+    save_sgf(game, "game.sgf")
+    game = load_sgf("game.sgf")
+    for tree in iter_game_trees("database.sgf"):   # từng ván, không đọc cả file
+        ...
+
+- Ghi: SZ, KM, PL, AB/AW (thế cờ đặt sẵn ở gốc), RE (khi có người resign:
+  B+R / W+R, đọc lại thành `winner` ở cuối nhánh chính),
+  toàn bộ cây nước đi (nhánh chính = con đầu tiên, các biến lồng trong
+  ngoặc). `write_captures=True` ghi thêm ở cuối mỗi nhánh hai thuộc tính
+  riêng CAPB / CAPW (số quân Đen / Trắng đã bắt); mặc định không ghi.
+- Đọc: parser chạy theo luồng - file được đọc theo từng khối, mỗi ván
+  (GameTree ngoài cùng) được trả về ngay khi đóng ngoặc, nên có thể duyệt cả
+  một cơ sở dữ liệu ván cờ lớn mà chỉ giữ một ván trong bộ nhớ.
+- Khi dựng GoGame, mỗi nước được đánh lại bằng luật của GoGame (hợp lệ, bắt
+  quân, ko); nước không hợp lệ -> SgfError. CAPB / CAPW là tuỳ chọn, nhưng
+  nếu có mà không khớp số quân bắt được khi đánh lại -> SgfError.
+- Chỉ nhận bàn vuông từ MIN_SIZE tới MAX_SIZE (toạ độ SGF là một chữ a-z).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+from core.board import Player
+from core.game import GameMode, GoGame
+from core.history import PlyRecord
+
+# Số ký tự đọc mỗi lần từ file
+CHUNK_SIZE = 1 << 16
+
+# Kích thước bàn đọc được: Board cần >= 5, toạ độ SGF một chữ a-z chỉ tới 26
+MIN_SIZE = 5
+MAX_SIZE = 26
+
+# Thuộc tính riêng (không chuẩn, tuỳ chọn): số quân đã bắt, đối chiếu khi đọc lại
+CAPTURES_PROPS = {Player.BLACK: "CAPB", Player.WHITE: "CAPW"}
+
+_COLOR_PROPS = {"B": Player.BLACK, "W": Player.WHITE}
+_SETUP_PROPS = ("AB", "AW", "AE")
+# RE mà game_to_sgf ghi (người thắng + "R" = đối phương resign)
+_RESIGN_RESULT = re.compile(r"\s*([BW])\+R(?:esign)?\s*$", re.IGNORECASE)
+
+# Một token: dấu ; ( ) | tên thuộc tính | giá trị trong [...] (cho phép "\]")
+_TOKEN = re.compile(r"\s*(?:([;()])|([A-Za-z]+)|\[([^\]\\]*(?:\\.[^\]\\]*)*)\])", re.DOTALL)
+_SOFT_BREAK = re.compile(r"\\\r?\n")
+_ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+
+
+class SgfError(ValueError):
+    """File SGF sai cú pháp hoặc ván cờ trong đó không đánh lại được."""
+
+
+class SgfNode:
+    """Một node SGF: các thuộc tính (tên -> danh sách giá trị) và các node con."""
+
+    __slots__ = ("properties", "children")
+
+    def __init__(self):
+        self.properties: Dict[str, List[str]] = {}
+        self.children: List[SgfNode] = []
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        values = self.properties.get(name)
+        return values[0] if values else default
+
+
+# === Parser theo luồng ===
+
+class _Reader:
+    """Đọc file theo từng khối; chỉ giữ phần chưa xử lý của khối hiện tại."""
+
+    def __init__(self, fp: IO[str], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        data = self.fp.read(self.chunk_size)
+        if not data:
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def skip_to_tree(self) -> bool:
+        """Bỏ qua văn bản tới dấu '(' tiếp theo (đã đọc). False nếu hết file."""
+        while True:
+            start = self.buf.find("(", self.pos)
+            if start >= 0:
+                self.pos = start + 1
+                return True
+            self.pos = len(self.buf)
+            if not self._fill():
+                return False
+
+    def token(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Token tiếp theo: (dấu, tên thuộc tính, giá trị), đúng một phần khác
+        None; (None, None, None) nếu hết file.
+        """
+        while True:
+            match = _TOKEN.match(self.buf, self.pos)
+            # token chạm cuối khối có thể còn dở (tên / giá trị bị cắt đôi)
+            if match is None or match.end() == len(self.buf):
+                rest = self.buf[self.pos:].lstrip()
+                if match is None and rest and rest[0] != "[":
+                    raise SgfError(f"Unexpected character {rest[0]!r}")
+                if self._fill():
+                    continue
+                if match is None:
+                    if rest:
+                        raise SgfError("Unterminated property value")
+                    return None, None, None
+            self.pos = match.end()
+            return match.group(1, 2, 3)
+
+
+def parse_game_trees(fp: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[SgfNode]:
+    """
+    Generator: trả về node gốc của từng GameTree ngoài cùng trong `fp` (một
+    collection có thể chứa nhiều ván). Văn bản ngoài các GameTree bị bỏ qua.
+    """
+    reader = _Reader(fp, chunk_size)
+    while reader.skip_to_tree():
+        root: Optional[SgfNode] = None
+        current: Optional[SgfNode] = None
+        values: Optional[List[str]] = None
+        # node rẽ nhánh của từng cặp ngoặc đang mở
+        branch_points: List[Optional[SgfNode]] = [None]
+        while branch_points:
+            char, ident, value = reader.token()
+            if value is not None:
+                if values is None:
+                    raise SgfError("Property value without a name")
+                if "\\" in value:
+                    value = _ESCAPE.sub(r"\1", _SOFT_BREAK.sub("", value))
+                values.append(value)
+                continue
+            if values is not None and not values:
+                raise SgfError("Property without value")
+            if ident is not None:
+                if current is None:
+                    raise SgfError("Property outside of a node")
+                # FF[3] cho phép chữ thường trong tên (vd: "AddBlack" = AB)
+                if not ident.isupper():
+                    ident = "".join(c for c in ident if c.isupper())
+                values = current.properties.setdefault(ident, [])
+                continue
+            values = None
+            if char == ";":
+                node = SgfNode()
+                if current is None:
+                    if root is not None:
+                        raise SgfError("Game tree has more than one root node")
+                    root = node
+                else:
+                    current.children.append(node)
+                current = node
+            elif char == "(":
+                if current is None:
+                    raise SgfError("Variation before the first node")
+                branch_points.append(current)
+            elif char == ")":
+                current = branch_points.pop()
+            else:
+                raise SgfError("Unexpected end of file inside a game tree")
+        if root is None:
+            raise SgfError("Empty game tree")
+        yield root
+
+
+def iter_game_trees(
+    source: Union[str, IO[str]], encoding: str = "utf-8", chunk_size: int = CHUNK_SIZE
+) -> Iterator[SgfNode]:
+    """Như `parse_game_trees`, nhận đường dẫn file hoặc file đã mở (chế độ text)."""
+    if isinstance(source, str):
+        with open(source, encoding=encoding, errors="replace") as fp:
+            yield from parse_game_trees(fp, chunk_size)
+    else:
+        yield from parse_game_trees(source, chunk_size)
+
+
+# === SGF -> GoGame ===
+
+def _decode_point(value: str, size: int) -> Optional[Tuple[int, int]]:
+    """Điểm SGF "cd" -> (2, 3); "" hoặc "tt" (bàn <= 19) -> None (pass)."""
+    if value == "" or (value == "tt" and size <= 19):
+        return None
+    if len(value) != 2:
+        raise SgfError(f"Bad point {value!r}")
+    x = ord(value[0]) - ord("a")
+    y = ord(value[1]) - ord("a")
+    if not (0 <= x < size and 0 <= y < size):
+        raise SgfError(f"Point {value!r} outside a {size}x{size} board")
+    return x, y
+
+
+def _decode_points(values: List[str], size: int) -> List[Tuple[int, int]]:
+    """Danh sách điểm, gồm cả dạng hình chữ nhật nén "aa:cc"."""
+    points = []
+    for value in values:
+        first, _, last = value.partition(":")
+        a = _decode_point(first, size)
+        b = _decode_point(last, size) if last else a
+        if a is None or b is None:
+            raise SgfError(f"Bad point list entry {value!r}")
+        for y in range(min(a[1], b[1]), max(a[1], b[1]) + 1):
+            for x in range(min(a[0], b[0]), max(a[0], b[0]) + 1):
+                points.append((x, y))
+    return points
+
+
+def _board_size(root: SgfNode) -> int:
+    value = root.get("SZ", "19")
+    width, _, height = value.partition(":")
+    try:
+        size = int(width)
+        square = not height or int(height) == size
+    except ValueError:
+        raise SgfError(f"Bad board size SZ[{value}]") from None
+    if not square:
+        raise SgfError(f"Only square boards are supported (SZ[{value}])")
+    if not MIN_SIZE <= size <= MAX_SIZE:
+        raise SgfError(f"Unsupported board size SZ[{value}] (only {MIN_SIZE}..{MAX_SIZE})")
+    return size
+
+
+def _setup_root(game: GoGame, root: SgfNode):
+    """Thế cờ đặt sẵn ở gốc (AB / AW, vd: quân chấp) và PL."""
+    black = _decode_points(root.properties.get("AB", []), game.size)
+    white = _decode_points(root.properties.get("AW", []), game.size)
+    to_play = root.get("PL")
+    if to_play is not None:
+        if to_play.upper() not in _COLOR_PROPS:
+            raise SgfError(f"Bad PL[{to_play}]")
+        player = _COLOR_PROPS[to_play.upper()]
+    else:
+        # không ghi PL (vd: ván chấp, Trắng đi trước): lấy màu của nước đầu tiên
+        player = Player.BLACK
+        node: Optional[SgfNode] = root
+        while node is not None:
+            first = [p for prop, p in _COLOR_PROPS.items() if prop in node.properties]
+            if first:
+                player = first[0]
+                break
+            node = node.children[0] if node.children else None
+    try:
+        game.set_up_position(black, white, player)
+    except ValueError as e:
+        raise SgfError(str(e)) from None
+
+
+def _play_node(game: GoGame, node: SgfNode, is_root: bool = False):
+    """Đánh nước đi của `node` (nếu có) từ trạng thái hiện tại của `game`."""
+    for prop in _SETUP_PROPS:
+        if not is_root and prop in node.properties:
+            raise SgfError(f"Setup property {prop} outside the root node is not supported")
+    moves = [(prop, player) for prop, player in _COLOR_PROPS.items() if prop in node.properties]
+    if len(moves) > 1:
+        raise SgfError("Node has both a black and a white move")
+    if moves:
+        prop, player = moves[0]
+        # chỉ xét hai lượt pass: tính đủ is_over cho mọi ply là quá đắt
+        if game.pass_streak >= 2:
+            raise SgfError(f"Move {prop}[{node.get(prop)}] after the game ended")
+        point = _decode_point(node.get(prop), game.size)
+        # SGF cho phép một màu đi hai lần liên tiếp (vd: đặt quân chấp từng nước)
+        if not game.play_move(player, point):
+            raise SgfError(f"Illegal move {prop}[{node.get(prop)}] at ply {game.current_index + 1}")
+
+    for player, prop in CAPTURES_PROPS.items():
+        value = node.get(prop)
+        if value is not None and value.strip() != str(game.captures[player]):
+            raise SgfError(
+                f"{prop}[{value}] does not match {game.captures[player]} captured stones "
+                f"at ply {game.current_index}"
+            )
+
+
+def game_from_sgf(
+    root: SgfNode,
+    game: Optional[GoGame] = None,
+    mode: GameMode = GameMode.HUMAN_VS_HUMAN,
+    **game_kwargs,
+) -> GoGame:
+    """
+    Dựng GoGame từ một GameTree: cả nhánh chính lẫn các biến, KM -> `komi`.
+    Truyền `game` để nạp vào ván có sẵn (giữ bot, chế độ...; kích thước bàn
+    phải khớp). Sau khi đọc, ván đứng ở cuối nhánh chính; RE[B+R] / RE[W+R]
+    -> bên kia resign ở đó.
+    """
+    if root.get("GM", "1") != "1":
+        raise SgfError(f"Not a Go game (GM[{root.get('GM')}])")
+    size = _board_size(root)
+    if game is None:
+        game = GoGame(size, mode, **game_kwargs)
+    elif game.size != size:
+        raise SgfError(f"Board size {size} does not match the game ({game.size})")
+    else:
+        game.cancel_bot_turn()
+
+    komi = root.get("KM")
+    if komi is not None and komi.strip():
+        try:
+            game.komi = float(komi)
+        except ValueError:
+            raise SgfError(f"Bad komi KM[{komi}]") from None
+    _setup_root(game, root)
+
+    # duyệt sâu, không đệ quy (ván dài + nhiều biến)
+    stack: List[Tuple[SgfNode, PlyRecord]] = [(root, game.current_node)]
+    while stack:
+        node, parent = stack.pop()
+        game.go_to_node(parent)
+        _play_node(game, node, node is root)
+        here = game.current_node
+        for child in reversed(node.children):
+            stack.append((child, here))
+
+    main_line = game.history.root
+    while main_line.children:
+        main_line = main_line.children[0]
+    game.go_to_node(main_line)
+
+    result = _RESIGN_RESULT.match(root.get("RE", ""))
+    if result:
+        game.resign(_COLOR_PROPS[result.group(1).upper()].opposite)
+    return game
+
+
+def iter_sgf_games(source: Union[str, IO[str]], encoding: str = "utf-8", **game_kwargs) -> Iterator[GoGame]:
+    """Generator: từng ván trong file SGF (collection) dưới dạng GoGame."""
+    for root in iter_game_trees(source, encoding):
+        yield game_from_sgf(root, **game_kwargs)
+
+
+def load_sgf(path: str, encoding: str = "utf-8", **game_kwargs) -> GoGame:
+    """Ván đầu tiên trong file SGF."""
+    for game in iter_sgf_games(path, encoding, **game_kwargs):
+        return game
+    raise SgfError(f"No game in {path}")
+
+
+# === GoGame -> SGF ===
+
+def _encode_point(x: int, y: int) -> str:
+    return chr(ord("a") + x) + chr(ord("a") + y)
+
+
+def _format_komi(komi: float) -> str:
+    return str(int(komi)) if float(komi).is_integer() else str(komi)
+
+
+def _root_properties(game: GoGame) -> str:
+    root = game.history.root
+    parts = [
+        "FF[4]GM[1]CA[UTF-8]AP[GoGame]",
+        f"SZ[{game.size}]",
+        f"KM[{_format_komi(game.komi)}]",
+    ]
+    board = game.history.board_of(root)
+    for player, prop in ((Player.BLACK, "AB"), (Player.WHITE, "AW")):
+        stones = [
+            _encode_point(x, y)
+            for y in range(game.size)
+            for x in range(game.size)
+            if board.get(x, y) == player.value
+        ]
+        if stones:
+            parts.append(prop + "".join(f"[{s}]" for s in stones))
+    if root.current_player is not Player.BLACK:
+        parts.append("PL[W]")
+    if game.winner is not None:
+        parts.append("RE[B+R]" if game.winner is Player.BLACK else "RE[W+R]")
+    return "".join(parts)
+
+
+def _node_properties(node: PlyRecord, write_captures: bool = False) -> str:
+    prop = "B" if node.color == Player.BLACK.value else "W"
+    text = f"{prop}[{'' if node.is_pass else _encode_point(node.x, node.y)}]"
+    if write_captures and not node.children:
+        text += (
+            f"{CAPTURES_PROPS[Player.BLACK]}[{node.captures_black}]"
+            f"{CAPTURES_PROPS[Player.WHITE]}[{node.captures_white}]"
+        )
+    return text
+
+
+def game_to_sgf(game: GoGame, write_captures: bool = False) -> str:
+    """
+    Cả cây nước đi của `game` dưới dạng một GameTree SGF.
+    `write_captures=True`: ghi thêm CAPB / CAPW ở cuối mỗi nhánh.
+    """
+    parts = ["(;", _root_properties(game)]
+    root = game.history.root
+    # ghi không đệ quy: stack gồm node hoặc dấu ngoặc mở / đóng của biến
+    stack: List[Union[PlyRecord, str]] = []
+
+    def push_children(node: PlyRecord):
+        children = node.children
+        if len(children) == 1:
+            stack.append(children[0])
+        else:
+            for child in reversed(children):
+                stack.extend((")", child, "("))
+
+    push_children(root)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append("\n(" if item == "(" else item)
+            continue
+        separator = "" if parts[-1] == "\n(" else "\n"
+        parts.append(separator + ";" + _node_properties(item, write_captures))
+        push_children(item)
+    parts.append(")\n")
+    return "".join(parts)
+
+
+def save_sgf(game: GoGame, path: str, write_captures: bool = False):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(game_to_sgf(game, write_captures))
@@ -37,7 +37,14 @@ class GoApp:
 
         self.current_screen = HomeScreen(self)
 
+    def _close_current_screen(self):
+        """Cho màn hình hiện tại dọn dẹp (vd: dừng thread bot) trước khi rời đi."""
+        close = getattr(self.current_screen, "close", None)
+        if close is not None:
+            close()
+
     def change_screen(self, name: str, **kwargs):
+        self._close_current_screen()
         if name == "home":
             self.current_screen = HomeScreen(self)
         elif name == "setup":
@@ -49,6 +56,7 @@ class GoApp:
             mode         = kwargs.get("mode", GameMode.HUMAN_VS_HUMAN)
             board_style  = kwargs.get("board_style", "wood")
             human_color  = kwargs.get("human_color", Player.BLACK)  
+            bot_time_ms  = kwargs.get("bot_time_ms")
 
             self.current_screen = GameScreen(
                 self,
@@ -56,6 +64,7 @@ class GoApp:
                 mode=mode,
                 board_style=board_style,
                 human_color=human_color,  # <-- truyền xuống GameScreen
+                bot_time_ms=bot_time_ms,
             )
 
     def _init_music(self):
@@ -122,6 +131,7 @@ class GoApp:
 
             pygame.display.flip()
 
+        self._close_current_screen()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,270 @@
+"""
+Chạy nhiều ván bot đấu bot (GameMode.BOT_VS_BOT) không cần pygame.
+
+    python match_runner.py --a minimax:depth=2 --b mcts:playouts=500 --games 200 --workers 4
+
+- Bot viết dạng `tên:khoá=giá_trị,...` (tên trong BOT_TYPES, tham số truyền
+  thẳng vào constructor của bot).
+- Hai bot đổi màu sau mỗi ván; vài nước mở đầu ngẫu nhiên (theo seed của ván)
+  để các ván không lặp lại y hệt với bot tất định. Bot cũng nhận seed của
+  ván nên cả trận lặp lại được.
+- Ván chưa xong sau size * size * MAX_MOVES_FACTOR nước bị dừng và được
+  tính theo điểm khu vực (quân + ô trống chỉ kề một màu + komi), đếm riêng
+  trong `cutoffs`.
+- `--komi` được dùng cho cả điểm của ván lẫn bot có tham số `komi` (MCTS).
+- Các ván chạy song song trên nhiều tiến trình.
+- In tỉ lệ thắng, chênh lệch Elo (kèm khoảng tin cậy 95%) và thời gian mỗi nước.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import inspect
+import json
+import math
+import random
+import time
+from concurrent.futures import as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.board import Player
+from core.game import GameMode, GoGame
+from core.playout import PlayoutBoard
+from bots.mcts_bot import MCTSBot
+from bots.minimax_bot import HeuristicMinimaxBot
+from bots.process_pool import get_pool
+
+BOT_TYPES: Dict[str, type] = {
+    "minimax": HeuristicMinimaxBot,
+    "mcts": MCTSBot,
+}
+
+# Ván dừng (và được tính điểm) sau size * size * MAX_MOVES_FACTOR nước
+MAX_MOVES_FACTOR = 3
+
+
+def parse_bot_spec(spec: str) -> Tuple[str, Dict[str, Any]]:
+    """`"mcts:playouts=500,uct_c=1.0"` -> ("mcts", {"playouts": 500, "uct_c": 1.0})."""
+    name, _, params = spec.partition(":")
+    if name not in BOT_TYPES:
+        raise ValueError(f"Unknown bot type: {name!r}")
+    kwargs: Dict[str, Any] = {}
+    for item in filter(None, params.split(",")):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Bad bot parameter: {item!r}")
+        try:
+            kwargs[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            kwargs[key] = value  # chuỗi không cần đặt trong ngoặc
+    return name, kwargs
+
+
+def make_bot(spec: str, color: Player, size: int, seed: int, komi: float = 6.5):
+    name, kwargs = parse_bot_spec(spec)
+    bot_type = BOT_TYPES[name]
+    kwargs.setdefault("seed", seed)
+    # bot tự tính điểm (MCTS: playout) phải dùng cùng komi với trận đấu
+    if "komi" in inspect.signature(bot_type).parameters:
+        kwargs.setdefault("komi", komi)
+    return bot_type(color, board_size=size, **kwargs)
+
+
+def play_game(
+    spec_a: str,
+    spec_b: str,
+    a_is_black: bool,
+    size: int,
+    komi: float,
+    opening_moves: int,
+    seed: int,
+) -> Dict[str, Any]:
+    """Một ván A đấu B (chạy được trong tiến trình con). Trả về kết quả dạng dict."""
+    rng = random.Random(seed)
+    game = GoGame(size, GameMode.HUMAN_VS_HUMAN, board_backend="flat")
+    game.komi = komi
+    color_a = Player.BLACK if a_is_black else Player.WHITE
+    game.set_bot(make_bot(spec_a, color_a, size, seed, komi), color_a)
+    game.set_bot(make_bot(spec_b, color_a.opposite, size, seed + 1, komi), color_a.opposite)
+
+    # Mở đầu ngẫu nhiên qua API của người chơi (HUMAN_VS_HUMAN), rồi giao cho hai bot
+    for _ in range(opening_moves):
+        if game.is_over:
+            break
+        legal = game.get_legal_moves(game.current_player)
+        if legal:
+            game.play_human_move(*rng.choice(legal))
+        else:
+            game.pass_turn()
+    game.mode = GameMode.BOT_VS_BOT
+
+    think_time = {color_a: 0.0, color_a.opposite: 0.0}
+    bot_moves = {color_a: 0, color_a.opposite: 0}
+    max_moves = MAX_MOVES_FACTOR * size * size
+    moves = game.current_index
+    while not game.is_over and moves < max_moves:
+        player = game.current_player
+        start = time.perf_counter()
+        game.play_bot_turn()
+        think_time[player] += time.perf_counter() - start
+        bot_moves[player] += 1
+        moves += 1
+
+    cutoff = not game.is_over
+    if cutoff:
+        # bị dừng vì quá số nước: lãnh thổ giữa ván chưa rõ -> tính điểm khu vực
+        area = PlayoutBoard.from_board(game.board).area_score()
+        black, white = float(area[Player.BLACK.value]), area[Player.WHITE.value] + komi
+    else:
+        black, white = game.score()
+    winner = game.winner
+    if winner is None and black != white:
+        winner = Player.BLACK if black > white else Player.WHITE
+    score_a = 0.5 if winner is None else float(winner is color_a)
+    return {
+        "seed": seed,
+        "a_color": color_a.name,
+        "winner": None if winner is None else winner.name,
+        "score_a": score_a,
+        "resigned": game.winner is not None,
+        "cutoff": cutoff,
+        "moves": moves,
+        "black_score": black,
+        "white_score": white,
+        "time_a": think_time[color_a],
+        "moves_a": bot_moves[color_a],
+        "time_b": think_time[color_a.opposite],
+        "moves_b": bot_moves[color_a.opposite],
+    }
+
+
+# === Thống kê ===
+
+def elo_delta(score: float) -> float:
+    """Chênh lệch Elo của A so với B ứng với tỉ lệ điểm `score` (0..1)."""
+    score = min(max(score, 1e-3), 1 - 1e-3)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    n = len(results)
+    points = sum(r["score_a"] for r in results)
+    score = points / n if n else 0.5
+    # sai số chuẩn của tỉ lệ điểm -> khoảng tin cậy 95% của Elo
+    stderr = math.sqrt(score * (1 - score) / n) if n else 0.0
+    low = elo_delta(score - 1.96 * stderr)
+    high = elo_delta(score + 1.96 * stderr)
+    moves_a = sum(r["moves_a"] for r in results)
+    moves_b = sum(r["moves_b"] for r in results)
+    as_black = [r for r in results if r["a_color"] == "BLACK"]
+    as_white = [r for r in results if r["a_color"] == "WHITE"]
+    return {
+        "games": n,
+        "a_wins": sum(1 for r in results if r["score_a"] == 1.0),
+        "b_wins": sum(1 for r in results if r["score_a"] == 0.0),
+        "draws": sum(1 for r in results if r["score_a"] == 0.5),
+        "a_score": score,
+        "a_score_as_black": sum(r["score_a"] for r in as_black) / len(as_black) if as_black else None,
+        "a_score_as_white": sum(r["score_a"] for r in as_white) / len(as_white) if as_white else None,
+        "elo": elo_delta(score),
+        "elo_low": low,
+        "elo_high": high,
+        "resigned": sum(1 for r in results if r["resigned"]),
+        "cutoffs": sum(1 for r in results if r["cutoff"]),
+        "avg_moves": sum(r["moves"] for r in results) / n if n else 0.0,
+        "ms_per_move_a": 1000.0 * sum(r["time_a"] for r in results) / moves_a if moves_a else 0.0,
+        "ms_per_move_b": 1000.0 * sum(r["time_b"] for r in results) / moves_b if moves_b else 0.0,
+    }
+
+
+def run_match(
+    spec_a: str,
+    spec_b: str,
+    games: int,
+    size: int = 9,
+    komi: float = 6.5,
+    opening_moves: int = 4,
+    workers: int = 1,
+    seed: int = 0,
+    progress: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    # kiểm tra cú pháp bot trước khi gửi sang tiến trình con
+    parse_bot_spec(spec_a)
+    parse_bot_spec(spec_b)
+    jobs = [
+        (spec_a, spec_b, i % 2 == 0, size, komi, opening_moves, seed + 2 * i)
+        for i in range(games)
+    ]
+    results: List[Dict[str, Any]] = []
+    if workers <= 1:
+        for job in jobs:
+            results.append(play_game(*job))
+            if progress:
+                progress(results)
+        return results
+
+    pool = get_pool(workers)
+    futures = [pool.submit(play_game, *job) for job in jobs]
+    for future in as_completed(futures):
+        results.append(future.result())
+        if progress:
+            progress(results)
+    results.sort(key=lambda r: r["seed"])
+    return results
+
+
+def main(argv: List[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--a", required=True, help="bot A, vd: minimax:depth=2")
+    parser.add_argument("--b", required=True, help="bot B, vd: mcts:playouts=500")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--komi", type=float, default=6.5)
+    parser.add_argument("--opening-moves", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="ghi kết quả từng ván + tổng kết ra file JSON")
+    args = parser.parse_args(argv)
+
+    def progress(results):
+        done = len(results)
+        if done % max(1, args.games // 20) == 0 or done == args.games:
+            points = sum(r["score_a"] for r in results)
+            print(f"  {done}/{args.games} games, A score {points / done:.3f}", flush=True)
+
+    start = time.perf_counter()
+    results = run_match(
+        args.a, args.b, args.games, args.size, args.komi,
+        args.opening_moves, args.workers, args.seed, progress,
+    )
+    elapsed = time.perf_counter() - start
+    summary = summarize(results)
+
+    print(f"A = {args.a}")
+    print(f"B = {args.b}")
+    print(
+        f"{summary['games']} games in {elapsed:.1f}s: "
+        f"A {summary['a_wins']} - B {summary['b_wins']} (draws {summary['draws']}, "
+        f"resigned {summary['resigned']}, cut off {summary['cutoffs']})"
+    )
+    if summary["cutoffs"]:
+        print(
+            f"note: {summary['cutoffs']} game(s) hit the {MAX_MOVES_FACTOR}*size^2 move "
+            f"limit and were scored by area"
+        )
+    print(
+        f"A score {summary['a_score']:.3f}, Elo {summary['elo']:+.0f} "
+        f"[{summary['elo_low']:+.0f}, {summary['elo_high']:+.0f}]"
+    )
+    print(
+        f"time per move: A {summary['ms_per_move_a']:.1f} ms, "
+        f"B {summary['ms_per_move_b']:.1f} ms; avg game {summary['avg_moves']:.0f} moves"
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"a": args.a, "b": args.b, "summary": summary, "games": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
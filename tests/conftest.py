@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Chạy `python -m pytest` từ thư mục gốc: cho phép import core / bots / benchmarks
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from core.board import Player
+from core.game import BOARD_BACKENDS
+from bots.minimax_bot import HeuristicMinimaxBot
+
+pytest.importorskip("numpy")
+
+
+def _random_board(backend: str, seed: int):
+    rng = random.Random(seed)
+    size = [5, 7, 9, 13][seed % 4]
+    board = BOARD_BACKENDS[backend](size)
+    for _ in range(rng.randrange(size * size)):
+        board.play(rng.choice((Player.BLACK, Player.WHITE)), rng.randrange(size), rng.randrange(size))
+    return board
+
+
+@pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+@pytest.mark.parametrize("seed", range(6))
+def test_batch_scores_match_scalar_evaluate(backend, seed):
+    board = _random_board(backend, seed)
+    bot = HeuristicMinimaxBot(Player.BLACK, board.size, batch_eval=True, incremental_eval=False)
+    for player in Player:
+        moves = [(x, y) for y in range(board.size) for x in range(board.size)]
+        for max_player in Player:
+            batch = bot._batch_leaf_scores(board, player, moves, max_player)
+            expected = {}
+            for x, y in moves:
+                record = board.play(player, x, y)
+                if record is None:
+                    continue
+                expected[(x, y)] = bot._evaluate(board, max_player)
+                board.undo(record)
+            assert batch == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_batch_eval_picks_the_same_move(seed):
+    board = _random_board("flat", seed + 1)
+    legal = board.legal_moves(Player.WHITE)
+    batched = HeuristicMinimaxBot(Player.WHITE, board.size, depth=2, batch_eval=True, seed=0)
+    scalar = HeuristicMinimaxBot(Player.WHITE, board.size, depth=2, seed=0)
+    assert batched.batch_eval
+    assert batched.select_move(board.copy(), legal) == scalar.select_move(board.copy(), legal)
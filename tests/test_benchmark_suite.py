@@ -0,0 +1,21 @@
+from benchmarks.suite import compare, normalized
+
+
+def test_compare_flags_regressions_and_new_entries():
+    baseline = {"9/place_stone": 10.0, "9/copy": 4.0, "9/score": 2.0}
+    current = {"9/place_stone": 10.4, "9/copy": 6.0, "9/score": 1.0, "9/minimax_d3": 5.0}
+    rows = {name: (ratio, status) for name, ratio, status in compare(current, baseline, 0.1)}
+    assert rows["9/place_stone"] == (current["9/place_stone"] / 10.0, "ok")
+    assert rows["9/copy"] == (1.5, "REGRESSION")
+    assert rows["9/score"] == (0.5, "faster")
+    assert rows["9/minimax_d3"] == (None, "new")
+    # đúng bằng ngưỡng vẫn là ok
+    assert compare({"a": 11.0}, {"a": 10.0}, 0.1001)[0][2] == "ok"
+
+
+def test_normalized_divides_by_calibration_of_the_same_size():
+    report = {
+        "calibration": {"9": 2.0, "13": 4.0},
+        "results": {"9/copy": 6.0, "13/copy": 6.0},
+    }
+    assert normalized(report) == {"9/copy": 3.0, "13/copy": 1.5}
@@ -0,0 +1,94 @@
+import threading
+import time
+
+from core.board import Player
+from core.game import GameMode, GoGame
+
+
+class _BlockingBot:
+    """Bot giả: chặn trong select_move tới khi được thả, rồi vẫn trả về một nước."""
+
+    def __init__(self, color: Player):
+        self.color = color
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.stop_requested = threading.Event()
+
+    def request_stop(self):
+        self.stop_requested.set()
+
+    def select_move(self, board, legal_moves):
+        self.started.set()
+        self.release.wait(5)
+        return legal_moves[0]
+
+
+def _grid(board):
+    return [[board.get(x, y) for x in range(board.size)] for y in range(board.size)]
+
+
+def _poll_for(game: GoGame, seconds: float = 0.3) -> bool:
+    moved = False
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        moved |= game.poll_bot_turn()
+        time.sleep(0.01)
+    return moved
+
+
+def _game_waiting_for_bot():
+    game = GoGame(9, GameMode.HUMAN_VS_BOT, human_color=Player.BLACK, async_bot=True)
+    bot = _BlockingBot(Player.WHITE)
+    game.set_bot(bot)
+    assert game.play_human_move(4, 4)
+    assert bot.started.wait(5)
+    return game, bot
+
+
+def test_cancel_mid_search_leaves_the_board_alone():
+    game, bot = _game_waiting_for_bot()
+    try:
+        assert game.is_bot_thinking
+        before = _grid(game.board)
+        game.cancel_bot_turn()
+        assert bot.stop_requested.is_set()
+        bot.release.set()
+        assert not _poll_for(game)
+        assert _grid(game.board) == before
+        assert game.current_player is Player.WHITE
+        assert game.current_index == 1
+    finally:
+        bot.release.set()
+        game.shutdown_bot()
+
+
+def test_result_for_an_older_state_is_dropped():
+    game, bot = _game_waiting_for_bot()
+    try:
+        # undo trong lúc bot đang tính: kết quả tính cho thế cờ cũ phải bị bỏ
+        game.undo()
+        bot.release.set()
+        assert not _poll_for(game)
+        assert game.current_index == 0
+        assert _grid(game.board) == [[0] * 9 for _ in range(9)]
+
+        # kết quả mang token cũ nhưng không bị huỷ cũng không được áp dụng
+        bot.release.clear()
+        game._bot_worker.submit(bot, game.board.copy(), [(0, 0)], token=game._state_version - 1)
+        bot.release.set()
+        assert not _poll_for(game)
+        assert game.board.get(0, 0) == 0
+    finally:
+        bot.release.set()
+        game.shutdown_bot()
+
+
+def test_current_result_is_applied():
+    game, bot = _game_waiting_for_bot()
+    try:
+        bot.release.set()
+        assert _poll_for(game)
+        assert game.current_index == 2
+        assert game.current_player is Player.BLACK
+    finally:
+        game.shutdown_bot()
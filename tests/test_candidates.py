@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from core.board import Player
+from core.game import BOARD_BACKENDS
+from bots.minimax_bot import HeuristicMinimaxBot, prior_table
+
+
+def _full_scan(grid, neighbor_rows, by_prior, prior, width):
+    """Cách cũ: mọi ô trống, theo hàng rồi cột."""
+    return [(x, y) for y, row in enumerate(grid) for x, v in enumerate(row) if v == 0]
+
+
+@pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+@pytest.mark.parametrize("size", [5, 9, 13, 19])
+@pytest.mark.parametrize("beam_width", [6, 15, 30])
+def test_fallback_candidates_match_full_scan(backend, size, beam_width):
+    rng = random.Random(size * 100 + beam_width)
+    for _ in range(10):
+        board = BOARD_BACKENDS[backend](size)
+        # thế cờ thưa: ít nước sát quân mình -> đi vào nhánh fallback
+        for _ in range(rng.randrange(0, 6)):
+            board.play(rng.choice((Player.BLACK, Player.WHITE)), rng.randrange(size), rng.randrange(size))
+        for player in Player:
+            fast = HeuristicMinimaxBot(player, size, beam_width=beam_width)
+            slow = HeuristicMinimaxBot(player, size, beam_width=beam_width)
+            slow._fallback_candidates = _full_scan
+            assert fast._generate_legal_moves(board, player) == slow._generate_legal_moves(board, player)
+
+
+def test_fallback_keeps_near_stones_and_top_priors():
+    board = BOARD_BACKENDS["grid"](19)
+    board.play(Player.WHITE, 0, 0)
+    prior, by_prior = prior_table(19)
+    chosen = HeuristicMinimaxBot._fallback_candidates(board.rows(), board._neighbor_rows, by_prior, prior, 15)
+    assert (1, 0) in chosen and (0, 1) in chosen
+    assert (9, 9) in chosen
+    # không phải chấm điểm cả bàn
+    assert len(chosen) < 19 * 19 - 1
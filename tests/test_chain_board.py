@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from core.board import Board, Player
+from core.chain_board import ChainBoard
+
+
+def _assert_same_chains(board: ChainBoard, reference: Board):
+    """Nhóm & khí của ChainBoard giống hệt flood fill của Board."""
+    size = board.size
+    assert board.grid == reference.grid
+    assert board.hash == reference.hash
+    for y in range(size):
+        for x in range(size):
+            assert board._group_and_liberties(x, y) == reference._group_and_liberties(x, y)
+    # mỗi quân nằm trong đúng một chain, chain id khớp với chains
+    stones = sorted(s for chain in board.chains.values() for s in chain.stones)
+    assert stones == sorted(
+        (x, y) for y in range(size) for x in range(size) if board.grid[y][x]
+    )
+    for cid, chain in board.chains.items():
+        assert all(board.chain_ids[y][x] == cid for x, y in chain.stones)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_set_updates_chains_incrementally(seed):
+    rng = random.Random(seed)
+    size = rng.choice([5, 7, 9])
+    board = ChainBoard(size)
+    reference = Board(size)
+    for _ in range(200):
+        x, y = rng.randrange(size), rng.randrange(size)
+        value = rng.choice((0, 1, 2))
+        board.set(x, y, value)
+        reference.set(x, y, value)
+        _assert_same_chains(board, reference)
+    # sau khi dựng thế cờ bằng set(), place_stone vẫn đúng
+    for _ in range(100):
+        player = rng.choice((Player.BLACK, Player.WHITE))
+        x, y = rng.randrange(size), rng.randrange(size)
+        a = board.place_stone(player, x, y)
+        b = reference.place_stone(player, x, y)
+        assert a[0] == b[0] and sorted(a[1]) == sorted(b[1])
+    _assert_same_chains(board, reference)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_play_undo_matches_board(seed):
+    """play / undo (bắt quân, ko, hash) giống Board, nhóm & khí luôn khớp."""
+    rng = random.Random(seed)
+    size = [5, 7, 9, 13][seed]
+    board = ChainBoard(size)
+    reference = Board(size)
+    records = []
+    for _ in range(300):
+        if records and rng.random() < 0.2:
+            a, b = records.pop()
+            board.undo(a)
+            reference.undo(b)
+        else:
+            player = rng.choice((Player.BLACK, Player.WHITE))
+            x, y = rng.randrange(size), rng.randrange(size)
+            a = board.play(player, x, y)
+            b = reference.play(player, x, y)
+            assert (a is None) == (b is None)
+            if a is not None:
+                assert sorted(a.captured) == sorted(b.captured)
+                records.append((a, b))
+        assert board.ko_point == reference.ko_point
+        _assert_same_chains(board, reference)
@@ -0,0 +1,55 @@
+import pickle
+import random
+
+import pytest
+
+from core.board import Board, Player
+from core.flat_board import FlatBoard
+
+
+def _grid(board: Board):
+    return [[board.get(x, y) for x in range(board.size)] for y in range(board.size)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_play_undo_matches_board(seed):
+    """play / undo (bắt quân, ko, hash) và nhóm & khí giống Board."""
+    rng = random.Random(seed)
+    size = [5, 7, 9, 13][seed]
+    board = FlatBoard(size)
+    reference = Board(size)
+    records = []
+    for _ in range(300):
+        if records and rng.random() < 0.2:
+            a, b = records.pop()
+            board.undo(a)
+            reference.undo(b)
+        else:
+            player = rng.choice((Player.BLACK, Player.WHITE))
+            x, y = rng.randrange(size), rng.randrange(size)
+            a = board.play(player, x, y)
+            b = reference.play(player, x, y)
+            assert (a is None) == (b is None)
+            if a is not None:
+                assert sorted(a.captured) == sorted(b.captured)
+                records.append((a, b))
+        assert _grid(board) == _grid(reference)
+        assert board.hash == reference.hash
+        assert board.ko_point == reference.ko_point
+        assert board.is_full() == reference.is_full()
+        x, y = rng.randrange(size), rng.randrange(size)
+        assert board._group_and_liberties(x, y) == reference._group_and_liberties(x, y)
+
+
+def test_rows_follow_the_board_and_grid_is_read_only():
+    board = FlatBoard(5)
+    rows = board.rows()
+    board.play(Player.BLACK, 2, 3)
+    assert rows[3][2] == Player.BLACK.value
+    assert board.grid[3][2] == Player.BLACK.value
+    with pytest.raises(TypeError):
+        board.grid[0][0] = Player.WHITE.value
+    # memoryview của rows() không được làm hỏng copy / pickle
+    clone = pickle.loads(pickle.dumps(board))
+    assert clone.rows()[3][2] == Player.BLACK.value
+    assert board.copy().rows()[3][2] == Player.BLACK.value
@@ -0,0 +1,214 @@
+import random
+
+import pytest
+
+from core.board import Board, Player
+from core.game import BOARD_BACKENDS, GameMode, GoGame
+from core.history import BOARD_CACHE_SIZE, KEYFRAME_INTERVAL, GameHistory
+
+
+def _position(board: Board):
+    return [list(row) for row in board.rows()], board.hash, board.ko_point
+
+
+def _random_game(size: int, plies: int, seed: int, **kwargs) -> GoGame:
+    rng = random.Random(seed)
+    game = GoGame(size, GameMode.HUMAN_VS_HUMAN, **kwargs)
+    while game.current_index < plies:
+        legal = game.get_legal_moves(game.current_player)
+        # thỉnh thoảng pass để có cả ply pass trong lịch sử (không pass hai lần liền)
+        if not legal or (game.pass_streak == 0 and rng.random() < 0.03):
+            game.pass_turn()
+        else:
+            game.play_human_move(*rng.choice(legal))
+    return game
+
+
+def _replayed_positions(game: GoGame):
+    """Thế cờ ở từng ply của nhánh đang xem, đánh lại từ đầu trên bàn mới."""
+    board = Board(game.size)
+    positions = [_position(board)]
+    for index in range(1, len(game.history)):
+        record = game.history.record(index)
+        if record.is_pass:
+            board.ko_point = None
+        else:
+            assert board.play(Player(record.color), record.x, record.y)
+        positions.append(_position(board))
+    return positions
+
+
+@pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+def test_random_access_matches_replay_across_keyframes(backend):
+    game = _random_game(9, 3 * KEYFRAME_INTERVAL + 5, 1, board_backend=backend)
+    history = game.history
+    expected = _replayed_positions(game)
+    assert len(expected) > 3 * KEYFRAME_INTERVAL
+    records = [history.record(index) for index in range(len(history))]
+    assert any(r.is_pass for r in records) and any(r.captured for r in records)
+
+    for index in range(len(history)):
+        has_keyframe = history.record(index).keyframe is not None
+        assert has_keyframe == (index % KEYFRAME_INTERVAL == 0)
+
+    # bỏ hết bàn đã memo: mỗi lần đọc phải dựng lại từ keyframe gần nhất
+    history._boards.clear()
+    order = list(range(len(history)))
+    random.Random(2).shuffle(order)
+    for index in order:
+        assert _position(history.board_at(index)) == expected[index]
+        record = history.record(index)
+        assert history.board_of(record) is history.board_at(index)
+        assert record.hash == expected[index][1]
+
+
+def test_snapshots_keep_counters_per_ply():
+    game = _random_game(7, 80, 3)
+    states = []
+    while True:
+        states.append((
+            _position(game.board), game.current_player, dict(game.captures),
+            game.last_move, game.pass_streak,
+        ))
+        if not game.can_undo():
+            break
+        game.undo()
+    states.reverse()
+
+    for index, (position, player, captures, last_move, pass_streak) in enumerate(states):
+        snap = game.history[index]
+        assert _position(snap.board) == position
+        assert snap.current_player is player
+        assert (snap.captures_black, snap.captures_white) == (
+            captures[Player.BLACK], captures[Player.WHITE],
+        )
+        assert (snap.last_move, snap.pass_streak) == (last_move, pass_streak)
+
+
+def _state(game: GoGame):
+    return (
+        _position(game.board), game.current_player, dict(game.captures),
+        game.last_move, game.pass_streak,
+    )
+
+
+def _play_line(game: GoGame, plies: int, rng: random.Random, seen: dict):
+    """Đi `plies` nước ngẫu nhiên từ trạng thái hiện tại, ghi lại trạng thái ở từng node."""
+    for _ in range(plies):
+        legal = game.get_legal_moves(game.current_player)
+        if not legal or rng.random() < 0.05:
+            if game.pass_streak:
+                break
+            game.pass_turn()
+        else:
+            game.play_human_move(*rng.choice(legal))
+        seen[game.current_node] = _state(game)
+
+
+def _line_hashes(game: GoGame):
+    counts = {}
+    node = game.current_node
+    while node is not None:
+        counts[node.hash] = counts.get(node.hash, 0) + 1
+        node = node.parent
+    return counts
+
+
+@pytest.mark.parametrize("ko_rule", ["simple", "positional"])
+def test_switching_variations_restores_position_and_side_to_move(ko_rule):
+    rng = random.Random(7)
+    game = GoGame(7, GameMode.HUMAN_VS_HUMAN, ko_rule=ko_rule)
+    seen = {game.current_node: _state(game)}
+    _play_line(game, 45, rng, seen)
+    # rẽ nhánh ở vài ply khác nhau, có nhánh vượt qua keyframe
+    for branch_at in (10, 25, 3):
+        while game.current_index > branch_at:
+            game.undo()
+        _play_line(game, 40, rng, seen)
+    assert sum(len(node.children) > 1 for node in seen) >= 3
+
+    nodes = list(seen)
+    for node in rng.sample(nodes, len(nodes)):
+        game.go_to_node(node)
+        assert game.current_node is node
+        assert game.current_index == node.depth
+        assert _state(game) == seen[node]
+        assert game._line_hashes == _line_hashes(game)
+
+        # đi tiếp / lùi lại theo biến vẫn ra đúng thế cờ
+        if node.children:
+            game.go_to_child(len(node.children) - 1)
+            assert _state(game) == seen[node.children[-1]]
+            game.go_to_parent()
+            assert _state(game) == seen[node]
+        if game.go_to_sibling():
+            siblings = node.parent.children
+            sibling = siblings[(siblings.index(node) + 1) % len(siblings)]
+            assert game.current_node is sibling
+            assert _state(game) == seen[sibling]
+            assert game._line_hashes == _line_hashes(game)
+            assert game.get_legal_moves(game.current_player) == game.board.legal_moves(
+                game.current_player, game._ko_forbidden()[0]
+            )
+
+
+def test_replaying_an_existing_move_reuses_the_variation():
+    game = GoGame(9, GameMode.HUMAN_VS_HUMAN)
+    for move in [(2, 2), (6, 6), (2, 6)]:
+        game.play_human_move(*move)
+    old = game.current_node
+    game.undo()
+    game.play_human_move(6, 2)
+    assert game.variation_position() == (2, 2)
+    game.undo()
+    game.play_human_move(2, 6)
+    assert game.current_node is old
+    assert len(old.parent.children) == 2
+
+
+def test_evicted_boards_are_rebuilt_identically():
+    game = _random_game(9, 70, 4)
+    history = game.history
+    expected = _replayed_positions(game)
+    history._boards.clear()
+
+    first = history.board_at(45)
+    assert history.board_at(45) is first  # memo: không dựng lại
+    # đọc thêm nhiều ply khác để đẩy ply 45 ra khỏi LRU
+    for index in range(50, 50 + BOARD_CACHE_SIZE):
+        assert _position(history.board_at(index)) == expected[index]
+        assert len(history._boards) <= BOARD_CACHE_SIZE
+    assert history.record(45) not in history._boards
+
+    again = history.board_at(45)
+    assert again is not first
+    assert _position(again) == _position(first) == expected[45]
+    # bàn đã trả ra trước đó không bị các lần dựng sau sửa mất
+    assert _position(first) == expected[45]
+
+
+def test_small_board_cache_still_gives_every_position():
+    game = _random_game(7, 60, 5)
+    expected = _replayed_positions(game)
+    history = GameHistory(Board(7), max_boards=2)
+    for index in range(1, len(game.history)):
+        record = game.history.record(index)
+        board = history.board_at(index - 1).copy()
+        move = None
+        if record.is_pass:
+            board.ko_point = None
+        else:
+            board.play(Player(record.color), record.x, record.y)
+            move = (record.x, record.y)
+        history.play(
+            index - 1, board, Player(record.color), move, record.captured,
+            record.current_player, record.captures_black, record.captures_white,
+            record.pass_streak,
+        )
+    assert len(history._boards) <= 2
+    for index in [59, 0, 31, 32, 33, 5, 58, 60, 1]:
+        assert _position(history.board_at(index)) == expected[index]
+        assert len(history._boards) <= 2
+
+    with pytest.raises(ValueError):
+        GameHistory(Board(7), max_boards=0)
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from core.board import Player
+from core.game import BOARD_BACKENDS
+from bots.incremental_eval import IncrementalEvaluator
+from bots.minimax_bot import HeuristicMinimaxBot
+
+
+@pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+@pytest.mark.parametrize("seed", range(4))
+def test_incremental_eval_matches_full_evaluate(backend, seed):
+    rng = random.Random(seed)
+    size = [5, 7, 9, 13][seed]
+    bot = HeuristicMinimaxBot(Player.BLACK, incremental_eval=False)
+    board = BOARD_BACKENDS[backend](size)
+    evaluator = IncrementalEvaluator(board)
+    records = []
+    for _ in range(200):
+        if records and rng.random() < 0.3:
+            evaluator.undo(records.pop())
+        else:
+            player = rng.choice((Player.BLACK, Player.WHITE))
+            record = evaluator.play(player, rng.randrange(size), rng.randrange(size))
+            if record is not None:
+                records.append(record)
+        for player in Player:
+            assert evaluator.score(player) == bot._evaluate(board, player)
+
+
+def test_search_result_does_not_depend_on_incremental_eval():
+    rng = random.Random(5)
+    board = BOARD_BACKENDS["grid"](7)
+    for _ in range(14):
+        board.play(rng.choice((Player.BLACK, Player.WHITE)), rng.randrange(7), rng.randrange(7))
+    legal = board.legal_moves(Player.BLACK)
+    fast = HeuristicMinimaxBot(Player.BLACK, 7, depth=2, seed=0)
+    slow = HeuristicMinimaxBot(Player.BLACK, 7, depth=2, incremental_eval=False, seed=0)
+    assert fast.select_move(board.copy(), legal) == slow.select_move(board.copy(), legal)
@@ -0,0 +1,57 @@
+import random
+import time
+
+from core.game import GameMode, GoGame
+from bots.minimax_bot import HeuristicMinimaxBot, SearchTimeout
+
+
+def _position(size: int, seed: int) -> GoGame:
+    rng = random.Random(seed)
+    game = GoGame(size, GameMode.HUMAN_VS_HUMAN)
+    for _ in range(12):
+        game._apply_move(game.current_player, *rng.choice(game.get_legal_moves(game.current_player)))
+    return game
+
+
+def test_timeout_returns_best_move_of_last_finished_depth():
+    game = _position(9, 0)
+    legal = game.get_legal_moves(game.current_player)
+    bot = HeuristicMinimaxBot(game.current_player, 9, max_time_ms=60_000, seed=0)
+    finished = {}
+    search_depth = bot._search_depth
+
+    def search_until_depth_3(board, moves, depth):
+        if depth == 3:
+            # hết giờ giữa chừng độ sâu 3
+            raise SearchTimeout()
+        finished[depth] = search_depth(board, moves, depth)
+        return finished[depth]
+
+    bot._search_depth = search_until_depth_3
+    move = bot.select_move(game.board.copy(), legal)
+    assert bot.last_depth == 2
+    assert sorted(finished) == [1, 2]
+    assert move in finished[2][1]
+
+    # cùng tập nước tốt nhất với tìm kiếm độ sâu cố định 2
+    fixed = HeuristicMinimaxBot(game.current_player, 9, depth=2, seed=0)
+    board = game.board.copy()
+    fixed._attach_evaluator(board)
+    score, best = fixed._search_depth(board, legal, 2)
+    assert score == finished[2][0]
+    assert sorted(best) == sorted(finished[2][1])
+
+
+def test_time_budget_is_respected():
+    game = _position(13, 1)
+    legal = game.get_legal_moves(game.current_player)
+    bot = HeuristicMinimaxBot(game.current_player, 13, max_time_ms=200, seed=0)
+    start = time.perf_counter()
+    move = bot.select_move(game.board.copy(), legal)
+    elapsed = time.perf_counter() - start
+    assert move in legal
+    assert bot.last_depth >= 1
+    # độ sâu 1 luôn chạy trọn, phần còn lại dừng ngay khi quá hạn
+    assert elapsed < 2.0
+    assert bot._deadline is None
+    assert bot.last_stats.depth == bot.last_depth
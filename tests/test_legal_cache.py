@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from core.board import Player
+from core.game import LEGAL_CACHE_SIZE, GameMode, GoGame
+
+
+def _uncached(game: GoGame, player: Player):
+    return game.board.legal_moves(player, game._ko_forbidden()[0])
+
+
+def _ko_game(ko_rule: str) -> GoGame:
+    """5x5, nước cuối của đen ăn quân trắng ở (1, 1) -> trắng không được ăn lại ngay."""
+    game = GoGame(5, GameMode.HUMAN_VS_HUMAN, ko_rule=ko_rule)
+    for x, y in [(1, 0), (1, 1), (0, 1), (2, 0), (1, 2), (3, 1), (4, 4), (2, 2), (2, 1)]:
+        assert game.play_human_move(x, y)
+    assert game.captures[Player.BLACK] == 1
+    return game
+
+
+@pytest.mark.parametrize("ko_rule", ["simple", "positional"])
+def test_cache_hit_after_capture_and_ko_change(ko_rule):
+    game = _ko_game(ko_rule)
+    assert (1, 1) not in game.get_legal_moves(Player.WHITE)
+
+    # quay lại đúng thế cờ vừa ăn quân: kết quả lấy từ cache vẫn cấm ăn lại
+    game.undo()
+    assert game.board.get(1, 1) == Player.WHITE.value
+    assert game.get_legal_moves(Player.BLACK) == _uncached(game, Player.BLACK)
+    game.redo()
+    entries = len(game._legal_cache)
+    assert (1, 1) not in game.get_legal_moves(Player.WHITE)
+    assert len(game._legal_cache) == entries
+
+    # hai lượt pass: cùng hình cờ, cùng bên đi nhưng tập hình cờ bị cấm đã khác
+    game.pass_turn()
+    game.pass_turn()
+    moves = game.get_legal_moves(Player.WHITE)
+    assert moves == _uncached(game, Player.WHITE)
+    assert ((1, 1) in moves) == (ko_rule == "simple")
+
+
+@pytest.mark.parametrize("ko_rule", ["simple", "positional"])
+def test_cached_moves_match_fresh_generation(ko_rule):
+    rng = random.Random(5)
+    game = GoGame(7, GameMode.HUMAN_VS_HUMAN, ko_rule=ko_rule)
+    for _ in range(400):
+        player = game.current_player
+        moves = game.get_legal_moves(player)
+        assert moves == _uncached(game, player)
+        assert game.get_legal_moves(player.opposite) == _uncached(game, player.opposite)
+        # sửa list trả về không được làm hỏng cache
+        moves.append((-1, -1))
+        assert game.get_legal_moves(player) == _uncached(game, player)
+
+        roll = rng.random()
+        if roll < 0.15 and game.can_undo():
+            game.undo()
+        elif roll < 0.25 and game.can_redo():
+            game.redo()
+        elif game.is_over or not moves[:-1]:
+            game.reset()
+        else:
+            game.play_human_move(*rng.choice(moves[:-1]))
+        assert len(game._legal_cache) <= LEGAL_CACHE_SIZE
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from core.board import Board, Player
+from core.game import BOARD_BACKENDS, GameMode, GoGame
+
+
+def _grid(board: Board):
+    return [[board.get(x, y) for x in range(board.size)] for y in range(board.size)]
+
+
+def _legal_by_placing(board: Board, player: Player, forbidden=()):
+    """Cách cũ: copy bàn & đặt thử quân ở từng ô trống."""
+    moves = []
+    for y in range(board.size):
+        for x in range(board.size):
+            if board.get(x, y) != 0:
+                continue
+            trial = board.copy()
+            if trial.place_stone(player, x, y)[0] and trial.hash not in forbidden:
+                moves.append((x, y))
+    return moves
+
+
+@pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+@pytest.mark.parametrize("seed", range(4))
+def test_legal_moves_match_trial_placement(backend, seed):
+    rng = random.Random(seed)
+    size = [5, 7, 9, 13][seed]
+    board = BOARD_BACKENDS[backend](size)
+    previous_hash = board.hash
+    for _ in range(150):
+        # cấm hình cờ ngay trước đó, như ko đơn của GoGame
+        forbidden = {previous_hash}
+        for player in Player:
+            assert board.legal_moves(player, forbidden) == _legal_by_placing(board, player, forbidden)
+        previous_hash = board.hash
+        board.play(rng.choice((Player.BLACK, Player.WHITE)), rng.randrange(size), rng.randrange(size))
+
+
+@pytest.mark.parametrize("backend", ["chains", "flat"])
+@pytest.mark.parametrize("ko_rule", ["simple", "positional"])
+def test_game_matches_grid_backend(backend, ko_rule):
+    """Cả ván (kể cả undo/redo/pass): nước hợp lệ, số quân bắt, điểm như backend grid."""
+    for seed in range(3):
+        rng = random.Random(seed)
+        size = [5, 7, 9][seed]
+        reference = GoGame(size, GameMode.HUMAN_VS_HUMAN, ko_rule=ko_rule)
+        game = GoGame(size, GameMode.HUMAN_VS_HUMAN, board_backend=backend, ko_rule=ko_rule)
+        for _ in range(250):
+            legal = reference.get_legal_moves(reference.current_player)
+            assert sorted(game.get_legal_moves(game.current_player)) == sorted(legal)
+            assert game.captures == reference.captures
+            assert game.score() == reference.score()
+            assert game.is_over == reference.is_over
+            assert _grid(game.board) == _grid(reference.board)
+            r = rng.random()
+            if reference.is_over or r < 0.05:
+                if not reference.can_undo():
+                    break
+                reference.undo()
+                game.undo()
+            elif r < 0.08:
+                assert game.can_redo() == reference.can_redo()
+                reference.redo()
+                game.redo()
+            elif r < 0.10 or not legal:
+                assert game.pass_turn() == reference.pass_turn()
+            else:
+                x, y = rng.choice(legal)
+                assert game._apply_move(game.current_player, x, y)
+                assert reference._apply_move(reference.current_player, x, y)
@@ -0,0 +1,39 @@
+import match_runner
+from core.board import Player
+
+
+def test_short_match_smoke():
+    results = match_runner.run_match(
+        "minimax:depth=1", "mcts:playouts=20", games=2, size=5, komi=0.5, opening_moves=2, seed=1
+    )
+    assert [r["a_color"] for r in results] == ["BLACK", "WHITE"]
+    summary = match_runner.summarize(results)
+    assert summary["games"] == 2
+    assert summary["a_wins"] + summary["b_wins"] + summary["draws"] == 2
+    assert 0.0 <= summary["a_score"] <= 1.0
+    for r in results:
+        assert r["moves"] == r["moves_a"] + r["moves_b"] + 2
+    # cùng seed -> cùng trận
+    again = match_runner.run_match(
+        "minimax:depth=1", "mcts:playouts=20", games=2, size=5, komi=0.5, opening_moves=2, seed=1
+    )
+    assert [r["winner"] for r in again] == [r["winner"] for r in results]
+
+
+def test_komi_reaches_the_mcts_bot():
+    bot = match_runner.make_bot("mcts:playouts=10", Player.WHITE, 9, seed=0, komi=0.5)
+    assert bot.komi == 0.5
+    # komi ghi rõ trong spec được giữ nguyên
+    bot = match_runner.make_bot("mcts:komi=7.5", Player.WHITE, 9, seed=0, komi=0.5)
+    assert bot.komi == 7.5
+    match_runner.make_bot("minimax:depth=1", Player.BLACK, 9, seed=0, komi=0.5)
+
+
+def test_cut_off_games_are_scored_by_area(monkeypatch):
+    monkeypatch.setattr(match_runner, "MAX_MOVES_FACTOR", 0.4)
+    result = match_runner.play_game("mcts:playouts=10", "mcts:playouts=10", True, 5, 0.5, 0, seed=3)
+    assert result["cutoff"]
+    assert result["moves"] == 10
+    assert result["winner"] is not None  # komi 0.5 -> không hoà
+    assert result["score_a"] == (1.0 if result["winner"] == "BLACK" else 0.0)
+    assert match_runner.summarize([result])["cutoffs"] == 1
@@ -0,0 +1,102 @@
+import pytest
+
+from core.board import Board, Player
+from core.chain_board import ChainBoard
+from bots.mcts_bot import MCTSBot
+
+
+def _board_with_only_eyes(size=5, eyes=((0, 0), (2, 2), (4, 4))):
+    """Đen phủ kín bàn, chỉ chừa vài mắt một ô."""
+    board = Board(size)
+    for y in range(size):
+        for x in range(size):
+            if (x, y) not in eyes:
+                assert board.place_stone(Player.BLACK, x, y)[0]
+    return board
+
+
+def test_passes_when_only_own_eyes_are_left():
+    board = _board_with_only_eyes()
+    legal = board.legal_moves(Player.BLACK)
+    assert sorted(legal) == [(0, 0), (2, 2), (4, 4)]
+    bot = MCTSBot(Player.BLACK, board_size=5, playouts=50, seed=1)
+    assert bot.select_move(board, legal) is None
+
+
+def test_root_parallel_passes_when_only_own_eyes_are_left():
+    board = _board_with_only_eyes()
+    bot = MCTSBot(Player.BLACK, board_size=5, playouts=50, seed=1, parallel="root", workers=1)
+    assert bot.select_move(board, board.legal_moves(Player.BLACK)) is None
+
+
+def test_plays_a_move_when_one_is_available():
+    board = Board(5)
+    bot = MCTSBot(Player.BLACK, board_size=5, playouts=50, seed=1)
+    legal = board.legal_moves(Player.BLACK)
+    assert bot.select_move(board, legal) in legal
+
+
+def _opening(size=7, moves=((3, 3), (2, 4), (4, 2))):
+    board = Board(size)
+    player = Player.BLACK
+    for x, y in moves:
+        assert board.place_stone(player, x, y)[0]
+        player = player.opposite
+    return board, player
+
+
+def _check_visits(node):
+    """Không còn virtual loss: lượt thăm mỗi node >= tổng lượt thăm các con."""
+    assert node.wins <= node.visits
+    child_visits = sum(child.visits for child in node.children.values())
+    assert child_visits <= node.visits
+    for child in node.children.values():
+        _check_visits(child)
+
+
+def test_root_parallel_merges_all_playouts():
+    board, player = _opening()
+    legal = board.legal_moves(player)
+    results = []
+    for _ in range(2):
+        bot = MCTSBot(player, board_size=7, playouts=200, seed=3, parallel="root", workers=2)
+        stats, playouts = bot._search_root_parallel(ChainBoard.from_board(board), legal)
+        assert playouts == 200  # 2 worker x 100
+        assert sum(visits for visits, _ in stats.values()) == playouts
+        assert set(stats) <= set(legal)
+        results.append(stats)
+    # cùng seed -> cùng kết quả
+    assert results[0] == results[1]
+
+    bot = MCTSBot(player, board_size=7, playouts=200, seed=3, parallel="root", workers=2)
+    assert bot.select_move(board, legal) in legal
+    assert bot.last_playouts == 200
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_tree_parallel_visits_add_up(workers):
+    board, player = _opening()
+    legal = board.legal_moves(player)
+    bot = MCTSBot(player, board_size=7, playouts=300, seed=5, parallel="tree", workers=workers)
+    chain_board = ChainBoard.from_board(board)
+    root = bot._prepare_root(chain_board, legal)
+    playouts = bot._search_tree_parallel(root, chain_board, None)
+    assert playouts == 300
+    # mỗi playout đi qua gốc và đúng một nước con của gốc, virtual loss đã được trả lại
+    assert root.visits == playouts
+    assert sum(child.visits for child in root.children.values()) == playouts
+    _check_visits(root)
+
+    bot = MCTSBot(player, board_size=7, playouts=300, seed=5, parallel="tree", workers=workers)
+    assert bot.select_move(board, legal) in legal
+    assert bot.last_playouts == 300
+
+
+def test_tree_parallel_single_worker_is_deterministic():
+    board, player = _opening()
+    legal = board.legal_moves(player)
+    moves = {
+        MCTSBot(player, board_size=7, playouts=200, seed=9, parallel="tree", workers=1).select_move(board, legal)
+        for _ in range(2)
+    }
+    assert len(moves) == 1
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from core.board import Player
+from core.game import GameMode, GoGame
+from bots.minimax_bot import HeuristicMinimaxBot
+
+
+def _position(size: int, seed: int) -> GoGame:
+    rng = random.Random(seed)
+    game = GoGame(size, GameMode.HUMAN_VS_HUMAN)
+    for _ in range(rng.randrange(6, 20)):
+        game._apply_move(game.current_player, *rng.choice(game.get_legal_moves(game.current_player)))
+    return game
+
+
+def _root_result(bot: HeuristicMinimaxBot, game: GoGame, depth: int):
+    board = game.board.copy()
+    bot._attach_evaluator(board)
+    score, best = bot._search_depth(board, game.get_legal_moves(game.current_player), depth)
+    return score, sorted(best)
+
+
+@pytest.mark.parametrize("tt_mb", [16, None])
+@pytest.mark.parametrize("seed", range(4))
+def test_ordering_does_not_change_the_result(seed, tt_mb):
+    size = [7, 9][seed % 2]
+    game = _position(size, seed)
+    ordered = HeuristicMinimaxBot(game.current_player, size, tt_mb=tt_mb)
+    unordered = HeuristicMinimaxBot(game.current_player, size, tt_mb=tt_mb)
+    # không sắp xếp: giữ nguyên thứ tự tĩnh của bộ sinh nước
+    unordered._order_moves = lambda moves, player, ply, tt_move: moves
+    assert _root_result(ordered, game, 3) == _root_result(unordered, game, 3)
+
+
+def test_order_puts_tt_move_then_killers_then_history():
+    bot = HeuristicMinimaxBot(Player.BLACK)
+    moves = [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)]
+    bot._history[Player.BLACK.value] = {(4, 0): 9, (3, 0): 4}
+    bot._killers[1] = [(2, 0), (0, 0)]
+    ordered = bot._order_moves(moves, Player.BLACK, 1, (1, 0))
+    assert ordered == [(1, 0), (2, 0), (0, 0), (4, 0), (3, 0)]
+    # killer của ply khác và history của màu kia không ảnh hưởng
+    assert bot._order_moves(moves, Player.WHITE, 2, None) == moves
+
+
+def test_cutoffs_feed_killers_and_history():
+    bot = HeuristicMinimaxBot(Player.BLACK)
+    for move in [(1, 1), (2, 2), (3, 3), (2, 2)]:
+        bot._record_cutoff(Player.BLACK, 0, 2, move)
+    # tối đa 2 killer, nước mới nhất đứng đầu
+    assert bot._killers[0] == [(3, 3), (2, 2)]
+    assert bot._history[Player.BLACK.value][(2, 2)] == 8
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from core.board import Player
+from core.game import BOARD_BACKENDS, GameMode, GoGame
+from bots.minimax_bot import HeuristicMinimaxBot
+
+pytest.importorskip("numpy")
+from core import np_kernels  # noqa: E402
+
+
+def _random_game(backend: str, seed: int) -> GoGame:
+    rng = random.Random(seed)
+    size = [5, 9, 13, 19][seed % 4]
+    game = GoGame(size, GameMode.HUMAN_VS_HUMAN, board_backend=backend)
+    for _ in range(rng.randrange(0, size * size)):
+        legal = game.get_legal_moves(game.current_player)
+        if not legal:
+            break
+        game._apply_move(game.current_player, *rng.choice(legal))
+    return game
+
+
+@pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+@pytest.mark.parametrize("seed", range(6))
+def test_numpy_kernels_match_python(backend, seed):
+    bot = HeuristicMinimaxBot(Player.BLACK, incremental_eval=False)
+    game = _random_game(backend, seed)
+    arr = np_kernels.board_array(game.board)
+    territory = game._territory()
+    assert np_kernels.territory(arr) == (territory[Player.BLACK], territory[Player.WHITE])
+    for player in Player:
+        # giống hệt đến từng bit (float cộng theo cùng thứ tự)
+        assert repr(np_kernels.evaluate(arr, player.value)) == repr(bot._evaluate(game.board, player))
+
+
+def test_game_score_with_numpy_matches_python():
+    for seed in range(4):
+        game = _random_game("flat", seed)
+        fast = GoGame(game.size, GameMode.HUMAN_VS_HUMAN, board_backend="flat", use_numpy=True)
+        fast.board = game.board
+        assert fast._territory() == game._territory()
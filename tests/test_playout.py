@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from core.board import Board, Player
+from core.playout import PASS, PlayoutBoard
+
+
+@pytest.mark.parametrize("size", [5, 7, 9, 13])
+def test_random_playout_matches_board(size):
+    """Mọi nước playout chọn đều hợp lệ với Board (trừ tự lấp mắt); pass chỉ khi hết nước."""
+    width = size + 2
+    for seed in range(10):
+        rng = random.Random(seed)
+        board = Board(size)
+        playout = PlayoutBoard(size)
+        color, passes = Player.BLACK.value, 0
+        for _ in range(3 * size * size):
+            if passes >= 2:
+                break
+            player = Player(color)
+            allowed = {
+                (y + 1) * width + x + 1
+                for x, y in board.legal_moves(player)
+                if (x, y) != board.ko_point
+                and not all(board.get(nx, ny) == color for nx, ny in board._neighbors(x, y))
+            }
+            p = playout.random_move(color, rng)
+            if p == PASS:
+                assert not allowed
+                passes += 1
+            else:
+                assert p in allowed
+                passes = 0
+                board.play(player, p % width - 1, p // width - 1)
+                playout.play(p, color)
+            color = 3 - color
+        # bàn cuối ván giống nhau
+        for y in range(size):
+            for x in range(size):
+                assert playout.cells[(y + 1) * width + x + 1] == board.get(x, y)
+
+
+def test_from_board_copies_position():
+    rng = random.Random(0)
+    board = Board(9)
+    for _ in range(40):
+        board.play(rng.choice((Player.BLACK, Player.WHITE)), rng.randrange(9), rng.randrange(9))
+    playout = PlayoutBoard.from_board(board)
+    for y in range(9):
+        for x in range(9):
+            assert playout.cells[(y + 1) * 11 + x + 1] == board.get(x, y)
+
+
+
+def test_area_score_counts_stones_and_one_colour_empties():
+    rng = random.Random(2)
+    for size in (5, 9):
+        playout = PlayoutBoard(size)
+        playout.playout(Player.BLACK.value, rng)
+        width = size + 2
+        board = Board(size)
+        for y in range(size):
+            for x in range(size):
+                board.set(x, y, playout.cells[(y + 1) * width + x + 1])
+        expected = [0, 0, 0]
+        for y in range(size):
+            for x in range(size):
+                v = board.get(x, y)
+                if v == 0:
+                    colors = {board.get(nx, ny) for nx, ny in board._neighbors(x, y)} - {0}
+                    v = colors.pop() if len(colors) == 1 else 0
+                expected[v] += 1
+        assert playout.area_score()[1:] == expected[1:]
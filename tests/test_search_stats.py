@@ -0,0 +1,57 @@
+import json
+import random
+
+import pytest
+
+from core.board import Player
+from core.game import GameMode, GoGame
+from bots.minimax_bot import HeuristicMinimaxBot
+from bots.search_stats import SearchStats
+
+
+def test_derived_values():
+    stats = SearchStats(nodes=1000, depth=3, time=0.5)
+    assert stats.nodes_per_sec == 2000.0
+    assert stats.ebf == pytest.approx(10.0)
+    assert SearchStats().nodes_per_sec == 0.0 and SearchStats().ebf == 0.0
+    data = stats.as_dict()
+    assert data["nodes"] == 1000 and data["ebf"] == pytest.approx(10.0)
+
+
+def test_select_move_collects_stats_and_logs_them(tmp_path):
+    rng = random.Random(0)
+    game = GoGame(9, GameMode.HUMAN_VS_HUMAN)
+    for _ in range(10):
+        game._apply_move(game.current_player, *rng.choice(game.get_legal_moves(game.current_player)))
+    log = tmp_path / "stats.jsonl"
+    bot = HeuristicMinimaxBot(game.current_player, 9, depth=2, stats_log=str(log), seed=0)
+
+    legal = game.get_legal_moves(game.current_player)
+    move = bot.select_move(game.board.copy(), legal)
+    first = bot.last_stats
+    assert first.depth == 2
+    assert 0 < first.leaves < first.nodes
+    assert first.cutoffs > 0
+    assert first.time > 0 and first.nodes_per_sec > 0
+    assert first.movegen_time + first.eval_time <= first.time
+
+    # mỗi lượt một SearchStats mới; TT giữ lại giữa hai lượt -> lượt sau cắt từ TT
+    move = bot.select_move(game.board.copy(), legal)
+    stats = bot.last_stats
+    assert stats is not first
+    assert stats.tt_cutoffs > 0 and stats.nodes <= first.nodes
+
+    lines = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 2
+    assert lines[-1]["nodes"] == stats.nodes
+    assert lines[-1]["color"] == game.current_player.name
+    assert tuple(lines[-1]["move"]) == move
+
+
+def test_iterative_deepening_stats_cover_every_depth():
+    game = GoGame(7, GameMode.HUMAN_VS_HUMAN)
+    game._apply_move(Player.BLACK, 3, 3)
+    bot = HeuristicMinimaxBot(Player.WHITE, 7, max_time_ms=10_000, max_depth=3, seed=0)
+    bot.select_move(game.board.copy(), game.get_legal_moves(Player.WHITE))
+    assert bot.last_depth == 3 == bot.last_stats.depth
+    assert bot.last_stats.leaves > 0 and bot.last_stats.nodes > bot.last_stats.leaves
@@ -0,0 +1,135 @@
+import io
+import random
+
+import pytest
+
+from core import sgf
+from core.board import Player
+from core.game import GameMode, GoGame
+
+
+def _parse(text: str) -> sgf.SgfNode:
+    return next(sgf.parse_game_trees(io.StringIO(text)))
+
+
+def _tree(node):
+    """(nước đi, cây con) của cả cây, để so sánh hai ván."""
+    return [((child.x, child.y, child.color, child.is_pass), _tree(child)) for child in node.children]
+
+
+def _game_with_variations(seed: int) -> GoGame:
+    rng = random.Random(seed)
+    game = GoGame(9, GameMode.HUMAN_VS_HUMAN)
+    game.komi = 7.5
+    for _ in range(80):
+        r = rng.random()
+        if r < 0.1 and game.can_undo():
+            # lùi vài nước rồi đi nước khác -> thêm một biến
+            for _ in range(rng.randrange(1, 4)):
+                game.undo()
+        elif r < 0.13:
+            game.pass_turn()
+        legal = game.get_legal_moves(game.current_player)
+        if game.is_over or not legal:
+            break
+        game.play_move(game.current_player, rng.choice(legal))
+    return game
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_round_trip_keeps_variations(seed):
+    game = _game_with_variations(seed)
+    text = sgf.game_to_sgf(game)
+    loaded = sgf.game_from_sgf(_parse(text))
+    assert loaded.komi == game.komi
+    assert _tree(loaded.history.root) == _tree(game.history.root)
+    assert sgf.game_to_sgf(loaded) == text
+
+    # mỗi node đánh lại ra cùng hình cờ & số quân bắt
+    stack = [(game.history.root, loaded.history.root)]
+    while stack:
+        a, b = stack.pop()
+        game.go_to_node(a)
+        loaded.go_to_node(b)
+        assert loaded.board.hash == game.board.hash
+        assert loaded.captures == game.captures
+        assert loaded.current_player is game.current_player
+        stack.extend(zip(a.children, b.children))
+
+
+def test_setup_stones_and_consecutive_moves():
+    game = sgf.game_from_sgf(_parse("(;SZ[9]KM[0.5]AB[cc][gg]PL[W];W[ee];W[ef];B[dd])"))
+    assert game.komi == 0.5
+    assert game.board.get(2, 2) == Player.BLACK.value
+    assert game.board.get(4, 5) == Player.WHITE.value
+    assert game.current_player is Player.WHITE
+    game.undo()
+    # node trong history vẫn giữ bên đi gốc
+    assert game.current_player is Player.BLACK
+
+    # thế cờ đặt sẵn & bên đi trước ghi ra lại đúng như cũ
+    loaded = sgf.game_from_sgf(_parse(sgf.game_to_sgf(game)))
+    root_board = loaded.history.board_of(loaded.history.root)
+    assert root_board.hash == game.history.board_of(game.history.root).hash
+    assert loaded.history.root.current_player is Player.WHITE
+    assert loaded.board.hash == game.history.board_of(game.history.record(3)).hash
+    with pytest.raises(sgf.SgfError):
+        sgf.game_from_sgf(_parse("(;SZ[9]AB[cc]AW[cc])"))
+
+
+def test_captures_properties_are_optional_but_checked():
+    game = GoGame(9, GameMode.HUMAN_VS_HUMAN)
+    for x, y in [(1, 0), (0, 0), (0, 1)]:
+        assert game.play_human_move(x, y)
+    assert "CAPB" not in sgf.game_to_sgf(game)
+    text = sgf.game_to_sgf(game, write_captures=True)
+    assert "CAPB[1]" in text and "CAPW[0]" in text
+    assert sgf.game_from_sgf(_parse(text)).captures[Player.BLACK] == 1
+    with pytest.raises(sgf.SgfError):
+        sgf.game_from_sgf(_parse(text.replace("CAPB[1]", "CAPB[2]")))
+
+
+def test_illegal_move_raises():
+    with pytest.raises(sgf.SgfError):
+        sgf.game_from_sgf(_parse("(;SZ[9];B[aa];W[aa])"))
+    with pytest.raises(sgf.SgfError):
+        sgf.game_from_sgf(_parse("(;SZ[9];B[];W[];B[cc])"))
+
+
+@pytest.mark.parametrize("size", ["3", "4", "27", "52", "0", "x", "9:13"])
+def test_unsupported_board_sizes_raise(size):
+    with pytest.raises(sgf.SgfError):
+        sgf.game_from_sgf(_parse(f"(;SZ[{size}];B[aa])"))
+
+
+def test_largest_board_uses_every_letter():
+    game = sgf.game_from_sgf(_parse("(;SZ[26];B[zz];W[tt])"))
+    assert game.board.get(25, 25) == Player.BLACK.value
+    # bàn > 19: "tt" là một điểm, không phải pass
+    assert game.board.get(19, 19) == Player.WHITE.value
+
+
+@pytest.mark.parametrize("loser", [Player.BLACK, Player.WHITE])
+def test_resigned_game_round_trips(loser):
+    game = GoGame(9, GameMode.HUMAN_VS_HUMAN)
+    game.play_human_move(2, 2)
+    game.play_human_move(6, 6)
+    game.resign(loser)
+    text = sgf.game_to_sgf(game)
+    assert ("RE[W+R]" if loser is Player.BLACK else "RE[B+R]") in text
+
+    loaded = sgf.game_from_sgf(_parse(text))
+    assert loaded.is_over
+    assert loaded.winner is loser.opposite
+    assert loaded.current_index == 2
+    assert sgf.game_to_sgf(loaded) == text
+
+
+def test_play_move_keeps_side_to_move_when_illegal():
+    game = GoGame(9, GameMode.HUMAN_VS_BOT)
+    assert game.play_move(Player.WHITE, (4, 4))
+    assert game.current_player is Player.BLACK
+    assert not game.play_move(Player.WHITE, (4, 4))
+    assert game.current_player is Player.BLACK
+    assert game.play_move(Player.BLACK, None)
+    assert game.pass_streak == 1 and game.current_player is Player.WHITE
@@ -0,0 +1,111 @@
+import math
+import random
+
+import pytest
+
+from core.board import Board, Player
+from core.game import GameMode, GoGame
+from bots.minimax_bot import HeuristicMinimaxBot
+from bots.transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+
+def _same_bucket_keys(tt: TranspositionTable, count: int):
+    return [7 + i * (tt._mask + 1) for i in range(count)]
+
+
+def test_probe_counts_hits_and_misses():
+    tt = TranspositionTable(0.01)
+    assert tt.probe(123) is None
+    tt.store(123, 2, 1.5, EXACT, (0, 0))
+    assert tt.probe(123) == (123, 2, 1.5, EXACT, (0, 0))
+    assert tt.probe(456) is None
+    assert (tt.probes, tt.hits, tt.stores) == (3, 1, 1)
+    assert tt.hit_rate == pytest.approx(1 / 3)
+    tt.clear()
+    assert tt.probe(123) is None
+    assert tt.stats()["probes"] == 1 and tt.stats()["hits"] == 0
+
+
+def test_depth_preferred_and_always_replace_slots():
+    tt = TranspositionTable(0.01)
+    a, b, c, d = _same_bucket_keys(tt, 4)
+    tt.store(a, 3, 1.0, EXACT, None)
+    # nông hơn -> vào ô always-replace, không đẩy entry sâu ra
+    tt.store(b, 1, 2.0, LOWER, None)
+    assert tt.probe(a)[1] == 3 and tt.probe(b)[1] == 1
+    tt.store(c, 2, 3.0, UPPER, None)
+    assert tt.probe(b) is None
+    assert tt.probe(a) is not None and tt.probe(c) is not None
+    # sâu hơn -> thay ô depth-preferred
+    tt.store(d, 5, 4.0, EXACT, None)
+    assert tt.probe(a) is None
+    assert tt.probe(d)[1] == 5 and tt.probe(c)[1] == 2
+
+
+def test_same_key_is_kept_once():
+    tt = TranspositionTable(0.01)
+    a, b = _same_bucket_keys(tt, 2)
+    tt.store(a, 4, 1.0, EXACT, None)
+    tt.store(b, 1, 2.0, EXACT, None)
+    # cùng khoá b nhưng sâu hơn: lên ô depth-preferred, bản cũ ở ô kia bị xoá
+    tt.store(b, 6, 3.0, LOWER, (1, 1))
+    assert tt.probe(b) == (b, 6, 3.0, LOWER, (1, 1))
+    assert sum(1 for e in tt._entries if e is not None and e[0] == b) == 1
+    # cùng khoá luôn được ghi đè, kể cả khi nông hơn
+    tt.store(b, 2, 5.0, EXACT, None)
+    assert tt.probe(b)[1:3] == (2, 5.0)
+
+
+def test_key_depends_on_side_and_ko_point():
+    board = Board(9)
+    black = TranspositionTable.key(board, Player.BLACK)
+    assert black != TranspositionTable.key(board, Player.WHITE)
+    board.ko_point = (3, 3)
+    assert TranspositionTable.key(board, Player.BLACK) != black
+
+
+def _position(seed: int) -> GoGame:
+    rng = random.Random(seed)
+    game = GoGame(7, GameMode.HUMAN_VS_HUMAN)
+    for _ in range(10):
+        game._apply_move(game.current_player, *rng.choice(game.get_legal_moves(game.current_player)))
+    return game
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_bound_flags_match_the_search_window(seed):
+    game = _position(seed)
+    player = game.current_player
+    plain = HeuristicMinimaxBot(player, 7, tt_mb=None)
+    plain._root_depth = 2
+    plain._attach_evaluator(game.board)
+    value = plain._minimax(game.board, 2, True, player, -math.inf, math.inf)
+
+    key = TranspositionTable.key(game.board, player)
+    for alpha, beta, flag in (
+        (value + 1, value + 2, UPPER),   # không nước nào vượt alpha
+        (value - 2, value - 1, LOWER),   # cắt beta
+        (value - 1, value + 1, EXACT),
+    ):
+        bot = HeuristicMinimaxBot(player, 7)
+        bot._root_depth = 2
+        bot._attach_evaluator(game.board)
+        bound = bot._minimax(game.board, 2, True, player, alpha, beta)
+        _, depth, stored, stored_flag, _ = bot.tt.probe(key)
+        assert (depth, stored, stored_flag) == (2, bound, flag)
+        if flag == UPPER:
+            assert value <= bound <= alpha
+        elif flag == LOWER:
+            assert beta <= bound <= value
+        else:
+            assert bound == value
+
+
+def test_table_only_speeds_up_the_search():
+    game = _position(3)
+    legal = game.get_legal_moves(game.current_player)
+    with_tt = HeuristicMinimaxBot(game.current_player, 7, depth=3, seed=0)
+    without = HeuristicMinimaxBot(game.current_player, 7, depth=3, tt_mb=None, seed=0)
+    assert with_tt.select_move(game.board.copy(), legal) == without.select_move(game.board.copy(), legal)
+    assert with_tt.tt.hits > 0
+    assert with_tt.last_stats.nodes <= without.last_stats.nodes
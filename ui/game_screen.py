@@ -16,9 +16,12 @@ from config import (
     WHITE_STONE,
     STONE_OUTLINE,
     LAST_MOVE_HIGHLIGHT,
+    DEBUG_SEARCH_STATS,
+    SAVE_GAME_PATH,
 )
 from core.board import Player
 from core.game import GoGame, GameMode
+from core import sgf
 from ui.widgets import Button
 # from bots.random_bot import RandomBot
 
@@ -38,10 +41,12 @@ class GameScreen:
         mode: GameMode,
         board_style: str = "wood",  # "wood" | "stone"
         human_color: Player = Player.BLACK,
+        bot_time_ms: int | None = None,  # None = bot tìm theo độ sâu cố định
     ):
         self.app = app
-        # truyền human_color xuống GoGame
-        self.game = GoGame(board_size, mode, human_color=human_color)
+        # truyền human_color xuống GoGame; bot tính nước trên thread riêng
+        # để cửa sổ không bị treo ("not responding") khi bot suy nghĩ lâu
+        self.game = GoGame(board_size, mode, human_color=human_color, async_bot=True)
 
         if mode == GameMode.HUMAN_VS_BOT:
             # bot luôn chơi màu ngược lại với người
@@ -50,6 +55,8 @@ class GameScreen:
                 color=bot_color,
                 board_size=board_size,
                 # depth=3  # nếu muốn override lại
+                # giới hạn thời gian mỗi nước -> iterative deepening
+                max_time_ms=bot_time_ms,
             )
             self.game.set_bot(bot)
 
@@ -82,6 +89,12 @@ class GameScreen:
         # để detect lúc game vừa chuyển sang is_over
         self._prev_is_over: bool = self.game.is_over
 
+        # thời gian cho hiệu ứng "AI thinking..." ở panel
+        self._thinking_time: float = 0.0
+
+        # debug: hiện nodes/s của nước bot gần nhất ở panel (F3 bật/tắt)
+        self.show_search_stats: bool = DEBUG_SEARCH_STATS
+
         # kết quả cuối ván (điểm + winner)
         self.final_scores: tuple[float, float] | None = None  # (black, white)
         self.winner_text: str | None = None                   # vd: "Black wins by 2.5"
@@ -251,12 +264,28 @@ class GameScreen:
             if self.board_rect.collidepoint(event.pos):
                 self._handle_board_click(event.pos)
 
-        # phím tắt: P = Pass, R = Resign
+        # phím tắt: P = Pass, R = Resign, F3 = thống kê tìm kiếm (debug),
+        # mũi tên trái/phải = undo/redo, lên/xuống = biến trước/sau,
+        # Ctrl+S / Ctrl+O = lưu / mở ván (SGF)
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_p:
+            if event.mod & pygame.KMOD_CTRL and event.key == pygame.K_s:
+                self._on_save()
+            elif event.mod & pygame.KMOD_CTRL and event.key == pygame.K_o:
+                self._on_load()
+            elif event.key == pygame.K_p:
                 self._on_pass()
             elif event.key == pygame.K_r:
                 self._on_resign()
+            elif event.key == pygame.K_LEFT:
+                self._on_undo()
+            elif event.key == pygame.K_RIGHT:
+                self._on_redo()
+            elif event.key == pygame.K_UP:
+                self.game.go_to_sibling(-1)
+            elif event.key == pygame.K_DOWN:
+                self.game.go_to_sibling(1)
+            elif event.key == pygame.K_F3:
+                self.show_search_stats = not self.show_search_stats
 
         # Buttons
         self.undo_button.handle_event(event)
@@ -266,6 +295,17 @@ class GameScreen:
         self.back_button.handle_event(event)
 
     def update(self, dt: float):
+        # nhận nước đi của bot khi thread tìm kiếm đã xong
+        prev_last_move = self.game.last_move
+        if self.game.poll_bot_turn():
+            if self.game.last_move != prev_last_move and self.move_sound is not None:
+                self.move_sound.play()
+
+        if self.game.is_bot_thinking:
+            self._thinking_time += dt
+        else:
+            self._thinking_time = 0.0
+
         # cập nhật ô đang hover (toạ độ) để hiển thị bên panel
         mx, my = pygame.mouse.get_pos()
         if self.board_rect.collidepoint((mx, my)):
@@ -382,6 +422,37 @@ class GameScreen:
     def _on_back(self):
         self.app.change_screen("home")
 
+    def _on_save(self):
+        try:
+            sgf.save_sgf(self.game, SAVE_GAME_PATH)
+            print(f"[GameScreen] Đã lưu ván vào {SAVE_GAME_PATH}")
+        except OSError as e:
+            print(f"[GameScreen] Không thể lưu ván: {e}")
+
+    def _on_load(self):
+        """Nạp lại ván đã lưu vào ván hiện tại (giữ chế độ & bot; cùng cỡ bàn)."""
+        try:
+            root = next(sgf.iter_game_trees(SAVE_GAME_PATH), None)
+            if root is None:
+                raise sgf.SgfError("empty file")
+            sgf.game_from_sgf(root, game=self.game)
+            print(f"[GameScreen] Đã mở ván từ {SAVE_GAME_PATH}")
+        except (OSError, sgf.SgfError) as e:
+            print(f"[GameScreen] Không thể mở ván: {e}")
+            return
+
+        # ván vừa mở đang tới lượt bot -> cho bot đi luôn (như sau nước của người)
+        if (
+            self.game.mode == GameMode.HUMAN_VS_BOT
+            and not self.game.is_over
+            and not self.game.is_human_turn()
+        ):
+            self.game._play_bot_turn()
+
+    def close(self):
+        """Gọi khi rời màn hình: huỷ lượt bot đang tính và dừng thread."""
+        self.game.shutdown_bot()
+
     def _on_pass(self):
         """Người chơi hiện tại bỏ lượt (Pass)."""
         if self.game.is_over:
@@ -816,6 +887,16 @@ class GameScreen:
         flag_center = (self.side_rect.centerx, turn_title_rect.bottom + 28)
         self._draw_stone(surface, flag_center, flag_radius, current_player, alpha=255)
 
+        # "AI thinking..." bên cạnh quân lượt đi khi bot đang tính
+        if self.game.is_bot_thinking:
+            dots = "." * (int(self._thinking_time * 3) % 3 + 1)
+            think_surf = font_body.render(f"AI thinking{dots}", True, muted_text)
+            think_rect = think_surf.get_rect(
+                left=flag_center[0] + flag_radius + 16,
+                centery=flag_center[1],
+            )
+            surface.blit(think_surf, think_rect)
+
         y = flag_center[1] + flag_radius + 18
 
         # ---- Captures ----
@@ -878,6 +959,10 @@ class GameScreen:
             last_label = self._coord_label(lx, ly)
         else:
             last_label = "--"
+        # đang ở một trong nhiều biến -> hiện thứ tự biến
+        variation, variation_count = self.game.variation_position()
+        if variation_count > 1:
+            last_label += f"  ({variation}/{variation_count})"
 
         last_title_surf = font_body.render("Last move:", True, muted_text)
         last_value_surf = font_hover.render(last_label, True, main_text)
@@ -896,7 +981,20 @@ class GameScreen:
         )
         margin = 8  # khoảng cách tối thiểu giữa chữ và hàng nút
 
+        # Debug: nodes/s của lượt bot gần nhất, ngay dưới "Last move"
+        stats_surf = None
+        stats = getattr(self.game.bot, "last_stats", None)
+        if self.show_search_stats and stats is not None and stats.nodes:
+            stats_surf = self.app.font_small.render(
+                f"Search: {stats.nodes_per_sec / 1000:.1f}k nodes/s, "
+                f"d{stats.depth}, EBF {stats.ebf:.1f}",
+                True,
+                muted_text,
+            )
+
         last_row_bottom = max(last_title_rect.bottom, last_value_rect.bottom)
+        if stats_surf is not None:
+            last_row_bottom += 4 + stats_surf.get_height()
         if last_row_bottom > buttons_top - margin:
             dy = (buttons_top - margin) - last_row_bottom
             last_title_rect.y += dy
@@ -905,6 +1003,13 @@ class GameScreen:
         surface.blit(last_title_surf, last_title_rect)
         surface.blit(last_value_surf, last_value_rect)
 
+        if stats_surf is not None:
+            stats_rect = stats_surf.get_rect(
+                left=left,
+                top=max(last_title_rect.bottom, last_value_rect.bottom) + 4,
+            )
+            surface.blit(stats_surf, stats_rect)
+
         # (Nếu sau này cần thêm text dưới nữa thì cập nhật y)
         y = max(last_title_rect.bottom, last_value_rect.bottom) + 14
 
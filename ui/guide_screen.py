@@ -111,6 +111,12 @@ IN-GAME CONTROLS
 • Left-click near an intersection to place a stone.
 • UNDO button: step back one move (including bot moves).
 • REDO button: step forward one move if a future move exists in the history.
+• Playing a different move after UNDO starts a new variation; the old moves
+  are kept, and REDO follows the variation you played most recently.
+• LEFT / RIGHT arrows: undo / redo. UP / DOWN arrows: switch to the
+  previous / next variation of the current move.
+• CTRL+S / CTRL+O: save the game (with all variations) to an SGF file /
+  load it back (the board size must match).
 • BACK button: return to the home screen.
 """
 
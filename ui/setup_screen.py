@@ -26,12 +26,14 @@ class SetupScreen:
         self.selected_mode = GameMode.HUMAN_VS_HUMAN
         self.selected_board_style = "wood"      # "wood" | "stone"
         self.selected_color = Player.BLACK      # mặc định chơi Đen (khi vs AI)
+        self.selected_bot_time_ms: int | None = None  # None = độ sâu cố định
 
         # collections button
         self.size_buttons: list[OptionButton] = []
         self.mode_buttons: list[OptionButton] = []
         self.board_style_buttons: list[OptionButton] = []
         self.color_buttons: list[OptionButton] = []  # Play as Black/White
+        self.bot_time_buttons: list[OptionButton] = []  # thời gian suy nghĩ của AI
 
         self.play_button: Button | None = None
         self.back_button: Button | None = None
@@ -114,7 +116,7 @@ class SetupScreen:
 
     def _build_ui(self):
         # Panel chính ở giữa
-        panel_rect = pygame.Rect(0, 0, 900, 540)
+        panel_rect = pygame.Rect(0, 0, 900, 630)
         panel_rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
         self.panel_rect = panel_rect
 
@@ -138,6 +140,7 @@ class SetupScreen:
         style_gap_y = 40                   # khoảng cách giữa các cụm
         mode_gap_y = 40
         color_gap_y = 40
+        bot_time_gap_y = 40
 
         # Vì chỉ có 1 button size nên total_width = size_btn_w
         total_width = size_btn_w
@@ -254,6 +257,40 @@ class SetupScreen:
             btn.player_color = color
             self.color_buttons.append(btn)
 
+        # ====== AI TIME (giới hạn thời gian mỗi nước, chỉ khi vs AI) ======
+        bot_times = [
+            (None, "Fixed"),
+            (1000, "1 s"),
+            (3000, "3 s"),
+            (5000, "5 s"),
+        ]
+        time_btn_w, time_btn_h = 100, 48
+        time_spacing = 12
+        total_width_time = len(bot_times) * time_btn_w + (len(bot_times) - 1) * time_spacing
+        time_start_x = left_area_left + (left_area_width - total_width_time) // 2
+        time_y = color_y + color_btn_h + bot_time_gap_y
+
+        for idx, (time_ms, label) in enumerate(bot_times):
+            rect = (
+                time_start_x + idx * (time_btn_w + time_spacing),
+                time_y,
+                time_btn_w,
+                time_btn_h,
+            )
+
+            def make_callback_time(t=time_ms):
+                return lambda: self._select_bot_time(t)
+
+            btn = OptionButton(
+                rect=rect,
+                text=label,
+                font=self.app.font_body,
+                callback=self._with_click(make_callback_time()),
+                selected=(time_ms == self.selected_bot_time_ms),
+            )
+            btn.bot_time_ms = time_ms
+            self.bot_time_buttons.append(btn)
+
         # ====== PLAY & BACK ======
         self.back_button = Button(
             rect=(panel_rect.centerx - 130, panel_rect.bottom - 70, 120, 50),
@@ -295,6 +332,11 @@ class SetupScreen:
         for btn in self.color_buttons:
             btn.selected = getattr(btn, "player_color", None) == color
 
+    def _select_bot_time(self, time_ms: int | None):
+        self.selected_bot_time_ms = time_ms
+        for btn in self.bot_time_buttons:
+            btn.selected = getattr(btn, "bot_time_ms", None) == time_ms
+
     def _on_play(self):
         # Chỉ thực sự dùng human_color khi Mode = HUMAN_VS_BOT
         human_color = (
@@ -309,19 +351,20 @@ class SetupScreen:
             mode=self.selected_mode,
             board_style=self.selected_board_style,
             human_color=human_color,
+            bot_time_ms=self.selected_bot_time_ms,
         )
 
     # ============ EVENT / UPDATE / DRAW ============
 
     def handle_event(self, event: pygame.event.Event):
-        # chỉ cho color_buttons nhận event khi Mode = Player vs AI
+        # chỉ cho color_buttons / bot_time_buttons nhận event khi Mode = Player vs AI
         buttons = (
             self.size_buttons
             + self.mode_buttons
             + self.board_style_buttons
         )
         if self.selected_mode == GameMode.HUMAN_VS_BOT:
-            buttons += self.color_buttons
+            buttons += self.color_buttons + self.bot_time_buttons
 
         for btn in buttons:
             btn.handle_event(event)
@@ -340,7 +383,7 @@ class SetupScreen:
             + self.board_style_buttons
         )
         if self.selected_mode == GameMode.HUMAN_VS_BOT:
-            buttons += self.color_buttons
+            buttons += self.color_buttons + self.bot_time_buttons
 
         for btn in buttons:
             btn.update(dt)
@@ -515,6 +558,7 @@ class SetupScreen:
         style_row_y = self.board_style_buttons[0].rect.y - self.panel_rect.top
         mode_row_y = self.mode_buttons[0].rect.y - self.panel_rect.top
         color_row_y = self.color_buttons[0].rect.y - self.panel_rect.top
+        bot_time_row_y = self.bot_time_buttons[0].rect.y - self.panel_rect.top
 
         # labels 3D
         self._blit_label_3d_midbottom(
@@ -536,7 +580,7 @@ class SetupScreen:
             (left_center_x, mode_row_y - 12),
         )
 
-        # label "Play as" chỉ hiện khi Player vs AI
+        # label "Play as" / "AI Time" chỉ hiện khi Player vs AI
         if self.selected_mode == GameMode.HUMAN_VS_BOT:
             self._blit_label_3d_midbottom(
                 panel,
@@ -544,6 +588,12 @@ class SetupScreen:
                 self.app.font_body,
                 (left_center_x, color_row_y - 12),
             )
+            self._blit_label_3d_midbottom(
+                panel,
+                "AI Time",
+                self.app.font_body,
+                (left_center_x, bot_time_row_y - 12),
+            )
 
         # helper vẽ nút lên panel (đổi sang toạ độ local tạm thời)
         def draw_button_on_panel(btn: Button | OptionButton):
@@ -557,9 +607,9 @@ class SetupScreen:
         for btn in self.size_buttons + self.board_style_buttons + self.mode_buttons:
             draw_button_on_panel(btn)
 
-        # Nút chọn màu chỉ vẽ khi Player vs AI
+        # Nút chọn màu / thời gian AI chỉ vẽ khi Player vs AI
         if self.selected_mode == GameMode.HUMAN_VS_BOT:
-            for btn in self.color_buttons:
+            for btn in self.color_buttons + self.bot_time_buttons:
                 draw_button_on_panel(btn)
 
         # Play & Back